@@ -3,6 +3,7 @@
 API routes for the crawler application
 """
 
+import asyncio
 import logging
 from datetime import datetime
 from typing import List, Dict, Optional
@@ -15,6 +16,7 @@ from ..models.schemas import (
     BatchCareerPagesRequest, BatchCareerPagesResponse
 )
 from ..services.cache import clear_cache
+from ..utils.constants import HTML_PARSER
 from ..services.contact_extractor_service import ContactExtractorService
 from ..services.career_pages_service import CareerPagesService
 from ..services.job_extraction_service import JobExtractionService
@@ -24,6 +26,11 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Max sites detected at once by the batch career endpoint. Kept at 2 for the
+# 512 MB instance: each detection holds parsed pages in memory, and Scrapy
+# fallbacks are further serialized by scrapy_runner (one subprocess at a time)
+BATCH_CAREER_CONCURRENCY = 2
+
 # Initialize services
 contact_service = ContactExtractorService()
 career_pages_service = CareerPagesService()
@@ -102,9 +109,10 @@ async def detect_career_pages_scrapy_main(request: CareerPagesRequest):
                     "value": url_item
                 })
             
-            # Process the extracted data
+            # Process the extracted data off the event loop (CPU-bound) so other requests keep running
             from ..utils.contact_extractor import process_extracted_crawl_results
-            contact_info = process_extracted_crawl_results(extracted_data, request.url)
+            loop = asyncio.get_running_loop()
+            contact_info = await loop.run_in_executor(None, process_extracted_crawl_results, extracted_data, request.url)
             logger.info(f"✅ Contact info processed from Scrapy: {contact_info}")
         else:
             logger.info(f"⚠️ No contact info from Scrapy, using fallback")
@@ -191,17 +199,18 @@ async def detect_career_pages_scrapy_main(request: CareerPagesRequest):
         if company_title and not response_data.get('company_title'):
             response_data['company_title'] = company_title
         
-        # Add raw crawl data from main page
+        # Add raw crawl data from main page (multi-MB payload: opt out with include_raw_data=False)
         crawl_data = None
-        if main_page_result and main_page_result.get('success'):
+        if request.include_raw_data and main_page_result and main_page_result.get('success'):
             # Extract raw HTML content
             raw_html = main_page_result.get('html', '')
             
             # Extract text content from HTML
             raw_text = ""
+            soup = None
             try:
                 from bs4 import BeautifulSoup
-                soup = BeautifulSoup(raw_html, 'html.parser')
+                soup = BeautifulSoup(raw_html, HTML_PARSER)
                 raw_text = soup.get_text(separator=' ', strip=True)
             except Exception as e:
                 logger.warning(f"⚠️ Error extracting text content: {e}")
@@ -210,8 +219,10 @@ async def detect_career_pages_scrapy_main(request: CareerPagesRequest):
             # Extract metadata
             metadata = {}
             try:
-                from bs4 import BeautifulSoup
-                soup = BeautifulSoup(raw_html, 'html.parser')
+                # get_text() leaves the tree intact: reuse the parse from above
+                if soup is None:
+                    from bs4 import BeautifulSoup
+                    soup = BeautifulSoup(raw_html, HTML_PARSER)
                 
                 # Meta tags
                 meta_tags = {}
@@ -528,7 +539,7 @@ async def debug_job_extraction(request: JobDetailsRequest):
             }
         
         html_content = result.get('html', '')
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = BeautifulSoup(html_content, HTML_PARSER)
         
         # Test title extraction
         title_selectors = [
@@ -603,35 +614,33 @@ async def batch_detect_career_pages(request: BatchCareerPagesRequest):
         urls = request.urls
         logger.info(f"🚀 Batch career page detection for {len(urls)} URLs")
         
-        results = []
-        for url in urls:
-            try:
-                # Detect career pages for each URL
-                result = await career_pages_service.detect_career_pages(
-                    url=url,
-                    include_subdomain_search=request.include_subdomain_search,
-                    max_pages_to_scan=request.max_pages_to_scan,
-                    strict_filtering=request.strict_filtering,
-                    include_job_boards=request.include_job_boards,
-                    use_scrapy=request.use_scrapy
-                )
-                
-                results.append({
-                    'url': url,
-                    'result': result
-                })
-                
-                logger.info(f"✅ Completed career page detection for: {url}")
-                
-            except Exception as e:
-                logger.error(f"❌ Error detecting career pages for {url}: {e}")
-                results.append({
-                    'url': url,
-                    'result': {
+        # Detect career pages concurrently; gather keeps results in input order
+        semaphore = asyncio.Semaphore(BATCH_CAREER_CONCURRENCY)
+
+        async def _detect(url: str) -> Dict:
+            async with semaphore:
+                try:
+                    result = await career_pages_service.detect_career_pages(
+                        url=url,
+                        include_subdomain_search=request.include_subdomain_search,
+                        max_pages_to_scan=request.max_pages_to_scan,
+                        strict_filtering=request.strict_filtering,
+                        include_job_boards=request.include_job_boards,
+                        use_scrapy=request.use_scrapy
+                    )
+                    logger.info(f"✅ Completed career page detection for: {url}")
+                except Exception as e:
+                    logger.error(f"❌ Error detecting career pages for {url}: {e}")
+                    result = {
                         'success': False,
                         'error_message': str(e)
                     }
-                })
+                return {
+                    'url': url,
+                    'result': result
+                }
+
+        results = await asyncio.gather(*(_detect(url) for url in urls))
         
         return {
             'success': True,
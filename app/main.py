@@ -17,8 +17,16 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.responses import JSONResponse
 
+# Optional orjson: serialize every response in C instead of stdlib json.dumps
+try:
+    import orjson  # noqa: F401
+    from fastapi.responses import ORJSONResponse as DefaultResponseClass
+except ImportError:
+    DefaultResponseClass = JSONResponse
+
 from .api.routes import router
 from .api.debug_routes import router as debug_router
+from .services.crawler import close_shared_connector, close_shared_browser
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -81,6 +89,9 @@ async def lifespan(app: FastAPI):
     
     # Shutdown
     logger.info("🛑 Shutting down crawler-ai service...")
+    # Release pooled crawl connections and the shared browser
+    await close_shared_connector()
+    await close_shared_browser()
     # Force garbage collection
     gc.collect()
     log_memory_usage()
@@ -91,6 +102,7 @@ app = FastAPI(
     description="AI-powered web crawler for career pages and contact information (requests-only mode)",
     version="1.0.0",
     lifespan=lifespan,
+    default_response_class=DefaultResponseClass,
     # Enable Swagger UI for testing (even in production)
     docs_url="/docs",
     redoc_url="/redoc",
@@ -79,6 +79,8 @@ class CareerPagesRequest(BaseModel):
     strict_filtering: bool = True
     include_job_boards: bool = False
     use_scrapy: bool = True
+    # False skips crawl_data (full HTML, text and metadata of the main page)
+    include_raw_data: bool = True
     # Apify data fields (optional)
     Title: Optional[str] = None
     Phone: Optional[str] = None
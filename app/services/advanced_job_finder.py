@@ -15,6 +15,7 @@ from bs4 import BeautifulSoup
 from .crawler import crawl_single_url
 from .job_extraction_service import JobExtractionService
 from .job_analyzer import JobAnalyzer
+from ..utils.constants import HTML_PARSER
 
 logger = logging.getLogger(__name__)
 
@@ -125,7 +126,7 @@ class AdvancedJobFinder:
                 return []
             
             html_content = result.get('html', '')
-            soup = BeautifulSoup(html_content, 'html.parser')
+            soup = BeautifulSoup(html_content, HTML_PARSER)
             
             job_elements = self._find_job_elements(soup)
             jobs = []
@@ -254,7 +255,7 @@ class AdvancedJobFinder:
                 return None
             
             html_content = result.get('html', '')
-            soup = BeautifulSoup(html_content, 'html.parser')
+            soup = BeautifulSoup(html_content, HTML_PARSER)
             
             job = {
                 'title': '',
@@ -5,17 +5,177 @@ Enhanced with strict filtering and detailed analysis
 """
 
 import re
-from urllib.parse import urlparse
+from functools import lru_cache
+from urllib.parse import urljoin, urlparse
 from typing import List, Dict, Tuple
 from bs4 import BeautifulSoup
 from ..utils.constants import (
     CAREER_KEYWORDS_VI, JOB_BOARD_DOMAINS, CAREER_SELECTORS,
-    STRONG_NON_CAREER_INDICATORS, CAREER_EXACT_PATTERNS, REJECTED_NON_CAREER_PATHS
+    STRONG_NON_CAREER_INDICATORS, CAREER_EXACT_PATTERNS, REJECTED_NON_CAREER_PATHS,
+    HTML_PARSER
 )
 
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+DATE_PATTERNS = (
+    r'/\d{4}[/-]\d{1,2}[/-]\d{1,2}',  # YYYY/MM/DD or YYYY-MM-DD
+    r'/\d{4}/\d{1,2}',  # YYYY/MM
+    r'/\d{1,2}/\d{4}',  # MM/YYYY
+    r'/\d{4}',  # Just year
+)
+
+ID_PATTERNS = (
+    r'/[a-f0-9]{8,}',  # Long hex IDs
+    r'/\d{5,}',  # Long numeric IDs
+    r'/[a-z0-9]{10,}',  # Long alphanumeric IDs
+    r'/[a-f0-9]{4,}',  # Medium hex IDs
+)
+
+# Compiled once; the union answers "any pattern?" in one scan, the ordered list
+# is only walked to name the pattern for the rejection reason
+COMPILED_DATE_PATTERNS = tuple((pattern, re.compile(pattern)) for pattern in DATE_PATTERNS)
+COMPILED_ID_PATTERNS = tuple((pattern, re.compile(pattern)) for pattern in ID_PATTERNS)
+DATE_UNION = re.compile("|".join(DATE_PATTERNS))
+ID_UNION = re.compile("|".join(ID_PATTERNS))
+
+ID_PENALTY_RE = re.compile(r'/\d+|/[a-f0-9]{4,}')
+SPECIAL_CHARS_RE = re.compile(r'[%&$#@!]')
+SUSPICIOUS_PATH_RE = re.compile(r'/\d{4}|/[a-f0-9]{8,}|/\d{5,}')  # years, long hex / numeric IDs
+
+REJECTED_FILE_EXTENSIONS_IN_PATH = (
+    '.pdf', '.doc', '.docx', '.xls', '.xlsx', '.ppt', '.pptx',
+    '.jpg', '.jpeg', '.png', '.gif', '.mp4', '.avi', '.zip',
+    '.xml', '.json', '.txt', '.csv', '.html', '.htm'
+)
+
+NON_CAREER_PATHS = (
+    '/services/', '/service/', '/products/', '/product/',
+    '/solutions/', '/solution/', '/about/', '/contact/',
+    '/news/', '/blog/', '/article/', '/post/',
+    '/events/', '/event/', '/webinar/', '/conference/',
+    '/training/', '/certification/', '/workshop/',
+    '/case-study/', '/case-studies/', '/success-story/',
+    '/testimonial/', '/review/', '/whitepaper/',
+    '/ebook/', '/ebooks/', '/guide/', '/tutorial/',
+    '/documentation/', '/manual/', '/api/', '/sdk/',
+    '/framework/', '/library/', '/tool/', '/tools/',
+    '/platform/', '/system/', '/infrastructure/',
+    '/architecture/', '/deployment/', '/implementation/',
+    '/login/', '/register/', '/signup/', '/signin/',
+    '/account/', '/profile/', '/dashboard/', '/panel/',
+    '/admin/', '/control/', '/manage/', '/settings/',
+    '/cart/', '/checkout/', '/payment/', '/order/',
+    '/purchase/', '/buy/', '/shop/', '/store/',
+    '/marketplace/', '/pricing/', '/price/', '/cost/',
+    '/fee/', '/search/', '/filter/', '/sort/',
+    '/category/', '/tag/', '/author/', '/privacy/',
+    '/terms/', '/policy/', '/legal/', '/sitemap/',
+    '/rss/', '/feed/', '/subscribe/', '/newsletter/',
+    # Vietnamese specific
+    '/dich-vu/', '/san-pham/', '/giai-phap/', '/tin-tuc/',
+    '/bai-viet/', '/su-kien/', '/hoi-thao/', '/dao-tao/',
+    '/chung-chi/', '/giai-thuong/', '/thanh-cong/',
+    '/danh-gia/', '/nhan-xet/', '/cam-nhan/', '/chia-se/',
+    '/dang-nhap/', '/dang-ky/', '/tai-khoan/', '/quan-ly/',
+    '/cai-dat/', '/gio-hang/', '/thanh-toan/', '/dat-hang/',
+    '/mua-hang/', '/cua-hang/', '/trang-chu/', '/tim-kiem/',
+    '/danh-muc/', '/the/', '/tac-gia/', '/quyen-rieng-tu/',
+    '/dieu-khoan/', '/chinh-sach/', '/phap-ly/'
+)
+
+JOB_DETAIL_INDICATORS = (
+    '/job/', '/jobs/', '/position/', '/career/', '/opportunity/',
+    '/vacancy/', '/apply/', '/application/', '/tuyen-dung/',
+    '/viec-lam/', '/co-hoi/', '/ung-vien/', '/cong-viec/'
+)
+
+HIGH_PRIORITY_PATTERNS = (
+    '/tuyen-dung', '/tuyển-dụng', '/tuyendung',
+    '/career', '/careers', '/job', '/jobs',
+    '/recruitment', '/hiring', '/employment'
+)
+
+MEDIUM_PRIORITY_PATTERNS = (
+    '/viec-lam', '/việc-làm', '/vieclam',
+    '/co-hoi', '/cơ-hội', '/cohoi',
+    '/nhan-vien', '/nhân-viên', '/nhanvien',
+    '/ung-vien', '/ứng-viên', '/ungvien',
+    '/position', '/positions', '/opportunity',
+    '/vacancy', '/vacancies', '/apply'
+)
+
+NON_CAREER_SUBPAGES = (
+    '/careers/our-culture', '/careers/benefits', '/careers/recruitment-process',
+    '/careers/training-courses', '/careers/opening-positions', '/careers/career-your-benefits',
+    '/careers/team', '/careers/leadership', '/careers/company', '/careers/about',
+    '/careers/contact', '/careers/partnership', '/careers/investor'
+)
+
+def build_first_match_automaton(patterns) -> "ahocorasick.Automaton":
+    """Automaton mapping each pattern to its position in the list"""
+    automaton = ahocorasick.Automaton()
+    for idx, pattern in enumerate(patterns):
+        if pattern not in automaton:
+            automaton.add_word(pattern, idx)
+    automaton.make_automaton()
+    return automaton
+
+class FirstMatchSet:
+    """
+    Substring patterns tried in list order: first_in() returns the first
+    pattern (by list position) contained in any of the texts, or None
+    """
+
+    def __init__(self, patterns):
+        self.patterns = tuple(patterns)
+        self.automaton = build_first_match_automaton(self.patterns) if AHOCORASICK_AVAILABLE else None
+
+    def first_in(self, *texts: str):
+        if self.automaton is None:
+            return next((p for p in self.patterns if any(p in text for text in texts)), None)
+        best = None
+        for text in texts:
+            for _, idx in self.automaton.iter(text):
+                if best is None or idx < best:
+                    best = idx
+        return self.patterns[best] if best is not None else None
+
+    def hits_in(self, *texts: str) -> set:
+        """Every pattern contained in any of the texts"""
+        if self.automaton is None:
+            return {p for p in self.patterns if any(p in text for text in texts)}
+        return {self.patterns[idx] for text in texts for _, idx in self.automaton.iter(text)}
+
+# CAREER_EXACT_PATTERNS are single '/segment' prefixes, so "pattern in path" is the
+# same as some path segment starting with the pattern minus its slash
+CAREER_EXACT_PREFIXES = tuple(pattern[1:] for pattern in CAREER_EXACT_PATTERNS)
+
+def has_career_segment(path_segments: List[str]) -> bool:
+    """True if any path segment starts with a CAREER_EXACT_PATTERNS prefix"""
+    return any(segment.startswith(CAREER_EXACT_PREFIXES) for segment in path_segments)
+
+# One scan per URL instead of a Python `in` probe per pattern
+STRONG_NON_CAREER_MATCHER = FirstMatchSet(STRONG_NON_CAREER_INDICATORS)
+FILE_EXTENSION_MATCHER = FirstMatchSet(REJECTED_FILE_EXTENSIONS_IN_PATH)
+NON_CAREER_PATH_MATCHER = FirstMatchSet(NON_CAREER_PATHS)
+JOB_DETAIL_MATCHER = FirstMatchSet(JOB_DETAIL_INDICATORS)
+HIGH_PRIORITY_MATCHER = FirstMatchSet(HIGH_PRIORITY_PATTERNS)
+MEDIUM_PRIORITY_MATCHER = FirstMatchSet(MEDIUM_PRIORITY_PATTERNS)
+CAREER_EXACT_MATCHER = FirstMatchSet(CAREER_EXACT_PATTERNS)
+NON_CAREER_SUBPAGE_MATCHER = FirstMatchSet(NON_CAREER_SUBPAGES)
+CAREER_KEYWORD_MATCHER = FirstMatchSet(CAREER_KEYWORDS_VI)
+
+# ParseResult is immutable; analyze_url_structure, _is_homepage and is_job_board_url
+# see the same URLs, so each is parsed once
+_parse_url = lru_cache(maxsize=4096)(urlparse)
+
 def is_job_board_url(url: str) -> bool:
     """Check if URL is from a known job board platform"""
-    parsed = urlparse(url)
+    parsed = _parse_url(url)
     domain = parsed.netloc.lower()
     
     # Remove www. prefix for comparison
@@ -26,7 +186,7 @@ def is_job_board_url(url: str) -> bool:
 
 def analyze_url_structure(url: str) -> Dict[str, any]:
     """Detailed analysis of URL structure for career page detection"""
-    parsed = urlparse(url)
+    parsed = _parse_url(url)
     path_lower = parsed.path.lower() if parsed.path else ""
     query_lower = parsed.query.lower()
     fragment_lower = parsed.fragment.lower() if parsed.fragment else ""
@@ -35,13 +195,13 @@ def analyze_url_structure(url: str) -> Dict[str, any]:
     path_segments = [seg for seg in path_lower.strip('/').split('/') if seg]
     path_depth = len(path_segments)
     
-    # Query parameters analysis
+    # Query parameters analysis (split the already-lowercased query, no per-pair lower())
     query_params = {}
-    if parsed.query:
-        for param in parsed.query.split('&'):
-            if '=' in param:
-                key, value = param.split('=', 1)
-                query_params[key.lower()] = value.lower()
+    if query_lower:
+        for param in query_lower.split('&'):
+            key, sep, value = param.partition('=')
+            if sep:
+                query_params[key] = value
     
     return {
         'path': path_lower,
@@ -60,96 +220,43 @@ def check_early_rejection(url: str, url_analysis: Dict) -> Tuple[bool, str]:
     path_segments = url_analysis['path_segments']
     
     # 1. Strong non-career indicators (STRICT filtering)
-    for indicator in STRONG_NON_CAREER_INDICATORS:
-        if indicator in path_lower or indicator in query_lower:
-            return True, f"Contains non-career indicator: {indicator}"
+    indicator = STRONG_NON_CAREER_MATCHER.first_in(path_lower, query_lower)
+    if indicator is not None:
+        return True, f"Contains non-career indicator: {indicator}"
     
     # 2. Date patterns (likely news/blog posts)
-    date_patterns = [
-        r'/\d{4}[/-]\d{1,2}[/-]\d{1,2}',  # YYYY/MM/DD or YYYY-MM-DD
-        r'/\d{4}/\d{1,2}',  # YYYY/MM
-        r'/\d{1,2}/\d{4}',  # MM/YYYY
-        r'/\d{4}',  # Just year
-    ]
-    for pattern in date_patterns:
-        if re.search(pattern, path_lower):
-            return True, f"Contains date pattern: {pattern}"
+    if DATE_UNION.search(path_lower):
+        for pattern, rx in COMPILED_DATE_PATTERNS:
+            if rx.search(path_lower):
+                return True, f"Contains date pattern: {pattern}"
     
     # 3. Long IDs (likely specific content)
-    id_patterns = [
-        r'/[a-f0-9]{8,}',  # Long hex IDs
-        r'/\d{5,}',  # Long numeric IDs
-        r'/[a-z0-9]{10,}',  # Long alphanumeric IDs
-        r'/[a-f0-9]{4,}',  # Medium hex IDs
-    ]
-    for pattern in id_patterns:
-        if re.search(pattern, path_lower):
-            return True, f"Contains long ID pattern: {pattern}"
+    if ID_UNION.search(path_lower):
+        for pattern, rx in COMPILED_ID_PATTERNS:
+            if rx.search(path_lower):
+                return True, f"Contains long ID pattern: {pattern}"
     
     # 4. File extensions (likely documents/media)
-    file_extensions = ['.pdf', '.doc', '.docx', '.xls', '.xlsx', '.ppt', '.pptx', 
-                      '.jpg', '.jpeg', '.png', '.gif', '.mp4', '.avi', '.zip',
-                      '.xml', '.json', '.txt', '.csv', '.html', '.htm']
-    for ext in file_extensions:
-        if ext in path_lower:
-            return True, f"Contains file extension: {ext}"
+    ext = FILE_EXTENSION_MATCHER.first_in(path_lower)
+    if ext is not None:
+        return True, f"Contains file extension: {ext}"
     
     # 5. Very deep paths (unlikely to be main career pages)
     if url_analysis['path_depth'] > 2:  # Reduced from 3 to 2
         return True, f"Path too deep: {url_analysis['path_depth']} levels"
     
     # 6. Specific non-career path patterns
-    non_career_paths = [
-        '/services/', '/service/', '/products/', '/product/',
-        '/solutions/', '/solution/', '/about/', '/contact/',
-        '/news/', '/blog/', '/article/', '/post/',
-        '/events/', '/event/', '/webinar/', '/conference/',
-        '/training/', '/certification/', '/workshop/',
-        '/case-study/', '/case-studies/', '/success-story/',
-        '/testimonial/', '/review/', '/whitepaper/',
-        '/ebook/', '/ebooks/', '/guide/', '/tutorial/',
-        '/documentation/', '/manual/', '/api/', '/sdk/',
-        '/framework/', '/library/', '/tool/', '/tools/',
-        '/platform/', '/system/', '/infrastructure/',
-        '/architecture/', '/deployment/', '/implementation/',
-        '/login/', '/register/', '/signup/', '/signin/',
-        '/account/', '/profile/', '/dashboard/', '/panel/',
-        '/admin/', '/control/', '/manage/', '/settings/',
-        '/cart/', '/checkout/', '/payment/', '/order/',
-        '/purchase/', '/buy/', '/shop/', '/store/',
-        '/marketplace/', '/pricing/', '/price/', '/cost/',
-        '/fee/', '/search/', '/filter/', '/sort/',
-        '/category/', '/tag/', '/author/', '/privacy/',
-        '/terms/', '/policy/', '/legal/', '/sitemap/',
-        '/rss/', '/feed/', '/subscribe/', '/newsletter/',
-        # Vietnamese specific
-        '/dich-vu/', '/san-pham/', '/giai-phap/', '/tin-tuc/',
-        '/bai-viet/', '/su-kien/', '/hoi-thao/', '/dao-tao/',
-        '/chung-chi/', '/giai-thuong/', '/thanh-cong/',
-        '/danh-gia/', '/nhan-xet/', '/cam-nhan/', '/chia-se/',
-        '/dang-nhap/', '/dang-ky/', '/tai-khoan/', '/quan-ly/',
-        '/cai-dat/', '/gio-hang/', '/thanh-toan/', '/dat-hang/',
-        '/mua-hang/', '/cua-hang/', '/trang-chu/', '/tim-kiem/',
-        '/danh-muc/', '/the/', '/tac-gia/', '/quyen-rieng-tu/',
-        '/dieu-khoan/', '/chinh-sach/', '/phap-ly/'
-    ]
-    
-    for non_career_path in non_career_paths:
-        if non_career_path in path_lower:
-            return True, f"Contains non-career path: {non_career_path}"
+    non_career_path = NON_CAREER_PATH_MATCHER.first_in(path_lower)
+    if non_career_path is not None:
+        return True, f"Contains non-career path: {non_career_path}"
     
     # 7. Job detail pages (should not be considered as career listing pages)
     if url_analysis['path_depth'] > 1:
         # Check if it looks like a job detail page
-        job_detail_indicators = [
-            '/job/', '/jobs/', '/position/', '/career/', '/opportunity/',
-            '/vacancy/', '/apply/', '/application/', '/tuyen-dung/',
-            '/viec-lam/', '/co-hoi/', '/ung-vien/', '/cong-viec/'
-        ]
-        for indicator in job_detail_indicators:
-            if indicator in path_lower:
-                # If it's a job detail page, reject it
-                return True, f"Job detail page detected: {indicator}"
+        indicator = JOB_DETAIL_MATCHER.first_in(path_lower)
+        if indicator is not None:
+            # If it's a job detail page, reject it
+            return True, f"Job detail page detected: {indicator}"
     
     return False, "Passed all rejection checks"
 
@@ -163,66 +270,41 @@ def calculate_career_score(url: str, url_analysis: Dict) -> Tuple[int, Dict[str,
     score = 0
     score_breakdown = {}
     
+    # Non-career subpages under /careers never earn the pattern bonuses
+    is_non_career_subpage = NON_CAREER_SUBPAGE_MATCHER.first_in(path_lower) is not None
+    
     # HIGH PRIORITY indicators (+5 points each) - but exclude non-career subpages
-    high_priority_patterns = [
-        '/tuyen-dung', '/tuyển-dụng', '/tuyendung',
-        '/career', '/careers', '/job', '/jobs',
-        '/recruitment', '/hiring', '/employment'
-    ]
-    for pattern in high_priority_patterns:
-        if pattern in path_lower:
-            # Check if it's a non-career subpage
-            non_career_subpages = [
-                '/careers/our-culture', '/careers/benefits', '/careers/recruitment-process',
-                '/careers/training-courses', '/careers/opening-positions', '/careers/career-your-benefits',
-                '/careers/team', '/careers/leadership', '/careers/company', '/careers/about',
-                '/careers/contact', '/careers/partnership', '/careers/investor'
-            ]
-            if any(subpage in path_lower for subpage in non_career_subpages):
-                continue  # Skip non-career subpages
+    if not is_non_career_subpage:
+        pattern = HIGH_PRIORITY_MATCHER.first_in(path_lower)
+        if pattern is not None:  # Only count the first match
             score += 5
             score_breakdown[f'high_priority_{pattern}'] = 5
-            break  # Only count the first match
     
     # MEDIUM PRIORITY indicators (+3 points each)
-    medium_priority_patterns = [
-        '/viec-lam', '/việc-làm', '/vieclam',
-        '/co-hoi', '/cơ-hội', '/cohoi',
-        '/nhan-vien', '/nhân-viên', '/nhanvien',
-        '/ung-vien', '/ứng-viên', '/ungvien',
-        '/position', '/positions', '/opportunity',
-        '/vacancy', '/vacancies', '/apply'
-    ]
-    for pattern in medium_priority_patterns:
-        if pattern in path_lower:
-            score += 3
-            score_breakdown[f'medium_priority_{pattern}'] = 3
-            break
-    
-    # CAREER KEYWORDS (+2 points each, max 3)
-    career_keyword_count = 0
-    for keyword in CAREER_KEYWORDS_VI:
-        if keyword in path_lower or keyword in query_lower:
-            career_keyword_count += 1
-            if career_keyword_count <= 3:  # Limit to 3 keywords
+    pattern = MEDIUM_PRIORITY_MATCHER.first_in(path_lower)
+    if pattern is not None:
+        score += 3
+        score_breakdown[f'medium_priority_{pattern}'] = 3
+    
+    # CAREER KEYWORDS (+2 points each, max 3) - one automaton pass finds the hits,
+    # the list walk only keeps list order (and duplicates) for the first three
+    keyword_hits = CAREER_KEYWORD_MATCHER.hits_in(path_lower, query_lower)
+    if keyword_hits:
+        career_keyword_count = 0
+        for keyword in CAREER_KEYWORDS_VI:
+            if keyword in keyword_hits:
+                career_keyword_count += 1
                 score += 2
                 score_breakdown[f'career_keyword_{keyword}'] = 2
+                if career_keyword_count == 3:  # Limit to 3 keywords
+                    break
     
     # EXACT CAREER PATTERNS (+4 points each) - but exclude non-career subpages
-    for pattern in CAREER_EXACT_PATTERNS:
-        if pattern in path_lower:
-            # Check if it's a non-career subpage
-            non_career_subpages = [
-                '/careers/our-culture', '/careers/benefits', '/careers/recruitment-process',
-                '/careers/training-courses', '/careers/opening-positions', '/careers/career-your-benefits',
-                '/careers/team', '/careers/leadership', '/careers/company', '/careers/about',
-                '/careers/contact', '/careers/partnership', '/careers/investor'
-            ]
-            if any(subpage in path_lower for subpage in non_career_subpages):
-                continue  # Skip non-career subpages
+    if not is_non_career_subpage:
+        pattern = CAREER_EXACT_MATCHER.first_in(path_lower)
+        if pattern is not None:
             score += 4
             score_breakdown[f'exact_pattern_{pattern}'] = 4
-            break
     
     # QUERY PARAMETER ANALYSIS (+1 point each)
     career_query_params = ['job', 'career', 'position', 'hiring', 'recruitment', 'apply']
@@ -253,12 +335,12 @@ def calculate_career_score(url: str, url_analysis: Dict) -> Tuple[int, Dict[str,
         score_breakdown['penalty_deep_path'] = depth_penalty
     
     # Numbers/IDs penalty (-2 points)
-    if re.search(r'/\d+', path_lower) or re.search(r'/[a-f0-9]{4,}', path_lower):
+    if ID_PENALTY_RE.search(path_lower):
         penalties -= 2
         score_breakdown['penalty_contains_ids'] = -2
     
     # Special characters penalty (-1 point)
-    if re.search(r'[%&$#@!]', path_lower):
+    if SPECIAL_CHARS_RE.search(path_lower):
         penalties -= 1
         score_breakdown['penalty_special_chars'] = -1
     
@@ -272,7 +354,7 @@ def validate_career_page_content(url: str, html_content: str = None) -> Tuple[bo
         return True, "No content to validate"  # Skip validation if no content
     
     try:
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = BeautifulSoup(html_content, HTML_PARSER)
         
         # Check page title
         title = soup.find('title')
@@ -307,8 +389,7 @@ def validate_career_page_content(url: str, html_content: str = None) -> Tuple[bo
 
 def _is_homepage(url: str) -> bool:
     """Check if URL is homepage"""
-    from urllib.parse import urlparse
-    parsed = urlparse(url)
+    parsed = _parse_url(url)
     path = parsed.path.lower()
     
     # Check for homepage patterns
@@ -326,60 +407,45 @@ def filter_career_urls(career_urls: List[str], html_contents: Dict[str, str] = N
             
         # Step 1: URL Structure Analysis
         url_analysis = analyze_url_structure(url_found)
+        path_lower = url_analysis['path']
+        
+        # Step 2: Cheap acceptance gates first - most crawled URLs fail them, so they
+        # skip the rejection checks, scoring and HTML parsing below entirely
+        # Must have clear career path pattern
+        if not has_career_segment(url_analysis['path_segments']):
+            continue
+        
+        # Must not be too deep and must not contain suspicious patterns
+        if url_analysis['path_depth'] > 4 or SUSPICIOUS_PATH_RE.search(path_lower):
+            continue
         
-        # Step 2: Early Rejection Check
+        # Step 3: Early Rejection Check
         is_rejected, rejection_reason = check_early_rejection(url_found, url_analysis)
         if is_rejected:
             continue
         
-        # Step 3: Career Score Calculation
+        # Step 4: Career Score Calculation
         career_score, score_breakdown = calculate_career_score(url_found, url_analysis)
+        if career_score < 8:  # Higher score requirement to exclude homepage
+            continue
         
-        # Step 4: Content Validation (if HTML content available)
+        # Step 5: Content Validation (if HTML content available)
         html_content = html_contents.get(url_found) if html_contents else None
         content_valid, content_reason = validate_career_page_content(url_found, html_content)
-        
-        # Step 5: Final Decision Logic
-        is_accepted = False
-        acceptance_reason = ""
-        
-        # STRICT CRITERIA: Must meet multiple conditions
-        if career_score >= 8:  # Higher score requirement to exclude homepage
-            if content_valid or html_content is None:  # Content validation or no content to check
-                # Additional strict checks
-                path_lower = url_analysis['path']
-                
-                # Must have clear career path pattern
-                has_clear_career_pattern = any(pattern in path_lower for pattern in CAREER_EXACT_PATTERNS)
-                
-                # Must not be too deep
-                is_reasonable_depth = url_analysis['path_depth'] <= 4
-                
-                # Must not contain suspicious patterns
-                has_no_suspicious_patterns = not any([
-                    re.search(r'/\d{4}', path_lower),  # No years
-                    re.search(r'/[a-f0-9]{8,}', path_lower),  # No long hex IDs
-                    re.search(r'/\d{5,}', path_lower),  # No long numeric IDs
-                ])
-                
-                if has_clear_career_pattern and is_reasonable_depth and has_no_suspicious_patterns:
-                    is_accepted = True
-                    acceptance_reason = f"High score ({career_score}) with clear career pattern"
+        if not (content_valid or html_content is None):
+            continue
         
         # Record result with detailed analysis
-        result = {
+        filtered_results.append({
             'url': url_found,
-            'is_accepted': is_accepted,
+            'is_accepted': True,
             'career_score': career_score,
             'score_breakdown': score_breakdown,
             'url_analysis': url_analysis,
             'content_valid': content_valid,
             'content_reason': content_reason,
-            'acceptance_reason': acceptance_reason if is_accepted else f"Rejected: score={career_score}, content_valid={content_valid}"
-        }
-        
-        if is_accepted:
-            filtered_results.append(result)
+            'acceptance_reason': f"High score ({career_score}) with clear career pattern"
+        })
     
     # Sort by career score (highest first)
     filtered_results.sort(key=lambda x: x['career_score'], reverse=True)
@@ -389,7 +455,7 @@ def filter_career_urls(career_urls: List[str], html_contents: Dict[str, str] = N
 def extract_career_pages_from_job_board(html_content: str, base_url: str) -> List[str]:
     """Extract company career pages from job board listings"""
     career_pages = []
-    soup = BeautifulSoup(html_content, 'html.parser')
+    soup = BeautifulSoup(html_content, HTML_PARSER)
     
     # Common patterns for company links on job boards
     company_selectors = [
@@ -405,7 +471,6 @@ def extract_career_pages_from_job_board(html_content: str, base_url: str) -> Lis
             for element in elements:
                 href = element.get('href')
                 if href:
-                    from urllib.parse import urljoin
                     full_url = urljoin(base_url, href)
                     # Only add if it's not the same job board
                     if not is_job_board_url(full_url):
@@ -7,13 +7,14 @@ import logging
 import asyncio
 from typing import List, Dict, Optional, Set, Tuple
 from urllib.parse import urljoin, urlparse
-from datetime import datetime
 import re
+import time
 import os
 import json
 import socket
 
-from ..utils.constants import CAREER_KEYWORDS_VI, CAREER_SELECTORS, JOB_BOARD_DOMAINS
+from ..utils.constants import CAREER_KEYWORDS_VI, CAREER_SELECTORS, JOB_BOARD_DOMAINS, HTML_PARSER, LINK_HTML_PARSER, ANCHORS_WITH_HREF
+from ..utils.text import url_joiner
 from ..services.career_detector import filter_career_urls
 from .crawler import crawl_single_url
 from .scrapy_runner import run_spider
@@ -21,6 +22,12 @@ from bs4 import BeautifulSoup
 
 logger = logging.getLogger(__name__)
 
+# Generic path keywords with their boundary probes ('/dev', 'dev/', '-dev', 'dev-'), built once
+GENERIC_PATH_KEYWORD_PROBES = tuple(
+    (keyword, (f'/{keyword}', f'{keyword}/', f'-{keyword}', f'{keyword}-'))
+    for keyword in ('dev', 'software', 'tech', 'ml', 'ai', 'testing', 'it', 'digital')
+)
+
 class CareerPagesService:
     """Enhanced service for detecting career pages"""
     
@@ -86,7 +93,7 @@ class CareerPagesService:
     def _collect_hosts_from_html(self, html: str, base_url: str) -> Set[str]:
         """Extract all hostnames from HTML content"""
         hosts: Set[str] = set()
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = BeautifulSoup(html, HTML_PARSER)
         
         def _push(u: str):
             if not u:
@@ -135,7 +142,7 @@ class CareerPagesService:
         """
         Detect career pages with enhanced capabilities
         """
-        start_time = datetime.now()
+        start_time = time.perf_counter()
         
         try:
             logger.info(f"🔍 Starting career page detection for: {url}")
@@ -158,7 +165,7 @@ class CareerPagesService:
                     'success': False,
                     'error_message': 'Failed to crawl the website',
                     'requested_url': url,
-                    'crawl_time': (datetime.now() - start_time).total_seconds()
+                    'crawl_time': time.perf_counter() - start_time
                 }
             
                         # Step 2: Extract all URLs from the page
@@ -256,7 +263,7 @@ class CareerPagesService:
                 len(career_pages), len(potential_career_pages), len(all_urls)
             )
             
-            crawl_time = (datetime.now() - start_time).total_seconds()
+            crawl_time = time.perf_counter() - start_time
             
             return {
                 'success': True,
@@ -277,7 +284,7 @@ class CareerPagesService:
                 'success': False,
                 'error_message': str(e),
                 'requested_url': url,
-                'crawl_time': (datetime.now() - start_time).total_seconds()
+                'crawl_time': time.perf_counter() - start_time
             }
     
     def _is_xml_response(self, url: str, html_content: str = None) -> bool:
@@ -291,7 +298,6 @@ class CareerPagesService:
     async def _parse_sitemap(self, xml_text: str, base_url: str) -> List[str]:
         """Parse sitemap XML and extract job/career URLs"""
         try:
-            from bs4 import BeautifulSoup
             soup = BeautifulSoup(xml_text, "xml")
             
             # Extract all <loc> elements
@@ -376,13 +382,11 @@ class CareerPagesService:
                     analysis['confidence'] += 1.0  # Tăng từ 0.6 lên 1.0
             
             # 2. Generic keywords (MEDIUM WEIGHT) - Chỉ match từ riêng biệt, không match substring
-            generic_keywords = ['dev', 'software', 'tech', 'ml', 'ai', 'testing', 'it', 'digital']
-            path_segments = path.strip('/').split('/')
-            for keyword in generic_keywords:
+            # split path một lần, dùng chung cho generic keywords và path depth
+            path_segments = [seg for seg in path.split('/') if seg]
+            for keyword, probes in GENERIC_PATH_KEYWORD_PROBES:
                 # Chỉ match nếu keyword là một segment riêng biệt hoặc có dấu gạch ngang
-                if (f'/{keyword}' in path or f'{keyword}/' in path or 
-                    f'-{keyword}' in path or f'{keyword}-' in path or
-                    keyword in path_segments):
+                if any(probe in path for probe in probes) or keyword in path_segments:
                     career_indicators.append(f"Path contains '{keyword}'")
                     analysis['confidence'] += 0.3
             
@@ -413,7 +417,7 @@ class CareerPagesService:
                     analysis['confidence'] += 0.5
             
             # 6. Path depth - BONUS FOR SHALLOW PATHS
-            path_depth = len([p for p in path.split('/') if p])
+            path_depth = len(path_segments)
             if path_depth <= 2:
                 career_indicators.append("Shallow path depth")
                 analysis['confidence'] += 0.2  # Tăng từ 0.1 lên 0.2
@@ -708,7 +712,7 @@ class CareerPagesService:
         """
         Detect career pages using optimized Scrapy spider
         """
-        start_time = datetime.now()
+        start_time = time.perf_counter()
         
         try:
             logger.info(f"🚀 Running optimized Scrapy spider for: {url}")
@@ -733,7 +737,7 @@ class CareerPagesService:
                     'success': False,
                     'error_message': f'Invalid result format: {type(result)} - Expected dict, got {type(result)}',
                     'requested_url': url,
-                    'crawl_time': (datetime.now() - start_time).total_seconds(),
+                    'crawl_time': time.perf_counter() - start_time,
                     'crawl_method': 'scrapy_optimized'
                 }
             
@@ -742,7 +746,7 @@ class CareerPagesService:
                     'success': False,
                     'error_message': result.get('error_message', 'Scrapy spider failed'),
                     'requested_url': url,
-                    'crawl_time': (datetime.now() - start_time).total_seconds(),
+                    'crawl_time': time.perf_counter() - start_time,
                     'crawl_method': 'scrapy_optimized'
                 }
             
@@ -835,7 +839,7 @@ class CareerPagesService:
                 'total_urls_scanned': total_pages_crawled,
                 'valid_career_pages': len(career_pages),
                 'confidence_score': confidence_score,
-                'crawl_time': (datetime.now() - start_time).total_seconds(),
+                'crawl_time': time.perf_counter() - start_time,
                 'crawl_method': 'scrapy_optimized',
                 'job_urls': unique_job_urls,  # Include filtered job URLs
                 'total_jobs_found': len(unique_job_urls)
@@ -847,7 +851,7 @@ class CareerPagesService:
                 'success': False,
                 'error_message': str(e),
                 'requested_url': url,
-                'crawl_time': (datetime.now() - start_time).total_seconds(),
+                'crawl_time': time.perf_counter() - start_time,
                 'crawl_method': 'scrapy_optimized'
             }
 
@@ -862,7 +866,7 @@ class CareerPagesService:
         }
         
         try:
-            soup = BeautifulSoup(html_content, 'html.parser')
+            soup = BeautifulSoup(html_content, LINK_HTML_PARSER, parse_only=ANCHORS_WITH_HREF)
             
             # Vietnamese career keywords
             vietnamese_career_keywords = [
@@ -882,6 +886,7 @@ class CareerPagesService:
             
             # Find all links with career-related text
             career_links = []
+            join_url = url_joiner(base_url)
             for link in soup.find_all('a', href=True):
                 link_text = link.get_text().strip().lower()
                 href = link.get('href', '')
@@ -891,7 +896,7 @@ class CareerPagesService:
                     career_links.append({
                         'text': link.get_text().strip(),
                         'href': href,
-                        'full_url': urljoin(base_url, href)
+                        'full_url': join_url(href)
                     })
             
             # Find career pages from links
@@ -937,29 +942,26 @@ class CareerPagesService:
         3. Minimal fallback from config (NO hardcoding)
         """
         root_domain, netloc = self._safe_domain(base_url)
-        subdomains: List[str] = []
+        subdomains: Set[str] = set()
         
         logger.info(f"   🔍 Smart subdomain search for root domain: {root_domain}")
         
         # 1) Dynamic discovery (primary)
         discovered = await self._discover_subdomains_dynamically(base_url)
-        subdomains.extend(discovered)
+        subdomains.update(discovered)
         logger.info(f"   ✅ Dynamic discovery found: {len(discovered)} subdomains")
         
         # 2) DNS/CT enumeration (secondary) - placeholder for future
         # dns_found = await self._enumerate_subdomains_dns(root_domain)
-        # subdomains.extend(dns_found)
-        
-        # Dedup early
-        subdomains = sorted(set(subdomains))
+        # subdomains.update(dns_found)
         
         # 3) Always add essential career subdomains (ALWAYS TRY THESE)
         fallback = self._get_minimal_fallback_patterns(root_domain)
-        subdomains.extend(fallback)
+        subdomains.update(fallback)
         logger.info(f"   🔧 Always trying essential career subdomains: {len(fallback)} patterns")
         
-        # Final dedup
-        final_subdomains = sorted(set(subdomains))
+        # Deduped as collected: one sort at the end
+        final_subdomains = sorted(subdomains)
         logger.info(f"   🎯 Total unique subdomains found: {len(final_subdomains)}")
         
         return final_subdomains
@@ -1118,7 +1120,6 @@ class CareerPagesService:
             logger.info(f"🔄 Using requests-based fallback for: {url}")
             
             # Use existing requests-based logic
-            from .crawler import crawl_single_url
             result = await crawl_single_url(url)
             
             if not result['success']:
@@ -1131,8 +1132,7 @@ class CareerPagesService:
                 }
             
             # Extract links from HTML
-            from bs4 import BeautifulSoup
-            soup = BeautifulSoup(result['html'], 'html.parser')
+            soup = BeautifulSoup(result['html'], LINK_HTML_PARSER, parse_only=ANCHORS_WITH_HREF)
             
             # Find career-related links
             career_links = []
@@ -1145,7 +1145,6 @@ class CareerPagesService:
                 text = link.get_text().lower()
                 
                 if any(keyword in href or keyword in text for keyword in career_keywords):
-                    from urllib.parse import urljoin
                     full_url = urljoin(result['url'], href)
                     career_links.append(full_url)
             
@@ -1264,9 +1263,9 @@ class CareerPagesService:
             requests_contact = requests_result.get('contact_info', {})
             
             merged_contact = {
-                'emails': list(set(scrapy_contact.get('emails', []) + requests_contact.get('emails', []))),
-                'phones': list(set(scrapy_contact.get('phones', []) + requests_contact.get('phones', []))),
-                'contact_urls': list(set(scrapy_contact.get('contact_urls', []) + requests_contact.get('contact_urls', [])))
+                'emails': list(dict.fromkeys(scrapy_contact.get('emails', []) + requests_contact.get('emails', []))),
+                'phones': list(dict.fromkeys(scrapy_contact.get('phones', []) + requests_contact.get('phones', []))),
+                'contact_urls': list(dict.fromkeys(scrapy_contact.get('contact_urls', []) + requests_contact.get('contact_urls', [])))
             }
             
             # Calculate combined stats
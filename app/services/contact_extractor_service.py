@@ -8,50 +8,43 @@ import logging
 from typing import List, Dict, Optional
 from urllib.parse import urljoin, urlparse
 import asyncio
-from datetime import datetime
-
-# utils for phone extraction
-import re
-
-WS_CLASS = r"\s\u00A0\u2000-\u200B"            # space + NBSP + zero-width range
-SEP_CLASS = rf"[{WS_CLASS}\.\-\(\)]"          # cho phép . - ( ) và các khoảng trắng unicode
-SEP = rf"{SEP_CLASS}*"                        # 0+ ký tự phân tách
-
-def normalize_text(s: str) -> str:
-    # gom mọi loại khoảng trắng về 1 space
-    return re.sub(rf"[{WS_CLASS}]+", " ", s).strip()
-
-def clean_phone(candidate: str) -> str | None:
-    # giữ + và số
-    s = re.sub(r"[^\d+]", "", candidate)
-    if s.startswith("+84"):
-        s = "0" + s[3:]
-    s = re.sub(r"\D", "", s)
-    # VN: di động 10 số; cố định 10–11 số (tùy mã vùng)
-    return s if 10 <= len(s) <= 11 else None
+import time
 
 from ..utils.constants import CAREER_KEYWORDS_VI, CAREER_SELECTORS, JOB_BOARD_DOMAINS
 from ..utils.contact_extractor import process_extracted_crawl_results, to_text
-from ..utils.text import normalize_url as normalize_url_util
+from ..utils.text import (
+    normalize_url as normalize_url_util, normalize_text, clean_phone, clean_phones, find_phones, VN_PHONE_RX
+)
 from .crawler import crawl_single_url
 from bs4 import BeautifulSoup
 
 logger = logging.getLogger(__name__)
 
+# Compiled once at import; matched against whole pages for every crawl
+EMAIL_RXS = (
+    re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b', re.IGNORECASE),
+    re.compile(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}', re.IGNORECASE),
+)
+FOOTER_EMAIL_RX = EMAIL_RXS[1]
+
+# (pattern, replacement) fixing doubled domains like facebook.com/facebook.com/
+SOCIAL_DUPLICATE_DOMAIN_FIXES = (
+    (re.compile(r'(https?://)?(www\.)?facebook\.com/facebook\.com/'), 'https://www.facebook.com/'),
+    (re.compile(r'(https?://)?(www\.)?facebook\.com/facebook\.com'), 'https://www.facebook.com/'),
+    (re.compile(r'(https?://)?(www\.)?instagram\.com/instagram\.com/'), 'https://www.instagram.com/'),
+    (re.compile(r'(https?://)?(www\.)?instagram\.com/instagram\.com'), 'https://www.instagram.com/'),
+    (re.compile(r'(https?://)?(www\.)?linkedin\.com/linkedin\.com/'), 'https://www.linkedin.com/'),
+    (re.compile(r'(https?://)?(www\.)?linkedin\.com/linkedin\.com'), 'https://www.linkedin.com/'),
+)
+
 class ContactExtractorService:
     """Enhanced service for extracting contact information"""
     
     def __init__(self):
-        self.email_patterns = [
-            r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b',
-            r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}'
-        ]
+        self.email_patterns = EMAIL_RXS
         
         # Regex VN (không dùng capture, cho phép phân tách linh hoạt)
-        from ..utils.text import SEP
-        self.VN_PHONE_RX = re.compile(
-            rf"(?<!\d)(?:\+?84|0)(?:{SEP}\d){{8,10}}(?!\d)"
-        )
+        self.VN_PHONE_RX = VN_PHONE_RX
         
         self.social_patterns = {
             'facebook': r'facebook\.com/[^/\s]+',
@@ -68,7 +61,7 @@ class ContactExtractorService:
         """
         Extract comprehensive contact information from a website
         """
-        start_time = datetime.now()
+        start_time = time.perf_counter()
         
         try:
             logger.info(f"🔍 Starting contact extraction for: {url}")
@@ -81,7 +74,7 @@ class ContactExtractorService:
                     'success': False,
                     'error_message': 'Failed to crawl the website',
                     'requested_url': url,
-                    'crawl_time': (datetime.now() - start_time).total_seconds()
+                    'crawl_time': time.perf_counter() - start_time
                 }
             
             # Step 2: Extract basic contact data (prioritize footer)
@@ -90,8 +83,8 @@ class ContactExtractorService:
             # Step 2.5: PRIORITIZE FOOTER CONTACT INFO (sử dụng utils mới)
             logger.info(f"🔍 Prioritizing footer contact extraction...")
             try:
-                from ..utils.contact_footer import extract_footer_contacts_from_html
-                footer_contact_data = extract_footer_contacts_from_html(result.get('html', ''))
+                from ..utils.contact_footer import extract_footer_contacts_fast
+                footer_contact_data = extract_footer_contacts_fast(result.get('html', ''))
                 if footer_contact_data and (footer_contact_data.get('phones') or footer_contact_data.get('emails')):
                     logger.info(f"✅ Found footer contact info: {footer_contact_data}")
                     # Merge footer data with priority
@@ -126,16 +119,19 @@ class ContactExtractorService:
                 deep_contact_data = await self._deep_crawl_contact_info(url, result, max_depth)
                 contact_data = self._merge_contact_data(contact_data, deep_contact_data)
             
-            # Step 7: Process and classify contact data
-            classified_contacts = process_extracted_crawl_results(
-                raw_extracted_list=self._prepare_data_for_classifier(contact_data),
-                base_url=result.get('url', url)
+            # Step 7: Process and classify contact data (CPU-bound: run it off the event loop)
+            loop = asyncio.get_running_loop()
+            classified_contacts = await loop.run_in_executor(
+                None,
+                process_extracted_crawl_results,
+                self._prepare_data_for_classifier(contact_data),
+                result.get('url', url)
             )
             
             # Step 8: Calculate statistics
             stats = self._calculate_contact_stats(contact_data, result)
             
-            crawl_time = (datetime.now() - start_time).total_seconds()
+            crawl_time = time.perf_counter() - start_time
             
             return {
                 'success': True,
@@ -160,7 +156,7 @@ class ContactExtractorService:
                 'success': True,  # Vẫn success vì đã có data
                 'error_message': str(e),
                 'requested_url': url,
-                'crawl_time': (datetime.now() - start_time).total_seconds(),
+                'crawl_time': time.perf_counter() - start_time,
                 'crawl_method': (result.get('crawl_method') if 'result' in locals() else 'requests'),
                 'emails': list(dict.fromkeys(safe.get('emails', []))),
                 'phones': list(dict.fromkeys(safe.get('phones', []))),   # ✅ giữ số
@@ -213,35 +209,15 @@ class ContactExtractorService:
         """Extract phone numbers specifically from footer content"""
         soup = BeautifulSoup(html_content or "", "lxml")
         footer = self.pick_footer_node(soup)
-        text = normalize_text(footer.get_text(" ", strip=True))
         # tìm theo iterator để luôn lấy full match
-        cands = [m.group(0) for m in self.VN_PHONE_RX.finditer(text)]
-        out: list[str] = []
-        for c in cands:
-            n = clean_phone(c)
-            if n and n not in out:
-                out.append(n)
-        return out
+        return find_phones(footer.get_text(" ", strip=True))
 
     def _extract_emails_from_footer(self, html_content: str) -> List[str]:
         """Extract emails specifically from footer content"""
-        emails = []
-        
-        # Email pattern
-        email_pattern = r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}'
-        matches = re.findall(email_pattern, html_content, re.IGNORECASE)
-        emails.extend(matches)
-        
-        return list(set(emails))
+        return list(set(FOOTER_EMAIL_RX.findall(html_content)))
 
     def _extract_phones_from_text(self, text: str) -> list[str]:
-        text = normalize_text(text)
-        out = []
-        for m in self.VN_PHONE_RX.finditer(text):
-            n = clean_phone(m.group(0))
-            if n and n not in out:
-                out.append(n)
-        return out
+        return find_phones(text)
 
     def pick_footer_node(self, soup: BeautifulSoup):
         node = soup.select_one("footer, [role=contentinfo], #footer, .footer, .site-footer, .main-footer, .bottom-footer")
@@ -279,34 +255,23 @@ class ContactExtractorService:
         if html_content:
             for pattern in self.email_patterns:
                 try:
-                    emails = re.findall(pattern, html_content, re.IGNORECASE)
-                    contact_data['emails'].extend(emails)
+                    contact_data['emails'].extend(pattern.findall(html_content))
                 except Exception as e:
-                    logger.warning(f"Error extracting emails with pattern {pattern}: {e}")
+                    logger.warning(f"Error extracting emails with pattern {pattern.pattern}: {e}")
                     continue
         
         # Remove duplicates and normalize
-        contact_data['emails'] = list(set([email.lower() for email in contact_data['emails']]))
+        contact_data['emails'] = list({email.lower() for email in contact_data['emails']})
         
         return contact_data
     
     def _normalize_social_url(self, url: str) -> str:
         """Normalize social media URLs to fix duplicate domains"""
-        import re
-        
         url_lower = url.lower()
         
-        # Fix Facebook duplicate domains
-        url_lower = re.sub(r'(https?://)?(www\.)?facebook\.com/facebook\.com/', 'https://www.facebook.com/', url_lower)
-        url_lower = re.sub(r'(https?://)?(www\.)?facebook\.com/facebook\.com', 'https://www.facebook.com/', url_lower)
-        
-        # Fix Instagram duplicate domains
-        url_lower = re.sub(r'(https?://)?(www\.)?instagram\.com/instagram\.com/', 'https://www.instagram.com/', url_lower)
-        url_lower = re.sub(r'(https?://)?(www\.)?instagram\.com/instagram\.com', 'https://www.instagram.com/', url_lower)
-        
-        # Fix LinkedIn duplicate domains
-        url_lower = re.sub(r'(https?://)?(www\.)?linkedin\.com/linkedin\.com/', 'https://www.linkedin.com/', url_lower)
-        url_lower = re.sub(r'(https?://)?(www\.)?linkedin\.com/linkedin\.com', 'https://www.linkedin.com/', url_lower)
+        # Fix Facebook / Instagram / LinkedIn duplicate domains
+        for rx, replacement in SOCIAL_DUPLICATE_DOMAIN_FIXES:
+            url_lower = rx.sub(replacement, url_lower)
         
         # Ensure proper scheme
         if url_lower.startswith('facebook.com/'):
@@ -379,11 +344,7 @@ class ContactExtractorService:
         # phones += [m.group(0) for m in INTERNATIONAL_RX.finditer(text)]
 
         # 3) Clean & unique
-        out: list[str] = []
-        for p in phones:
-            n = clean_phone(p)
-            if n and n not in out:
-                out.append(n)
+        out = clean_phones(phones)
 
         out.sort(key=len)
         logger.info("📞 Found %d raw matches, cleaned to %d phones", len(phones), len(out))
@@ -503,7 +464,7 @@ class ContactExtractorService:
         """
         Extract contact information using optimized Scrapy spider
         """
-        start_time = datetime.now()
+        start_time = time.perf_counter()
         
         try:
             logger.info(f"🚀 Starting Scrapy contact extraction for: {url}")
@@ -531,6 +492,6 @@ class ContactExtractorService:
                 'success': False,
                 'requested_url': url,
                 'error_message': str(e),
-                'crawl_time': (datetime.now() - start_time).total_seconds(),
+                'crawl_time': time.perf_counter() - start_time,
                 'crawl_method': 'scrapy_optimized'
             }
\ No newline at end of file
@@ -1,6 +1,8 @@
 import logging
 from typing import List, Dict, Optional
 
+from ..utils.constants import HTML_PARSER
+
 
 logger = logging.getLogger(__name__)
 
@@ -22,7 +24,7 @@ class ContainerExtractor:
                 return []
 
             from bs4 import BeautifulSoup
-            soup = BeautifulSoup(html, 'html.parser')
+            soup = BeautifulSoup(html, HTML_PARSER)
 
             job_indicators = [
                 'apply now', 'apply', 'ứng tuyển', 'tuyển dụng',
@@ -8,8 +8,7 @@ import time
 import re
 import logging
 import random
-from typing import Dict, List
-from urllib.parse import urljoin
+from typing import Dict, List, Optional
 from bs4 import BeautifulSoup
 import aiohttp
 import asyncio
@@ -35,11 +34,26 @@ DEFAULT_HEADERS_NO_BROTLI = {
 
 from .cache import get_cached_result, cache_result
 from ..utils.constants import (
-    DEFAULT_TIMEOUT, DEFAULT_USER_AGENT, DEFAULT_HEADERS
+    DEFAULT_TIMEOUT, DEFAULT_USER_AGENT, DEFAULT_HEADERS, HTML_PARSER
 )
+from ..utils.text import url_joiner
 
 logger = logging.getLogger(__name__)
 
+# Email patterns compiled once per process, not per crawl: with and without word
+# boundaries. TLDs are letters only ([A-Z|a-z] also let a literal '|' glue the
+# next word onto the address, e.g. 'info@acme.com|Hotline')
+EMAIL_RXS = (
+    re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b', re.IGNORECASE),
+    re.compile(r'[a-zA-Z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}', re.IGNORECASE),
+)
+
+# Substrings that mark a regex hit as an asset name or URL fragment, not an email
+INVALID_EMAIL_MARKERS = (
+    'cropped-favicon', 'favicon', '.png', '.jpg', '.jpeg', '.gif',
+    'data:', 'javascript:', 'mailto:', 'tel:', 'http', 'https'
+)
+
 # Tối ưu timeout cho performance
 OPTIMIZED_TIMEOUT = 15000  # Giảm từ 30s xuống 15s
 PAGE_WAIT_TIMEOUT = 50  # Giảm từ 100ms xuống 50ms
@@ -100,6 +114,144 @@ def get_enhanced_headers(url: str):
         **DEFAULT_HEADERS
     }
 
+# Pooled connector shared by every crawl: keep-alive connections and DNS cache
+# survive across requests instead of being rebuilt per call. TLS is verified by
+# default; callers that crawl arbitrary sites pass ssl=False per request
+_shared_connector: Optional[aiohttp.TCPConnector] = None
+_shared_connector_loop: Optional[asyncio.AbstractEventLoop] = None
+
+def get_shared_connector() -> aiohttp.TCPConnector:
+    """Return the crawl connector for the running event loop, creating it on first use"""
+    global _shared_connector, _shared_connector_loop
+    loop = asyncio.get_running_loop()
+    if _shared_connector is None or _shared_connector.closed or _shared_connector_loop is not loop:
+        _shared_connector = aiohttp.TCPConnector()
+        _shared_connector_loop = loop
+    return _shared_connector
+
+def crawl_session() -> aiohttp.ClientSession:
+    """
+    Session for one crawl on the pooled connector: its own cookie jar keeps cookies
+    set by redirects or the HEAD probe for the follow-up GET, and is dropped with
+    the session, so nothing leaks between crawls. Use as `async with crawl_session()`
+    """
+    return aiohttp.ClientSession(connector=get_shared_connector(), connector_owner=False)
+
+async def close_shared_connector() -> None:
+    """Close the shared crawl connector (called on application shutdown)"""
+    global _shared_connector, _shared_connector_loop
+    if _shared_connector is not None and not _shared_connector.closed:
+        await _shared_connector.close()
+    _shared_connector = None
+    _shared_connector_loop = None
+
+# One headless Chromium per process: Playwright call sites open a page (own context,
+# no shared cookies) on it instead of launching a browser for every request.
+# A running Chromium holds ~150-250 MB RSS, close to half of the 512 MB instance,
+# so it is closed once no page has been open for SHARED_BROWSER_IDLE_SECONDS and
+# relaunched (~1-2 s) by the next caller
+SHARED_BROWSER_IDLE_SECONDS = 60
+_shared_playwright = None
+_shared_browser = None
+_shared_browser_loop: Optional[asyncio.AbstractEventLoop] = None
+_shared_browser_lock: Optional[asyncio.Lock] = None
+_shared_browser_idle_handle: Optional[asyncio.TimerHandle] = None
+_shared_browser_idle_task: Optional[asyncio.Task] = None
+
+async def _close_browser(playwright, browser) -> None:
+    """Close a browser and stop its Playwright driver, whichever of them exist"""
+    try:
+        if browser is not None and browser.is_connected():
+            await browser.close()
+    finally:
+        if playwright is not None:
+            await playwright.stop()
+
+def _arm_browser_idle_timer(loop: asyncio.AbstractEventLoop) -> None:
+    """(Re)start the idle countdown after which the shared browser is closed"""
+    global _shared_browser_idle_handle
+    if _shared_browser_idle_handle is not None:
+        _shared_browser_idle_handle.cancel()
+    _shared_browser_idle_handle = loop.call_later(SHARED_BROWSER_IDLE_SECONDS, _on_browser_idle, loop)
+
+def _on_browser_idle(loop: asyncio.AbstractEventLoop) -> None:
+    global _shared_browser_idle_task
+    _shared_browser_idle_task = loop.create_task(_close_idle_browser(loop))
+
+async def _close_idle_browser(loop: asyncio.AbstractEventLoop) -> None:
+    """Close the shared browser unless a page is still open (then wait another period)"""
+    global _shared_playwright, _shared_browser, _shared_browser_idle_handle
+    if loop is not _shared_browser_loop:
+        return  # browser was handed over to another loop meanwhile
+    async with _shared_browser_lock:
+        if _shared_browser is None:
+            return
+        if _shared_browser.is_connected() and _shared_browser.contexts:
+            _arm_browser_idle_timer(loop)
+            return
+        playwright, browser = _shared_playwright, _shared_browser
+        _shared_playwright = _shared_browser = _shared_browser_idle_handle = None
+        logger.info("🧹 Closing idle shared browser")
+        await _close_browser(playwright, browser)
+
+async def get_shared_browser():
+    """Return the Chromium browser for the running event loop, launching it on first use"""
+    from playwright.async_api import async_playwright  # ImportError -> caller's non-browser fallback
+    global _shared_playwright, _shared_browser, _shared_browser_loop, _shared_browser_lock, _shared_browser_idle_handle
+    loop = asyncio.get_running_loop()
+    if _shared_browser_loop is not loop:
+        # The old browser is bound to its own loop: close it there, not here
+        old_loop, old_playwright, old_browser = _shared_browser_loop, _shared_playwright, _shared_browser
+        if old_loop is not None and not old_loop.is_closed():
+            if _shared_browser_idle_handle is not None:
+                old_loop.call_soon_threadsafe(_shared_browser_idle_handle.cancel)
+            if old_playwright is not None or old_browser is not None:
+                asyncio.run_coroutine_threadsafe(_close_browser(old_playwright, old_browser), old_loop)
+        elif old_playwright is not None:
+            logger.warning("⚠️ Event loop of the previous shared browser is closed; it could not be shut down")
+        _shared_playwright = _shared_browser = _shared_browser_idle_handle = None
+        _shared_browser_lock = asyncio.Lock()
+        _shared_browser_loop = loop
+    async with _shared_browser_lock:
+        if _shared_browser is None or not _shared_browser.is_connected():
+            if _shared_playwright is None:
+                _shared_playwright = await async_playwright().start()
+            _shared_browser = await _shared_playwright.chromium.launch(
+                headless=True,
+                args=["--no-sandbox", "--disable-dev-shm-usage"]
+            )
+        _arm_browser_idle_timer(loop)
+    return _shared_browser
+
+async def close_shared_browser() -> None:
+    """Close the shared browser and stop Playwright (called on application shutdown)"""
+    global _shared_playwright, _shared_browser, _shared_browser_loop, _shared_browser_lock, _shared_browser_idle_handle
+    if _shared_browser_idle_handle is not None:
+        _shared_browser_idle_handle.cancel()
+    playwright, browser = _shared_playwright, _shared_browser
+    _shared_playwright = _shared_browser = _shared_browser_idle_handle = None
+    _shared_browser_loop = _shared_browser_lock = None
+    await _close_browser(playwright, browser)
+
+# Trần kích thước body: trang liên hệ/tuyển dụng hiếm khi vượt quá 4 MiB
+MAX_PAGE_BYTES = 4 * 1024 * 1024
+READ_CHUNK_BYTES = 64 * 1024
+
+async def read_capped_text(response: aiohttp.ClientResponse, limit: int = MAX_PAGE_BYTES) -> str:
+    """Stream the body in chunks, stop after `limit` bytes and decode it"""
+    buf = bytearray()
+    async for chunk in response.content.iter_chunked(READ_CHUNK_BYTES):
+        buf += chunk
+        if len(buf) >= limit:
+            logger.info(f"✂️ Body truncated at {limit} bytes: {response.url}")
+            del buf[limit:]
+            break
+    # Same default as response.text(): declared charset, else UTF-8
+    try:
+        return buf.decode(response.charset or 'utf-8', errors='replace')
+    except LookupError:
+        return buf.decode('utf-8', errors='replace')
+
 async def check_url_availability(url: str, session: aiohttp.ClientSession, timeout: aiohttp.ClientTimeout) -> Dict:
     """Check if URL is available using HEAD request first"""
     try:
@@ -133,9 +285,118 @@ async def check_url_availability(url: str, session: aiohttp.ClientSession, timeo
             'method': 'HEAD'
         }
 
+def parse_page_content(url: str, html_content: str) -> Dict:
+    """Extract emails, phones, title, description and links from fetched HTML (CPU-bound, no I/O)"""
+    # Extract emails using enhanced patterns
+    logger.info(f"🔍 Processing HTML content (length: {len(html_content)})")
+    all_emails = []
+    for email_rx in EMAIL_RXS:
+        all_emails.extend(email_rx.findall(html_content))
+    
+    # Clean and validate emails (dict keys: dedupe in first-seen order, no set/list round-trip)
+    valid_emails = {}
+    for email in all_emails:
+        email = email.strip().lower()
+        # Basic validation
+        if '@' in email and '.' in email.split('@')[1]:
+            # Skip common invalid patterns
+            if not any(invalid in email for invalid in INVALID_EMAIL_MARKERS):
+                valid_emails[email] = None
+    
+    # Extract phone numbers using regex
+    phone_patterns = [
+        r'\+84\s?\d{1,2}\s?\d{3}\s?\d{3}\s?\d{3}',
+        r'0\d{1,2}\s?\d{3}\s?\d{3}\s?\d{3}',
+        r'\d{10,11}',
+    ]
+    phones = {}
+    for pattern in phone_patterns:
+        phones.update(dict.fromkeys(re.findall(pattern, html_content)))
+    
+    # Extract title and description
+    title = ""
+    description = ""
+    soup = BeautifulSoup(html_content, HTML_PARSER)
+    
+    try:
+        # Get title
+        title_tag = soup.find('title')
+        if title_tag:
+            title = title_tag.get_text().strip()
+        
+        # Get description - ưu tiên meta description
+        meta_desc = soup.find('meta', attrs={'name': 'description'})
+        if meta_desc:
+            description = meta_desc.get('content', '').strip()
+        
+        # Nếu không có meta description, tìm trong content
+        if not description or len(description) < 50:
+            # Tìm trong các thẻ có class chứa từ khóa mô tả
+            desc_selectors = [
+                'p[class*="description"]', 'p[class*="about"]', 'p[class*="intro"]',
+                'div[class*="description"]', 'div[class*="about"]', 'div[class*="intro"]',
+                '.hero p', '.banner p', '.intro p', '.about p'
+            ]
+            
+            for selector in desc_selectors:
+                desc_elem = soup.select_one(selector)
+                if desc_elem:
+                    text = desc_elem.get_text().strip()
+                    if len(text) > len(description):
+                        description = text
+            
+            # Nếu vẫn chưa có, lấy đoạn văn đầu tiên dài nhất
+            if not description or len(description) < 50:
+                paragraphs = soup.find_all('p')
+                for p in paragraphs:
+                    text = p.get_text().strip()
+                    if len(text) > 100 and len(text) > len(description):
+                        description = text
+                
+                # Nếu vẫn chưa đủ dài, ghép nhiều đoạn văn lại
+                if len(description) < 200:
+                    all_paragraphs = soup.find_all('p')
+                    combined_text = ""
+                    for p in all_paragraphs[:5]:  # Lấy 5 đoạn đầu
+                        text = p.get_text().strip()
+                        if len(text) > 50:  # Chỉ lấy đoạn có ý nghĩa
+                            if combined_text:
+                                combined_text += " " + text
+                            else:
+                                combined_text = text
+                            if len(combined_text) > 300:  # Đủ dài rồi thì dừng
+                                break
+                    
+                    if len(combined_text) > len(description):
+                        description = combined_text
+    except Exception as e:
+        logger.warning(f"⚠️ Error extracting title/description: {e}")
+
+    # Extract all URLs (tối ưu - chỉ lấy 50 URLs đầu để giảm memory)
+    urls = {}
+    join_url = url_joiner(url)
+    for a_tag in soup.find_all('a', href=True, limit=50):  # Reduced to 50 for memory; stop the search there
+        href = a_tag.get('href')
+        if href:
+            # Filter non-HTTP URLs
+            if href.startswith(('mailto:', 'tel:', 'skype:', 'javascript:', 'data:')):
+                logger.debug(f"⚠️ Skip non-HTTP URL: {href}")
+                continue
+            
+            full_url = join_url(href)
+            urls[full_url] = None
+    
+    return {
+        "title": title,
+        "description": description,
+        "emails": list(valid_emails),
+        "phones": list(phones),
+        "urls": list(urls),
+    }
+
 async def extract_with_requests(url: str) -> Dict:
     """Primary method using aiohttp with enhanced filtering and anti-bot headers"""
-    start_time = time.time()
+    start_time = time.perf_counter()
     
     try:
         # Skip non-HTTP URLs early (mailto:, tel:, javascript:, data:, anchors)
@@ -159,30 +420,24 @@ async def extract_with_requests(url: str) -> Dict:
         response = None
         last_error = None
         
-        for attempt in range(max_retries):
-            try:
-                # Get fresh headers for each attempt
-                headers = get_enhanced_headers(url)
-                
-                # Always disable brotli to avoid decode errors
-                headers['Accept-Encoding'] = 'gzip, deflate'
-                
-                # Create SSL context that ignores certificate verification
-                import ssl
-                ssl_context = ssl.create_default_context()
-                ssl_context.check_hostname = False
-                ssl_context.verify_mode = ssl.CERT_NONE
-                
-                connector = aiohttp.TCPConnector(ssl=ssl_context)
-                
-                # Improved timeout configuration
-                timeout = aiohttp.ClientTimeout(
-                    total=20,  # Total timeout
-                    connect=10,  # Connection timeout
-                    sock_read=10  # Socket read timeout
-                )
-                
-                async with aiohttp.ClientSession(connector=connector) as session:
+        # One session (own cookie jar) per crawl: cookies from redirects, the HEAD
+        # probe and earlier attempts carry over to the GET, then are dropped
+        async with crawl_session() as session:
+            for attempt in range(max_retries):
+                try:
+                    # Get fresh headers for each attempt
+                    headers = get_enhanced_headers(url)
+                    
+                    # Always disable brotli to avoid decode errors
+                    headers['Accept-Encoding'] = 'gzip, deflate'
+                    
+                    # Improved timeout configuration
+                    timeout = aiohttp.ClientTimeout(
+                        total=20,  # Total timeout
+                        connect=10,  # Connection timeout
+                        sock_read=10  # Socket read timeout
+                    )
+                    
                     # Check availability with HEAD request first (optional optimization)
                     if attempt == 0:  # Only on first attempt
                         availability = await check_url_availability(url, session, timeout)
@@ -233,186 +488,76 @@ async def extract_with_requests(url: str) -> Dict:
                                 raise Exception(last_error)
                         
                         response.raise_for_status()
-                        html_content = await response.text()
+                        html_content = await read_capped_text(response)
                         break  # Thành công, thoát loop
                         
-            except aiohttp.ClientResponseError as e:
-                last_error = f"HTTP {e.status} - {e.message}"
-                if e.status in [403, 429, 503] and attempt < max_retries - 1:
-                    logger.warning(f"⚠️ {last_error} for {url}, retrying... (attempt {attempt + 1}/{max_retries})")
-                    # Add jitter for 403 errors
-                    if e.status == 403:
-                        jitter = random.uniform(0.5, 1.5)
-                        await asyncio.sleep(jitter + (2 ** attempt))
+                except aiohttp.ClientResponseError as e:
+                    last_error = f"HTTP {e.status} - {e.message}"
+                    if e.status in [403, 429, 503] and attempt < max_retries - 1:
+                        logger.warning(f"⚠️ {last_error} for {url}, retrying... (attempt {attempt + 1}/{max_retries})")
+                        # Add jitter for 403 errors
+                        if e.status == 403:
+                            jitter = random.uniform(0.5, 1.5)
+                            await asyncio.sleep(jitter + (2 ** attempt))
+                        else:
+                            await asyncio.sleep(2 ** attempt)
+                        continue
+                    else:
+                        raise e
+                except aiohttp.http_exceptions.ContentEncodingError as e:
+                    last_error = f"Content encoding error: {str(e)}"
+                    logger.warning(f"⚠️ {last_error} for {url}")
+                    if attempt < max_retries - 1:
+                        # Retry with explicit no-brotli headers
+                        logger.info(f"🔄 Retrying {url} with gzip/deflate only...")
+                        headers = DEFAULT_HEADERS_NO_BROTLI.copy()
+                        headers['Referer'] = url
+                        continue
                     else:
+                        raise e
+                except asyncio.TimeoutError:
+                    last_error = "Connection timeout"
+                    if attempt < max_retries - 1:
+                        logger.warning(f"⚠️ {last_error} for {url}, retrying... (attempt {attempt + 1}/{max_retries})")
+                        await asyncio.sleep(2 ** attempt)  # Exponential backoff
+                        continue
+                    else:
+                        raise Exception(f"{last_error} after {max_retries} attempts")
+                except aiohttp.ClientConnectorError as e:
+                    last_error = f"Connection error: {str(e)}"
+                    if "Name or service not known" in str(e):
+                        last_error = "DNS resolution failed - domain may not exist"
+                    elif "Connection refused" in str(e):
+                        last_error = "Connection refused - server may be down"
+                    elif "Network is unreachable" in str(e):
+                        last_error = "Network unreachable"
+                    
+                    if attempt < max_retries - 1:
+                        logger.warning(f"⚠️ {last_error} for {url}, retrying... (attempt {attempt + 1}/{max_retries})")
                         await asyncio.sleep(2 ** attempt)
-                    continue
-                else:
-                    raise e
-            except aiohttp.http_exceptions.ContentEncodingError as e:
-                last_error = f"Content encoding error: {str(e)}"
-                logger.warning(f"⚠️ {last_error} for {url}")
-                if attempt < max_retries - 1:
-                    # Retry with explicit no-brotli headers
-                    logger.info(f"🔄 Retrying {url} with gzip/deflate only...")
-                    headers = DEFAULT_HEADERS_NO_BROTLI.copy()
-                    headers['Referer'] = url
-                    continue
-                else:
-                    raise e
-            except asyncio.TimeoutError:
-                last_error = "Connection timeout"
-                if attempt < max_retries - 1:
-                    logger.warning(f"⚠️ {last_error} for {url}, retrying... (attempt {attempt + 1}/{max_retries})")
-                    await asyncio.sleep(2 ** attempt)  # Exponential backoff
-                    continue
-                else:
-                    raise Exception(f"{last_error} after {max_retries} attempts")
-            except aiohttp.ClientConnectorError as e:
-                last_error = f"Connection error: {str(e)}"
-                if "Name or service not known" in str(e):
-                    last_error = "DNS resolution failed - domain may not exist"
-                elif "Connection refused" in str(e):
-                    last_error = "Connection refused - server may be down"
-                elif "Network is unreachable" in str(e):
-                    last_error = "Network unreachable"
-                
-                if attempt < max_retries - 1:
-                    logger.warning(f"⚠️ {last_error} for {url}, retrying... (attempt {attempt + 1}/{max_retries})")
-                    await asyncio.sleep(2 ** attempt)
-                    continue
-                else:
-                    raise Exception(last_error)
-        
+                        continue
+                    else:
+                        raise Exception(last_error)
+            
         if html_content is None:
             raise Exception(f"Failed to get HTML content after {max_retries} attempts. Last error: {last_error}")
         
-        # Extract emails using enhanced patterns
-        logger.info(f"🔍 Processing HTML content (length: {len(html_content)})")
-        email_patterns = [
-            r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b',
-            r'[a-zA-Z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}'
-        ]
-        
-        all_emails = []
-        for pattern in email_patterns:
-            emails = re.findall(pattern, html_content, re.IGNORECASE)
-            all_emails.extend(emails)
-        
-        # Clean and validate emails
-        valid_emails = []
-        for email in all_emails:
-            email = email.strip().lower()
-            # Basic validation
-            if '@' in email and '.' in email.split('@')[1]:
-                # Skip common invalid patterns
-                if not any(invalid in email for invalid in [
-                    'cropped-favicon', 'favicon', '.png', '.jpg', '.jpeg', '.gif',
-                    'data:', 'javascript:', 'mailto:', 'tel:', 'http', 'https'
-                ]):
-                    valid_emails.append(email)
-        
-        # Remove duplicates
-        valid_emails = list(set(valid_emails))
-        
-        # Extract phone numbers using regex
-        phone_patterns = [
-            r'\+84\s?\d{1,2}\s?\d{3}\s?\d{3}\s?\d{3}',
-            r'0\d{1,2}\s?\d{3}\s?\d{3}\s?\d{3}',
-            r'\d{10,11}',
-        ]
-        phones = []
-        for pattern in phone_patterns:
-            found_phones = re.findall(pattern, html_content)
-            phones.extend(found_phones)
-        
-        # Extract title and description
-        title = ""
-        description = ""
-        soup = BeautifulSoup(html_content, 'html.parser')
-        
-        try:
-            # Get title
-            title_tag = soup.find('title')
-            if title_tag:
-                title = title_tag.get_text().strip()
-            
-            # Get description - ưu tiên meta description
-            meta_desc = soup.find('meta', attrs={'name': 'description'})
-            if meta_desc:
-                description = meta_desc.get('content', '').strip()
-            
-            # Nếu không có meta description, tìm trong content
-            if not description or len(description) < 50:
-                # Tìm trong các thẻ có class chứa từ khóa mô tả
-                desc_selectors = [
-                    'p[class*="description"]', 'p[class*="about"]', 'p[class*="intro"]',
-                    'div[class*="description"]', 'div[class*="about"]', 'div[class*="intro"]',
-                    '.hero p', '.banner p', '.intro p', '.about p'
-                ]
-                
-                for selector in desc_selectors:
-                    desc_elem = soup.select_one(selector)
-                    if desc_elem:
-                        text = desc_elem.get_text().strip()
-                        if len(text) > len(description):
-                            description = text
-                
-                # Nếu vẫn chưa có, lấy đoạn văn đầu tiên dài nhất
-                if not description or len(description) < 50:
-                    paragraphs = soup.find_all('p')
-                    for p in paragraphs:
-                        text = p.get_text().strip()
-                        if len(text) > 100 and len(text) > len(description):
-                            description = text
-                    
-                    # Nếu vẫn chưa đủ dài, ghép nhiều đoạn văn lại
-                    if len(description) < 200:
-                        all_paragraphs = soup.find_all('p')
-                        combined_text = ""
-                        for p in all_paragraphs[:5]:  # Lấy 5 đoạn đầu
-                            text = p.get_text().strip()
-                            if len(text) > 50:  # Chỉ lấy đoạn có ý nghĩa
-                                if combined_text:
-                                    combined_text += " " + text
-                                else:
-                                    combined_text = text
-                                if len(combined_text) > 300:  # Đủ dài rồi thì dừng
-                                    break
-                        
-                        if len(combined_text) > len(description):
-                            description = combined_text
-        except Exception as e:
-            logger.warning(f"⚠️ Error extracting title/description: {e}")
-
-        # Extract all URLs (tối ưu - chỉ lấy 50 URLs đầu để giảm memory)
-        urls = []
-        for a_tag in soup.find_all('a', href=True)[:50]:  # Reduced to 50 for memory
-            href = a_tag.get('href')
-            if href:
-                # Filter non-HTTP URLs
-                if href.startswith(('mailto:', 'tel:', 'skype:', 'javascript:', 'data:')):
-                    logger.debug(f"⚠️ Skip non-HTTP URL: {href}")
-                    continue
-                
-                full_url = urljoin(url, href)
-                urls.append(full_url)
+        # Soup + regex passes are CPU-bound: run them in the default executor so
+        # other crawls keep progressing on the event loop meanwhile
+        loop = asyncio.get_running_loop()
+        page_data = await loop.run_in_executor(None, parse_page_content, url, html_content)
         
-        crawl_time = time.time() - start_time
+        crawl_time = time.perf_counter() - start_time
         logger.info(f"✅ Requests crawl completed: {url} - {crawl_time:.2f}s")
-        logger.info(f"📊 Emails found: {len(valid_emails)}")
-        logger.info(f"📊 URLs found: {len(urls)}")
+        logger.info(f"📊 Emails found: {len(page_data['emails'])}")
+        logger.info(f"📊 URLs found: {len(page_data['urls'])}")
         
         return {
             "success": True,
             "status_code": response.status if response else 200,
             "url": str(response.url) if response else url,
             "html": html_content,
-            "title": title,
-            "description": description,
-            "emails": valid_emails,
-            "phones": list(set(phones)),
-            "urls": list(set(urls)),
+            **page_data,
             "crawl_time": crawl_time,
             "crawl_method": "requests_optimized"
         }
@@ -450,7 +595,7 @@ async def extract_with_requests(url: str) -> Dict:
             "error_message": error_msg,
             "error_type": error_type,
             "url": url,
-            "crawl_time": time.time() - start_time,
+            "crawl_time": time.perf_counter() - start_time,
             "crawl_method": "requests_optimized"
         }
 
@@ -8,9 +8,11 @@ import logging
 from typing import Dict, List, Optional
 from urllib.parse import urljoin, urlparse
 from bs4 import BeautifulSoup
-import aiohttp
 import asyncio
 
+from ..utils.constants import HTML_PARSER
+from .crawler import crawl_session
+
 logger = logging.getLogger(__name__)
 
 def get_domain(url: str) -> str:
@@ -105,41 +107,40 @@ async def check_selectors_on_page(url: str, selectors: List[str]) -> Dict:
     Check specific CSS selectors on a page for job information
     """
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, timeout=30) as response:
-                response.raise_for_status()
-                
-                soup = BeautifulSoup(await response.text(), 'html.parser')
-                results = []
-                
-                for selector in selectors:
-                    try:
-                        elements = soup.select(selector)
-                        selector_results = []
-                        
-                        for element in elements[:5]:  # Limit to first 5 elements
-                            result = check_element_for_job(element, url)
-                            selector_results.append(result)
-                        
-                        results.append({
-                            'selector': selector,
-                            'elements_found': len(elements),
-                            'results': selector_results
-                        })
-                        
-                    except Exception as e:
-                        results.append({
-                            'selector': selector,
-                            'error': str(e),
-                            'elements_found': 0,
-                            'results': []
-                        })
-                
-                return {
-                    'url': url,
-                    'success': True,
-                    'results': results
-                }
+        async with crawl_session() as session, session.get(url, timeout=30) as response:
+            response.raise_for_status()
+            
+            soup = BeautifulSoup(await response.text(), HTML_PARSER)
+            results = []
+            
+            for selector in selectors:
+                try:
+                    elements = soup.select(selector)
+                    selector_results = []
+                    
+                    for element in elements[:5]:  # Limit to first 5 elements
+                        result = check_element_for_job(element, url)
+                        selector_results.append(result)
+                    
+                    results.append({
+                        'selector': selector,
+                        'elements_found': len(elements),
+                        'results': selector_results
+                    })
+                    
+                except Exception as e:
+                    results.append({
+                        'selector': selector,
+                        'error': str(e),
+                        'elements_found': 0,
+                        'results': []
+                    })
+            
+            return {
+                'url': url,
+                'success': True,
+                'results': results
+            }
         
     except Exception as e:
         return {
@@ -154,38 +155,37 @@ async def interactive_element_checker(url: str):
     Interactive element checker for debugging
     """
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, timeout=30) as response:
-                response.raise_for_status()
-                
-                soup = BeautifulSoup(await response.text(), 'html.parser')
-                
-                # Find all elements with job-related content
-                job_elements = []
-                
-                # Check common job-related selectors
-                job_selectors = [
-                    '.job', '.career', '.position', '.opportunity',
-                    '.vacancy', '.hiring', '.recruitment',
-                    '[class*="job"]', '[class*="career"]', '[class*="position"]',
-                    '[id*="job"]', '[id*="career"]', '[id*="position"]'
-                ]
-                
-                for selector in job_selectors:
-                    elements = soup.select(selector)
-                    for element in elements:
-                        result = check_element_for_job(element, url)
-                        if result['is_likely_job']:
-                            job_elements.append({
-                                'selector': selector,
-                                'result': result
-                            })
-                
-                return {
-                    'url': url,
-                    'job_elements_found': len(job_elements),
-                    'job_elements': job_elements
-                }
+        async with crawl_session() as session, session.get(url, timeout=30) as response:
+            response.raise_for_status()
+            
+            soup = BeautifulSoup(await response.text(), HTML_PARSER)
+            
+            # Find all elements with job-related content
+            job_elements = []
+            
+            # Check common job-related selectors
+            job_selectors = [
+                '.job', '.career', '.position', '.opportunity',
+                '.vacancy', '.hiring', '.recruitment',
+                '[class*="job"]', '[class*="career"]', '[class*="position"]',
+                '[id*="job"]', '[id*="career"]', '[id*="position"]'
+            ]
+            
+            for selector in job_selectors:
+                elements = soup.select(selector)
+                for element in elements:
+                    result = check_element_for_job(element, url)
+                    if result['is_likely_job']:
+                        job_elements.append({
+                            'selector': selector,
+                            'result': result
+                        })
+            
+            return {
+                'url': url,
+                'job_elements_found': len(job_elements),
+                'job_elements': job_elements
+            }
         
     except Exception as e:
         return {
@@ -7,10 +7,21 @@ import re
 import json
 import time
 from typing import Dict, List, Optional
-from urllib.parse import urljoin, urlparse
+from urllib.parse import urlparse
 from bs4 import BeautifulSoup
 import aiohttp
 
+from ..utils.constants import HTML_PARSER, LINK_HTML_PARSER, ANCHORS_WITH_HREF
+from ..utils.text import url_joiner
+
+# Optional orjson for embedded job JSON (JS variables, data-job attributes); its
+# JSONDecodeError subclasses json.JSONDecodeError, so existing handlers still apply
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
+
 class HiddenJobExtractor:
     """Extract hidden jobs from career pages using HTML parsing (requests-only mode)"""
     
@@ -39,14 +50,15 @@ class HiddenJobExtractor:
     async def extract_job_urls(self, url: str, html_content: str) -> List[str]:
         """Extract job URLs from career page (requests-only mode)"""
         try:
-            soup = BeautifulSoup(html_content, 'html.parser')
+            soup = BeautifulSoup(html_content, LINK_HTML_PARSER, parse_only=ANCHORS_WITH_HREF)
             job_urls = []
+            join_url = url_joiner(url)
             
             # Look for job links
             for link in soup.find_all('a', href=True):
                 href = link.get('href')
                 if href and any(keyword in href.lower() for keyword in ['job', 'career', 'position', 'apply']):
-                    full_url = urljoin(url, href)
+                    full_url = join_url(href)
                     job_urls.append(full_url)
             
             return job_urls[:20]  # Limit to 20 URLs
@@ -57,7 +69,7 @@ class HiddenJobExtractor:
     async def extract_job_details(self, job_url: str, html_content: str) -> Dict:
         """Extract job details from job page (requests-only mode)"""
         try:
-            soup = BeautifulSoup(html_content, 'html.parser')
+            soup = BeautifulSoup(html_content, HTML_PARSER)
             
             # Basic job extraction
             title = soup.find('h1')
@@ -87,7 +99,7 @@ class HiddenJobExtractor:
         
         try:
             # Parse HTML with BeautifulSoup
-            soup = BeautifulSoup(html_content, 'html.parser')
+            soup = BeautifulSoup(html_content, HTML_PARSER)
             
             # Look for job data in script tags
             scripts = soup.find_all('script')
@@ -107,7 +119,7 @@ class HiddenJobExtractor:
                         matches = re.findall(pattern, content, re.IGNORECASE | re.DOTALL)
                         for match in matches:
                             try:
-                                job_data = json.loads(match)
+                                job_data = json_loads(match)
                                 if isinstance(job_data, list):
                                     for job in job_data[:5]:  # Limit to 5 jobs
                                         if isinstance(job, dict):
@@ -128,7 +140,7 @@ class HiddenJobExtractor:
         
         try:
             # Parse HTML with BeautifulSoup
-            soup = BeautifulSoup(html_content, 'html.parser')
+            soup = BeautifulSoup(html_content, HTML_PARSER)
             
             # Look for hidden job elements
             hidden_selectors = [
@@ -156,7 +168,7 @@ class HiddenJobExtractor:
                 try:
                     job_json = element.get('data-job')
                     if job_json:
-                        job_data = json.loads(job_json)
+                        job_data = json_loads(job_json)
                         if isinstance(job_data, dict):
                             normalized_job = self._normalize_job_data(job_data)
                             if normalized_job:
@@ -7,10 +7,14 @@ import re
 from typing import Dict, List, Optional, Tuple
 from datetime import datetime, timedelta
 from app.utils.job_constants import (
-    JOB_TYPES, JOB_CATEGORIES, JOB_LEVEL_PATTERNS, TECHNOLOGY_KEYWORDS,
-    JOB_DESCRIPTION_PATTERNS, LOCATION_PATTERNS, SALARY_PATTERNS,
-    JOB_VALIDATION_RULES, QUALITY_SCORING_WEIGHTS, COMPLETENESS_SCORING,
-    RELEVANCE_KEYWORDS, FRESHNESS_SCORING, NORMALIZATION_RULES
+    JOB_DESCRIPTION_PATTERNS, LOCATION_PATTERNS,
+    JOB_VALIDATION, QUALITY_SCORING_WEIGHTS, COMPLETENESS_SCORING,
+    RELEVANCE_KEYWORDS, FRESHNESS_SCORING,
+    JOB_LEVEL_UNION, JOB_DESCRIPTION_UNION,
+    classify_text,
+    JOB_CATEGORY_KEYWORDS, JOB_CATEGORY_LABEL_IDX, JOB_CATEGORY_LABELS,
+    detect_salary_units, QUALITY_METRICS, QUALITY_METRIC_WEIGHTS, weighted_score,
+    apply_normalization, parse_salary_range
 )
 
 
@@ -18,8 +22,8 @@ class JobAnalyzer:
     """Analyze job fields and calculate quality scores"""
     
     def __init__(self):
-        self.job_types_flat = [item for sublist in JOB_TYPES.values() for item in sublist]
-        self.categories_flat = [item for sublist in JOB_CATEGORIES.values() for item in sublist]
+        self.job_types_flat = JOB_VALIDATION.JOB_TYPE.valid_values
+        self.categories_flat = JOB_CATEGORY_KEYWORDS
     
     def analyze_job(self, job_data: Dict) -> Dict:
         """
@@ -67,20 +71,21 @@ class JobAnalyzer:
         }
         
         # Check length
-        if len(title) < JOB_VALIDATION_RULES["TITLE"]["min_length"]:
+        if len(title) < JOB_VALIDATION.TITLE.min_length:
             analysis["issues"].append("Title too short")
             analysis["score"] -= 0.3
-        elif len(title) > JOB_VALIDATION_RULES["TITLE"]["max_length"]:
+        elif len(title) > JOB_VALIDATION.TITLE.max_length:
             analysis["issues"].append("Title too long")
             analysis["score"] -= 0.2
         
         # Check pattern
-        if not re.match(JOB_VALIDATION_RULES["TITLE"]["patterns"][0], title):
+        if not JOB_VALIDATION.TITLE.patterns[0].match(title):
             analysis["issues"].append("Title contains invalid characters")
             analysis["score"] -= 0.2
         
         # Check if it's a real job title
-        if not any(category in title.lower() for category in self.categories_flat):
+        title_lower = title.lower()
+        if not any(category in title_lower for category in self.categories_flat):
             analysis["issues"].append("Title doesn't match common job categories")
             analysis["score"] -= 0.1
         
@@ -164,10 +169,10 @@ class JobAnalyzer:
         }
         
         # Check length
-        if len(company) < JOB_VALIDATION_RULES["COMPANY"]["min_length"]:
+        if len(company) < JOB_VALIDATION.COMPANY.min_length:
             analysis["issues"].append("Company name too short")
             analysis["score"] -= 0.3
-        elif len(company) > JOB_VALIDATION_RULES["COMPANY"]["max_length"]:
+        elif len(company) > JOB_VALIDATION.COMPANY.max_length:
             analysis["issues"].append("Company name too long")
             analysis["score"] -= 0.2
         
@@ -194,24 +199,24 @@ class JobAnalyzer:
         }
         
         # Check length
-        if len(description) < JOB_VALIDATION_RULES["DESCRIPTION"]["min_length"]:
+        if len(description) < JOB_VALIDATION.DESCRIPTION.min_length:
             analysis["issues"].append("Description too short")
             analysis["score"] -= 0.4
-        elif len(description) > JOB_VALIDATION_RULES["DESCRIPTION"]["max_length"]:
+        elif len(description) > JOB_VALIDATION.DESCRIPTION.max_length:
             analysis["issues"].append("Description too long")
             analysis["score"] -= 0.1
         
+        description_lower = description.lower()
+        
         # Check for opening phrases
-        for pattern in JOB_DESCRIPTION_PATTERNS["OPENING_PHRASES"]:
-            if re.search(pattern, description.lower()):
-                analysis["has_opening_phrase"] = True
-                analysis["score"] += 0.1
-                break
+        if JOB_DESCRIPTION_UNION["OPENING_PHRASES"].search(description_lower):
+            analysis["has_opening_phrase"] = True
+            analysis["score"] += 0.1
         
         # Check for action verbs
         action_verbs_found = []
         for verb in JOB_DESCRIPTION_PATTERNS["ACTION_VERBS"]:
-            if verb in description.lower():
+            if verb in description_lower:
                 action_verbs_found.append(verb)
         
         if action_verbs_found:
@@ -220,25 +225,19 @@ class JobAnalyzer:
             analysis["action_verbs"] = action_verbs_found
         
         # Check for requirements
-        for pattern in JOB_DESCRIPTION_PATTERNS["REQUIREMENTS_PHRASES"]:
-            if re.search(pattern, description.lower()):
-                analysis["has_requirements"] = True
-                analysis["score"] += 0.1
-                break
+        if JOB_DESCRIPTION_UNION["REQUIREMENTS_PHRASES"].search(description_lower):
+            analysis["has_requirements"] = True
+            analysis["score"] += 0.1
         
         # Check for responsibilities
-        for pattern in JOB_DESCRIPTION_PATTERNS["RESPONSIBILITIES_PHRASES"]:
-            if re.search(pattern, description.lower()):
-                analysis["has_responsibilities"] = True
-                analysis["score"] += 0.1
-                break
+        if JOB_DESCRIPTION_UNION["RESPONSIBILITIES_PHRASES"].search(description_lower):
+            analysis["has_responsibilities"] = True
+            analysis["score"] += 0.1
         
         # Check for benefits
-        for pattern in JOB_DESCRIPTION_PATTERNS["BENEFITS_PHRASES"]:
-            if re.search(pattern, description.lower()):
-                analysis["has_benefits"] = True
-                analysis["score"] += 0.1
-                break
+        if JOB_DESCRIPTION_UNION["BENEFITS_PHRASES"].search(description_lower):
+            analysis["has_benefits"] = True
+            analysis["score"] += 0.1
         
         analysis["score"] = min(1.0, analysis["score"])
         return analysis
@@ -261,29 +260,11 @@ class JobAnalyzer:
             "max_amount": None
         }
         
-        # Extract currency
-        for currency, symbols in SALARY_PATTERNS["CURRENCIES"].items():
-            if any(symbol in salary.lower() for symbol in symbols):
-                analysis["currency"] = currency
-                break
+        # Extract currency and period in one pass
+        analysis["currency"], analysis["period"] = detect_salary_units(salary)
         
-        # Extract period
-        for period, indicators in SALARY_PATTERNS["PERIODS"].items():
-            if any(indicator in salary.lower() for indicator in indicators):
-                analysis["period"] = period
-                break
-        
-        # Extract range
-        for pattern in SALARY_PATTERNS["RANGE_PATTERNS"]:
-            match = re.search(pattern, salary)
-            if match:
-                analysis["range"] = match.group()
-                # Try to extract min/max amounts
-                numbers = re.findall(r'[\d,]+', match.group())
-                if len(numbers) >= 2:
-                    analysis["min_amount"] = numbers[0].replace(',', '')
-                    analysis["max_amount"] = numbers[1].replace(',', '')
-                break
+        # Extract range and min/max amounts
+        analysis["range"], analysis["min_amount"], analysis["max_amount"] = parse_salary_range(salary)
         
         return analysis
     
@@ -355,24 +336,17 @@ class JobAnalyzer:
     
     def extract_technologies(self, text: str) -> List[str]:
         """Extract technology keywords from text"""
-        technologies = []
-        text_lower = text.lower()
+        technologies = classify_text(text)["TECHNOLOGY_KEYWORDS"]
         
-        for category, tech_list in TECHNOLOGY_KEYWORDS.items():
-            for tech in tech_list:
-                if tech in text_lower:
-                    technologies.append(tech)
-        
-        return list(set(technologies))  # Remove duplicates
+        return list(technologies)  # Set already removes duplicates
     
     def extract_job_level(self, title: str) -> str:
         """Extract job level from title"""
         title_lower = title.lower()
         
-        for level, patterns in JOB_LEVEL_PATTERNS.items():
-            for pattern in patterns:
-                if re.search(pattern, title_lower):
-                    return level
+        for level, pattern in JOB_LEVEL_UNION.items():
+            if pattern.search(title_lower):
+                return level
         
         return "UNKNOWN"
     
@@ -380,10 +354,9 @@ class JobAnalyzer:
         """Categorize job based on title"""
         title_lower = title.lower()
         
-        for category, keywords in JOB_CATEGORIES.items():
-            for keyword in keywords:
-                if keyword in title_lower:
-                    return category
+        for keyword, label_idx in zip(JOB_CATEGORY_KEYWORDS, JOB_CATEGORY_LABEL_IDX):
+            if keyword in title_lower:
+                return JOB_CATEGORY_LABELS[label_idx]
         
         return "OTHER"
     
@@ -397,16 +370,9 @@ class JobAnalyzer:
         }
         
         # Calculate overall score using custom weights for quality metrics
-        quality_weights = {
-            "completeness": 0.4,
-            "relevance": 0.4,
-            "freshness": 0.2
-        }
-        
-        overall_score = 0.0
-        for metric, weight in quality_weights.items():
-            if metric in scores:
-                overall_score += scores[metric] * weight
+        overall_score = weighted_score(
+            (scores[metric] for metric in QUALITY_METRICS), QUALITY_METRIC_WEIGHTS
+        )
         
         scores["overall"] = min(1.0, overall_score)
         return scores
@@ -505,20 +471,20 @@ class JobAnalyzer:
             "warnings": []
         }
         
-        for field, rules in JOB_VALIDATION_RULES.items():
-            if field.lower() in job_data:
-                value = job_data[field.lower()]
+        for field, rule in vars(JOB_VALIDATION).items():
+            if rule.key in job_data:
+                value = job_data[rule.key]
                 
-                if rules["required"] and (not value or not str(value).strip()):
+                if rule.required and (not value or not str(value).strip()):
                     validation["issues"].append(f"{field} is required")
                     validation["valid"] = False
                 
-                if value and "min_length" in rules:
-                    if len(str(value)) < rules["min_length"]:
+                if value and rule.min_length is not None:
+                    if len(str(value)) < rule.min_length:
                         validation["warnings"].append(f"{field} is too short")
                 
-                if value and "max_length" in rules:
-                    if len(str(value)) > rules["max_length"]:
+                if value and rule.max_length is not None:
+                    if len(str(value)) > rule.max_length:
                         validation["warnings"].append(f"{field} is too long")
         
         return validation
@@ -535,22 +501,13 @@ class JobAnalyzer:
             
             # Apply normalization rules
             if field == "job_type":
-                normalized_value = self.normalize_text(normalized_value)
-                for old, new in NORMALIZATION_RULES["JOB_TYPE"].items():
-                    if old in normalized_value:
-                        normalized_value = normalized_value.replace(old, new)
+                normalized_value = apply_normalization(self.normalize_text(normalized_value), "JOB_TYPE")
             
             elif field == "location":
-                normalized_value = self.normalize_text(normalized_value)
-                for old, new in NORMALIZATION_RULES["LOCATION"].items():
-                    if old in normalized_value:
-                        normalized_value = normalized_value.replace(old, new)
+                normalized_value = apply_normalization(self.normalize_text(normalized_value), "LOCATION")
             
             elif field == "title":
-                normalized_value = self.normalize_text(normalized_value)
-                for old, new in NORMALIZATION_RULES["LEVEL"].items():
-                    if old in normalized_value:
-                        normalized_value = normalized_value.replace(old, new)
+                normalized_value = apply_normalization(self.normalize_text(normalized_value), "LEVEL")
             
             normalized[field] = normalized_value
         
@@ -22,6 +22,16 @@ from .hidden_job_extractor_requests import HiddenJobExtractor
 from .job_analyzer import JobAnalyzer
 from .simple_job_formatter import SimpleJobFormatter
 from .job_extractor import extract_jobs_from_page
+from .crawler import crawl_session, get_shared_browser
+from ..utils.constants import HTML_PARSER, LINK_HTML_PARSER, ANCHORS_WITH_HREF
+from ..utils.text import url_joiner
+
+# API responses and inline job JSON decode with orjson when it is installed
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
 
 logger = logging.getLogger(__name__)
 
@@ -322,7 +332,7 @@ class JobExtractionService:
     
     async def _get_all_job_urls_with_pagination(self, career_url: str, max_jobs: int) -> List[str]:
         """Get all job URLs from career page including pagination"""
-        all_job_urls = []
+        all_job_urls = {}  # dict giữ thứ tự, membership O(1)
         visited_urls = set()
         
         try:
@@ -347,8 +357,8 @@ class JobExtractionService:
                     page_job_urls = []
                     for job in jobs:
                         job_url = job.get('url', '')
-                        if job_url and self._is_job_url(job_url) and job_url not in all_job_urls:
-                            all_job_urls.append(job_url)
+                        if job_url and job_url not in all_job_urls and self._is_job_url(job_url):
+                            all_job_urls[job_url] = None
                             page_job_urls.append(job_url)
                     
                     # Add pagination URLs to crawl queue
@@ -360,16 +370,15 @@ class JobExtractionService:
                     logger.warning(f"   ⚠️ Failed to crawl {current_url}: {e}")
             
             logger.info(f"   📄 Total job URLs found: {len(all_job_urls)}")
-            return all_job_urls
+            return list(all_job_urls)
             
         except Exception as e:
             logger.error(f"   ❌ Error in pagination crawl: {e}")
-            return all_job_urls
+            return list(all_job_urls)
     
     def _is_http_url(self, url: str) -> bool:
         """Check if URL is a valid HTTP/HTTPS URL"""
         try:
-            from urllib.parse import urlparse
             parsed = urlparse(url)
             return parsed.scheme in ('http', 'https')
         except:
@@ -418,11 +427,10 @@ class JobExtractionService:
             return False
         
         # URL should have some path content (not just domain)
-        from urllib.parse import urlparse
         parsed_url = urlparse(url)
         path = parsed_url.path.strip('/')
         
-        if not path or len(path.split('/')) < 1:
+        if not path:
             return False
         
         # If it has job patterns, it's likely a job URL
@@ -518,7 +526,6 @@ class JobExtractionService:
             return True  # Include jobs without salary info
         
         # Extract numeric values from salary string
-        import re
         numbers = re.findall(r'\d+', salary.replace(',', ''))
         if not numbers:
             return True
@@ -627,7 +634,6 @@ class JobExtractionService:
     
     def _extract_salary_from_description(self, description: str) -> Optional[str]:
         """Extract salary information from job description"""
-        import re
         
         # Enhanced salary patterns for Vietnamese job postings
         salary_patterns = [
@@ -725,8 +731,6 @@ class JobExtractionService:
             logger.info(f"   🔍 Analyzing page structure for: {career_page_url}")
             
             from .crawler import crawl_single_url
-            from bs4 import BeautifulSoup
-            import re
             
             # Get page content
             result = await crawl_single_url(career_page_url)
@@ -741,7 +745,7 @@ class JobExtractionService:
                 }
             
             html = result['html']
-            soup = BeautifulSoup(html, 'html.parser')
+            soup = BeautifulSoup(html, HTML_PARSER)
             page_text = soup.get_text()
             
             # 1. CHECK FOR INDIVIDUAL JOB URLs
@@ -865,11 +869,10 @@ class JobExtractionService:
         """Extract embedded jobs using pattern matching"""
         try:
             from .crawler import crawl_single_url
-            from bs4 import BeautifulSoup
             
             result = await crawl_single_url(career_page_url)
             if result['success'] and result['html']:
-                soup = BeautifulSoup(result['html'], 'html.parser')
+                soup = BeautifulSoup(result['html'], HTML_PARSER)
                 container_jobs = self._extract_jobs_from_cards(soup, career_page_url)
             else:
                 container_jobs = []
@@ -1384,7 +1387,6 @@ class JobExtractionService:
             current_cache = getattr(JobExtractionService, '_global_direct_jobs_cache', [])
             if current_cache:
                 # Check if cache is from same domain
-                from urllib.parse import urlparse
                 current_domain = urlparse(job_url).netloc
                 cached_domain = urlparse(current_cache[0].get('source_url', '')).netloc
                 if current_domain != cached_domain:
@@ -1510,14 +1512,13 @@ class JobExtractionService:
             # If no cache, extract directly from career page using embedded jobs logic
             logger.info(f"   📄 No cache found, extracting directly from career page")
             from .crawler import crawl_single_url
-            from bs4 import BeautifulSoup
             
             result = await crawl_single_url(career_url)
             if not result['success']:
                 return self._empty_job_response(career_url, 'Failed to crawl career page')
             
             html_content = result['html']
-            soup = BeautifulSoup(html_content, 'html.parser')
+            soup = BeautifulSoup(html_content, HTML_PARSER)
             
             # Extract embedded jobs from career page
             direct_jobs = await self._extract_direct_jobs_from_career_page(soup, career_url)
@@ -1640,7 +1641,6 @@ class JobExtractionService:
         url_lower = url.lower()
         
         # Parse URL để kiểm tra subdomain
-        from urllib.parse import urlparse
         parsed_url = urlparse(url_lower)
         domain = parsed_url.netloc.lower()
         path = parsed_url.path.lower()
@@ -1672,15 +1672,12 @@ class JobExtractionService:
     def _extract_job_details_from_html(self, result: Dict, job_url: str) -> Dict:
         """Extract job details from HTML content - Universal approach"""
         try:
-            from bs4 import BeautifulSoup
-            import re
-            
             html_content = result.get('html', '')
             if not html_content:
                 logger.warning("   ⚠️ No HTML content to extract from")
                 return {}
                 
-            soup = BeautifulSoup(html_content, 'html.parser')
+            soup = BeautifulSoup(html_content, HTML_PARSER)
             
             job_details = {
                 'job_name': '',
@@ -1855,7 +1852,6 @@ class JobExtractionService:
                     return title
             
             # If no title from URL, try to find in content
-            import re
             # Look for patterns like [HN] - Job Title or similar
             title_patterns = [
                 r'\[([^\]]+)\]\s*-\s*([^\[\]]+)',  # [HN] - Job Title
@@ -1913,7 +1909,6 @@ class JobExtractionService:
             all_text = soup.get_text()
             
             # Find potential job titles (capitalized phrases)
-            import re
             title_patterns = [
                 r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+){2,})',  # Multiple capitalized words
                 r'(Senior|Junior|Lead|Manager|Developer|Engineer|Designer|Analyst)\s+[A-Za-z]+',
@@ -1955,8 +1950,6 @@ class JobExtractionService:
     def _extract_posted_date_from_description(self, description: str) -> Optional[str]:
         """Extract posted date from job description"""
         try:
-            import re
-            
             # Common date patterns
             date_patterns = [
                 r'ngày đăng[:\s]*(\d{1,2}/\d{1,2}/\d{4})',
@@ -2243,7 +2236,6 @@ class JobExtractionService:
     
     def _extract_jobs_by_patterns(self, page_text: str, patterns: List[str], career_page_url: str, site_type: str) -> List[Dict]:
         """Extract jobs using regex patterns with deduplication"""
-        import re
         jobs = []
         seen_jobs = set()  # Track unique jobs to avoid duplicates
         
@@ -2284,7 +2276,6 @@ class JobExtractionService:
     
     def _normalize_jobs(self, jobs: List[Dict]) -> List[Dict]:
         """Normalize extracted jobs: clean titles, infer locations, remove duplicates."""
-        import re
         normalized_jobs: List[Dict] = []
         seen_titles: set = set()
         
@@ -2358,7 +2349,6 @@ class JobExtractionService:
     
     def _extract_title_from_text(self, job_text: str, site_type: str) -> str:
         """Extract job title from text"""
-        import re
         try:
             # Universal title extraction - no site-specific logic
             
@@ -2406,9 +2396,6 @@ class JobExtractionService:
     def _extract_location_from_text(self, job_text: str) -> str:
         """Extract location from text"""
         try:
-            import re
-            
-            
             # General location patterns
             location_patterns = [
                 r'nơi làm việc[:\s]+([^\n]+)',
@@ -2432,7 +2419,6 @@ class JobExtractionService:
     def _extract_salary_from_text(self, job_text: str) -> str:
         """Extract salary from text"""
         try:
-            import re
             salary_patterns = [
                 r'mức lương[:\s]+([^\n]+)',
                 r'salary[:\s]+([^\n]+)',
@@ -2582,7 +2568,6 @@ class JobExtractionService:
     def extract_company_from_url(self, url: str) -> str:
         """Extract company name from URL dynamically"""
         try:
-            from urllib.parse import urlparse
             parsed = urlparse(url)
             domain = parsed.netloc.lower()
             
@@ -2602,9 +2587,6 @@ class JobExtractionService:
         """Detect if career page has individual job URLs or embedded jobs - OPTIMIZED VERSION"""
         try:
             logger.info(f"   🔍 ANALYZING CAREER PAGE STRUCTURE: {career_page_url}")
-            from bs4 import BeautifulSoup
-            from urllib.parse import urljoin
-            import re
             
             # Crawl career page first to get HTML content
             from .crawler import crawl_single_url
@@ -2614,7 +2596,7 @@ class JobExtractionService:
                 return "unknown"
             
             html_content = result['html']
-            soup = BeautifulSoup(html_content, 'html.parser')
+            soup = BeautifulSoup(html_content, HTML_PARSER)
             
             # STEP 1: Check if this is a main career page (contains individual job URLs)
             url_lower = career_page_url.lower()
@@ -2630,12 +2612,13 @@ class JobExtractionService:
             if is_main_career_page:
                 # Check if it contains individual job URLs (not just category links)
                 individual_job_links = []
+                join_url = url_joiner(career_page_url)
                 for link in soup.find_all('a', href=True):
                     href = link.get('href', '')
                     if not href:
                         continue
                     
-                    full_url = urljoin(career_page_url, href)
+                    full_url = join_url(href)
                     
                     # Look for individual job URL patterns (more comprehensive)
                     job_url_patterns = [
@@ -2801,8 +2784,6 @@ class JobExtractionService:
         """Test if individual job URL has actual job content"""
         try:
             from .crawler import crawl_single_url
-            from bs4 import BeautifulSoup
-            import re
             
             # Crawl the individual job URL
             result = await crawl_single_url(job_url)
@@ -2810,7 +2791,7 @@ class JobExtractionService:
                 return {}
             
             html_content = result['html']
-            soup = BeautifulSoup(html_content, 'html.parser')
+            soup = BeautifulSoup(html_content, HTML_PARSER)
             
             # Extract basic job info to test if it has content
             job_data = {}
@@ -2907,10 +2888,6 @@ class JobExtractionService:
     async def _extract_job_urls_from_career_page(self, career_page_url: str) -> List[str]:
         """Extract job URLs directly from career page HTML - OPTIMIZED VERSION"""
         try:
-            from bs4 import BeautifulSoup
-            from urllib.parse import urljoin
-            import re
-            
             # Try to find "All Open Positions" or similar button first
             actual_job_page = await self._find_actual_job_listing_page(career_page_url)
             if actual_job_page and actual_job_page != career_page_url:
@@ -2929,7 +2906,7 @@ class JobExtractionService:
                     return []
                 
                 html_content = result['html']
-                soup = BeautifulSoup(html_content, 'html.parser')
+                soup = BeautifulSoup(html_content, LINK_HTML_PARSER, parse_only=ANCHORS_WITH_HREF)
                 
                 # Use the improved job link patterns and logic
                 job_link_patterns = [
@@ -2996,7 +2973,7 @@ class JobExtractionService:
                     return []
                 
                 html_content = result['html']
-                soup = BeautifulSoup(html_content, 'html.parser')
+                soup = BeautifulSoup(html_content, HTML_PARSER)
                 
                 direct_jobs = await self._extract_direct_jobs_from_career_page(soup, career_page_url)
                 if direct_jobs:
@@ -3017,7 +2994,7 @@ class JobExtractionService:
                     return []
                 
                 html_content = result['html']
-                soup = BeautifulSoup(html_content, 'html.parser')
+                soup = BeautifulSoup(html_content, LINK_HTML_PARSER, parse_only=ANCHORS_WITH_HREF)
                 
                 job_urls = []
                 
@@ -3134,9 +3111,7 @@ class JobExtractionService:
     def _detect_job_urls_by_content(self, soup, career_page_url: str) -> List[str]:
         """Detect job URLs by analyzing link content and context"""
         try:
-            from urllib.parse import urljoin
-            
-            job_urls = []
+            job_urls = {}
             all_links = soup.find_all('a', href=True)
             
             for link in all_links:
@@ -3188,10 +3163,10 @@ class JobExtractionService:
                 
                 if any(indicator in link_text for indicator in job_indicators):
                     if full_url not in job_urls and self._is_job_url(full_url):
-                        job_urls.append(full_url)
+                        job_urls[full_url] = None
                         logger.info(f"   🔗 Found job URL by content: {full_url} (text: {link_text})")
             
-            return job_urls
+            return list(job_urls)
             
         except Exception as e:
             logger.error(f"❌ Error in content-based job URL detection: {e}")
@@ -3227,14 +3202,12 @@ class JobExtractionService:
         """Find the actual job listing page by looking for 'All Open Positions' or similar buttons"""
         try:
             from .crawler import crawl_single_url
-            from bs4 import BeautifulSoup
-            from urllib.parse import urljoin
             
             result = await crawl_single_url(career_page_url)
             if not result['success'] or not result['html']:
                 return None
                 
-            soup = BeautifulSoup(result['html'], 'html.parser')
+            soup = BeautifulSoup(result['html'], HTML_PARSER)
             
             # First, check if this is already a job listing page by counting job links
             job_links = soup.find_all('a', href=True)
@@ -3308,8 +3281,7 @@ class JobExtractionService:
                 return []
             
             # Parse HTML
-            from bs4 import BeautifulSoup
-            soup = BeautifulSoup(html, 'html.parser')
+            soup = BeautifulSoup(html, HTML_PARSER)
             
             # Find anchor points (job indicators)
             job_indicators = [
@@ -3519,7 +3491,6 @@ class JobExtractionService:
         """Extract location from container"""
         try:
             text = container.get_text()
-            import re
             
             # Look for location patterns
             location_patterns = [
@@ -3544,7 +3515,6 @@ class JobExtractionService:
         """Extract salary from container"""
         try:
             text = container.get_text()
-            import re
             
             # Look for salary patterns
             salary_patterns = [
@@ -3567,7 +3537,6 @@ class JobExtractionService:
     def _extract_company_from_url(self, url: str) -> str:
         """Extract company name from URL"""
         try:
-            from urllib.parse import urlparse
             parsed = urlparse(url)
             domain = parsed.netloc.lower()
             
@@ -3635,15 +3604,10 @@ class JobExtractionService:
             
             # Try to use Playwright to find API endpoints
             try:
-                from playwright.async_api import async_playwright
-                
                 jobs = []
-                async with async_playwright() as p:
-                    browser = await p.chromium.launch(
-                        headless=True,
-                        args=["--no-sandbox", "--disable-dev-shm-usage"]
-                    )
-                    page = await browser.new_page()
+                browser = await get_shared_browser()
+                page = await browser.new_page()
+                try:
                     
                     # Enable network monitoring
                     api_responses = []
@@ -3679,8 +3643,7 @@ class JobExtractionService:
                                     
                                     if response_body:
                                         # Parse JSON response
-                                        import json
-                                        data = json.loads(response_body)
+                                        data = json_loads(response_body)
                                         jobs.extend(self._parse_api_job_data(data, career_page_url))
                                 except Exception as e:
                                     logger.debug(f"   ⚠️ Error parsing API response: {e}")
@@ -3711,8 +3674,7 @@ class JobExtractionService:
                                 
                                 # Try to parse as JSON
                                 try:
-                                    import json
-                                    data = json.loads(content)
+                                    data = json_loads(content)
                                     api_jobs = self._parse_api_job_data(data, career_page_url)
                                     if api_jobs:
                                         jobs.extend(api_jobs)
@@ -3724,7 +3686,8 @@ class JobExtractionService:
                             logger.debug(f"   ⚠️ Error fetching API endpoint {api_url}: {e}")
                             continue
                     
-                    await browser.close()
+                finally:
+                    await page.close()
                 
                 logger.info(f"   ✅ API extraction completed, found {len(jobs)} jobs")
                 return jobs
@@ -3807,9 +3770,7 @@ class JobExtractionService:
     def _extract_jobs_from_html_directly(self, html_content: str, base_url: str) -> List[Dict]:
         """Extract jobs directly from HTML content"""
         try:
-            from bs4 import BeautifulSoup
-            
-            soup = BeautifulSoup(html_content, 'html.parser')
+            soup = BeautifulSoup(html_content, HTML_PARSER)
             jobs = []
             
             # Common job listing selectors
@@ -3873,15 +3834,10 @@ class JobExtractionService:
             
             # Try to use Playwright for JavaScript rendering
             try:
-                from playwright.async_api import async_playwright
-                
                 jobs = []
-                async with async_playwright() as p:
-                    browser = await p.chromium.launch(
-                        headless=True,
-                        args=["--no-sandbox", "--disable-dev-shm-usage"]
-                    )
-                    page = await browser.new_page()
+                browser = await get_shared_browser()
+                page = await browser.new_page()
+                try:
                     
                     # Set user agent to avoid detection
                     await page.set_extra_http_headers({
@@ -3983,7 +3939,8 @@ class JobExtractionService:
                     except Exception as e:
                         logger.debug(f"   ⚠️ Error extracting JavaScript variables: {e}")
                     
-                    await browser.close()
+                finally:
+                    await page.close()
                 
                 logger.info(f"   ✅ JavaScript extraction completed, found {len(jobs)} jobs")
                 return jobs
@@ -4083,87 +4040,84 @@ class JobExtractionService:
         """Fallback method using requests (original implementation)"""
         try:
             # Use requests to get HTML content instead of Playwright
-            import aiohttp
             
             jobs = []
             
-            async with aiohttp.ClientSession() as session:
-                async with session.get(career_page_url) as response:
-                    if response.status == 200:
-                        html_content = await response.text()
-                        
-                        # Parse HTML with BeautifulSoup
-                        from bs4 import BeautifulSoup
-                        soup = BeautifulSoup(html_content, 'html.parser')
-                        
-                        # Method 1: Extract from JavaScript variables in script tags
-                        scripts = soup.find_all('script')
-                        for script in scripts[:5]:  # Limit to first 5 scripts
-                            content = script.string or script.get_text()
-                            if content:
-                                # Look for common job data variables
-                                patterns = [
-                                    r'jobs\s*:\s*(\[.*?\])',
-                                    r'jobList\s*:\s*(\[.*?\])',
-                                    r'careers\s*:\s*(\[.*?\])',
-                                    r'positions\s*:\s*(\[.*?\])',
-                                    r'openings\s*:\s*(\[.*?\])',
-                                    r'jobData\s*:\s*(\[.*?\])',
-                                    r'careerData\s*:\s*(\[.*?\])',
-                                    r'positionData\s*:\s*(\[.*?\])'
-                                ]
+            async with crawl_session() as session, session.get(career_page_url) as response:
+                if response.status == 200:
+                    html_content = await response.text()
+                    
+                    # Parse HTML with BeautifulSoup
+                    soup = BeautifulSoup(html_content, HTML_PARSER)
+                    
+                    # Method 1: Extract from JavaScript variables in script tags
+                    scripts = soup.find_all('script')
+                    for script in scripts[:5]:  # Limit to first 5 scripts
+                        content = script.string or script.get_text()
+                        if content:
+                            # Look for common job data variables
+                            patterns = [
+                                r'jobs\s*:\s*(\[.*?\])',
+                                r'jobList\s*:\s*(\[.*?\])',
+                                r'careers\s*:\s*(\[.*?\])',
+                                r'positions\s*:\s*(\[.*?\])',
+                                r'openings\s*:\s*(\[.*?\])',
+                                r'jobData\s*:\s*(\[.*?\])',
+                                r'careerData\s*:\s*(\[.*?\])',
+                                r'positionData\s*:\s*(\[.*?\])'
+                            ]
+                            
+                            for pattern in patterns:
+                                matches = re.findall(pattern, content, re.IGNORECASE | re.DOTALL)
+                                for match in matches:
+                                    try:
+                                        js_jobs = json_loads(match)
+                                        if isinstance(js_jobs, list) and len(js_jobs) > 0:
+                                            logger.info(f"   📊 Found {len(js_jobs)} jobs from JavaScript variables")
+                                            for job in js_jobs[:10]:  # Limit to 10 jobs
+                                                if isinstance(job, dict):
+                                                    jobs.append({
+                                                        'title': job.get('title', ''),
+                                                        'company': job.get('company', ''),
+                                                        'location': job.get('location', ''),
+                                                        'job_type': job.get('job_type', 'Full-time'),
+                                                        'salary': job.get('salary', ''),
+                                                        'posted_date': job.get('posted_date', ''),
+                                                        'url': job.get('url', career_page_url),
+                                                        'description': job.get('description', ''),
+                                                        'requirements': job.get('requirements', ''),
+                                                        'benefits': job.get('benefits', '')
+                                                    })
+                                            break  # Found jobs, no need to check other patterns
+                                    except json.JSONDecodeError:
+                                        continue
+                    
+                    # Method 2: Extract from data attributes
+                    data_elements = soup.find_all(attrs={'data-job': True})
+                    for element in data_elements[:10]:  # Limit to 10 elements
+                        try:
+                            job_data = element.get('data-job')
+                            if job_data:
+                                if isinstance(job_data, str):
+                                    job_json = json_loads(job_data)
+                                else:
+                                    job_json = job_data
                                 
-                                for pattern in patterns:
-                                    matches = re.findall(pattern, content, re.IGNORECASE | re.DOTALL)
-                                    for match in matches:
-                                        try:
-                                            js_jobs = json.loads(match)
-                                            if isinstance(js_jobs, list) and len(js_jobs) > 0:
-                                                logger.info(f"   📊 Found {len(js_jobs)} jobs from JavaScript variables")
-                                                for job in js_jobs[:10]:  # Limit to 10 jobs
-                                                    if isinstance(job, dict):
-                                                        jobs.append({
-                                                            'title': job.get('title', ''),
-                                                            'company': job.get('company', ''),
-                                                            'location': job.get('location', ''),
-                                                            'job_type': job.get('job_type', 'Full-time'),
-                                                            'salary': job.get('salary', ''),
-                                                            'posted_date': job.get('posted_date', ''),
-                                                            'url': job.get('url', career_page_url),
-                                                            'description': job.get('description', ''),
-                                                            'requirements': job.get('requirements', ''),
-                                                            'benefits': job.get('benefits', '')
-                                                        })
-                                                break  # Found jobs, no need to check other patterns
-                                        except json.JSONDecodeError:
-                                            continue
-                        
-                        # Method 2: Extract from data attributes
-                        data_elements = soup.find_all(attrs={'data-job': True})
-                        for element in data_elements[:10]:  # Limit to 10 elements
-                            try:
-                                job_data = element.get('data-job')
-                                if job_data:
-                                    if isinstance(job_data, str):
-                                        job_json = json.loads(job_data)
-                                    else:
-                                        job_json = job_data
-                                    
-                                    if isinstance(job_json, dict):
-                                        jobs.append({
-                                            'title': job_json.get('title', ''),
-                                            'company': job_json.get('company', ''),
-                                            'location': job_json.get('location', ''),
-                                            'job_type': job_json.get('job_type', 'Full-time'),
-                                            'salary': job_json.get('salary', ''),
-                                            'posted_date': job_json.get('posted_date', ''),
-                                            'url': job_json.get('url', career_page_url),
-                                            'description': job_json.get('description', ''),
-                                            'requirements': job_json.get('requirements', ''),
-                                            'benefits': job_json.get('benefits', '')
-                                        })
-                            except (json.JSONDecodeError, AttributeError):
-                                continue
+                                if isinstance(job_json, dict):
+                                    jobs.append({
+                                        'title': job_json.get('title', ''),
+                                        'company': job_json.get('company', ''),
+                                        'location': job_json.get('location', ''),
+                                        'job_type': job_json.get('job_type', 'Full-time'),
+                                        'salary': job_json.get('salary', ''),
+                                        'posted_date': job_json.get('posted_date', ''),
+                                        'url': job_json.get('url', career_page_url),
+                                        'description': job_json.get('description', ''),
+                                        'requirements': job_json.get('requirements', ''),
+                                        'benefits': job_json.get('benefits', '')
+                                    })
+                        except (json.JSONDecodeError, AttributeError):
+                            continue
             
             return jobs
             
@@ -4174,8 +4128,6 @@ class JobExtractionService:
     def _extract_job_from_element(self, element, base_url: str) -> Dict:
         """Extract job data from a single HTML element"""
         try:
-            from bs4 import BeautifulSoup
-            
             # Common selectors for job data
             selectors = {
                 'title': [
@@ -4455,6 +4407,7 @@ class JobExtractionService:
         """Extract jobs from AJAX-loaded content"""
         try:
             jobs = []
+            seen_titles = set()  # each Load More click re-returns every card: O(1) title check
             
             # Look for "Load More" buttons
             load_more_selectors = [
@@ -4508,7 +4461,9 @@ class JobExtractionService:
                             """)
                             
                             for job_data in new_jobs:
-                                if job_data.get('title') and not any(j.get('title') == job_data.get('title') for j in jobs):
+                                title = job_data.get('title')
+                                if title and title not in seen_titles:
+                                    seen_titles.add(title)
                                     jobs.append({
                                         'title': job_data.get('title', ''),
                                         'company': job_data.get('company', ''),
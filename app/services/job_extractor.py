@@ -8,9 +8,12 @@ import logging
 from typing import Dict, List, Optional, Tuple
 from urllib.parse import urljoin, urlparse
 from bs4 import BeautifulSoup
-import aiohttp
 import asyncio
 
+from ..utils.constants import HTML_PARSER
+from ..utils.text import url_joiner
+from .crawler import crawl_session, get_shared_browser, read_capped_text
+
 logger = logging.getLogger(__name__)
 
 async def extract_job_details_from_url(job_url: str) -> Optional[Dict]:
@@ -20,14 +23,9 @@ async def extract_job_details_from_url(job_url: str) -> Optional[Dict]:
         
         # Try Playwright first for JavaScript rendering
         try:
-            from playwright.async_api import async_playwright
-            
-            async with async_playwright() as p:
-                browser = await p.chromium.launch(
-            headless=True,
-            args=["--no-sandbox", "--disable-dev-shm-usage"]
-        )
-                page = await browser.new_page()
+            browser = await get_shared_browser()
+            page = await browser.new_page()
+            try:
                 
                 # Set user agent to avoid detection
                 await page.set_extra_http_headers({
@@ -134,8 +132,6 @@ async def extract_job_details_from_url(job_url: str) -> Optional[Dict]:
                     }
                 """)
                 
-                await browser.close()
-                
                 # Add default values
                 job_details['job_url'] = job_url
                 job_details['job_name'] = job_details.get('job_name', '')
@@ -183,6 +179,8 @@ async def extract_job_details_from_url(job_url: str) -> Optional[Dict]:
                 
                 logger.info(f"   ✅ Extracted job details: {job_details.get('job_name', 'No title')}")
                 return job_details
+            finally:
+                await page.close()
                 
         except ImportError:
             logger.warning("   ⚠️ Playwright not available, falling back to requests")
@@ -195,53 +193,52 @@ async def extract_job_details_from_url(job_url: str) -> Optional[Dict]:
 async def extract_job_details_from_url_requests(job_url: str) -> Optional[Dict]:
     """Fallback method using requests for job details extraction"""
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.get(job_url) as response:
-                if response.status == 200:
-                    html_content = await response.text()
-                    
-                    # Parse HTML with BeautifulSoup
-                    soup = BeautifulSoup(html_content, 'html.parser')
-                    
-                    job_details = {
-                        'job_url': job_url,
-                        'job_name': '',
-                        'job_description': '',
-                        'job_type': 'Full-time',
-                        'job_role': '',
-                        'location': '',
-                        'salary': '',
-                        'job_link': job_url
-                    }
-                    
-                    # Extract job title
-                    title_selectors = [
-                        'h1', 'h2', '.job-title', '.position-title', '.career-title',
-                        '.entry-title', '.post-title', '.page-title'
-                    ]
-                    
-                    for selector in title_selectors:
-                        element = soup.select_one(selector)
-                        if element and element.get_text().strip():
-                            job_details['job_name'] = element.get_text().strip()
-                            job_details['job_role'] = element.get_text().strip()
-                            break
-                    
-                    # Extract job description
-                    desc_selectors = [
-                        '.job-description', '.description', '.content', '.job-content',
-                        '.position-description', '.career-description',
-                        'article', '.main-content', '.job-details'
-                    ]
-                    
-                    for selector in desc_selectors:
-                        element = soup.select_one(selector)
-                        if element and element.get_text().strip():
-                            job_details['job_description'] = element.get_text().strip()
-                            break
-                    
-                    return job_details
-                    
+        async with crawl_session() as session, session.get(job_url) as response:
+            if response.status == 200:
+                html_content = await read_capped_text(response)
+                
+                # Parse HTML with BeautifulSoup
+                soup = BeautifulSoup(html_content, HTML_PARSER)
+                
+                job_details = {
+                    'job_url': job_url,
+                    'job_name': '',
+                    'job_description': '',
+                    'job_type': 'Full-time',
+                    'job_role': '',
+                    'location': '',
+                    'salary': '',
+                    'job_link': job_url
+                }
+                
+                # Extract job title
+                title_selectors = [
+                    'h1', 'h2', '.job-title', '.position-title', '.career-title',
+                    '.entry-title', '.post-title', '.page-title'
+                ]
+                
+                for selector in title_selectors:
+                    element = soup.select_one(selector)
+                    if element and element.get_text().strip():
+                        job_details['job_name'] = element.get_text().strip()
+                        job_details['job_role'] = element.get_text().strip()
+                        break
+                
+                # Extract job description
+                desc_selectors = [
+                    '.job-description', '.description', '.content', '.job-content',
+                    '.position-description', '.career-description',
+                    'article', '.main-content', '.job-details'
+                ]
+                
+                for selector in desc_selectors:
+                    element = soup.select_one(selector)
+                    if element and element.get_text().strip():
+                        job_details['job_description'] = element.get_text().strip()
+                        break
+                
+                return job_details
+                
     except Exception as e:
         logger.error(f"Error in requests fallback: {e}")
         return None
@@ -254,7 +251,7 @@ async def extract_job_details_with_ai(html_content: str, job_url: str) -> Option
         logger.info(f"   🤖 Using AI-based extraction for: {job_url}")
         
         # Parse HTML with BeautifulSoup
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = BeautifulSoup(html_content, HTML_PARSER)
         
         # Remove script and style elements
         for script in soup(["script", "style", "nav", "header", "footer"]):
@@ -456,13 +453,13 @@ def analyze_job_link_structure(url: str, link_text: str = "") -> Dict[str, any]:
     path_segments = [seg for seg in path_lower.strip('/').split('/') if seg]
     path_depth = len(path_segments)
     
-    # Query parameters analysis
+    # Query parameters analysis (split the already-lowercased query, no per-pair lower())
     query_params = {}
-    if parsed.query:
-        for param in parsed.query.split('&'):
-            if '=' in param:
-                key, value = param.split('=', 1)
-                query_params[key.lower()] = value.lower()
+    if query_lower:
+        for param in query_lower.split('&'):
+            key, sep, value = param.partition('=')
+            if sep:
+                query_params[key] = value
     
     # Link text analysis
     text_lower = link_text.lower() if link_text else ""
@@ -473,8 +470,7 @@ def analyze_job_link_structure(url: str, link_text: str = "") -> Dict[str, any]:
         'path_depth': path_depth,
         'query': query_lower,
         'query_params': query_params,
-        'link_text': text_lower,
-        'full_path': f"{path_lower}?{query_lower}"
+        'link_text': text_lower
     }
 
 def calculate_job_link_score(url: str, link_text: str = "", element_attrs: Dict = None) -> Tuple[int, Dict[str, int]]:
@@ -657,6 +653,7 @@ def extract_job_links_detailed(soup: BeautifulSoup, base_url: str) -> List[Dict]
         
         # Step 2: Find all links
         links = soup.find_all('a', href=True)
+        join_url = url_joiner(base_url)
         
         for link in links:
             href = link.get('href')
@@ -664,7 +661,7 @@ def extract_job_links_detailed(soup: BeautifulSoup, base_url: str) -> List[Dict]
                 continue
             
             # Normalize URL
-            full_url = urljoin(base_url, href)
+            full_url = join_url(href)
             
             # Skip external links and non-HTTP links
             if not full_url.startswith(('http://', 'https://')):
@@ -703,53 +700,52 @@ def extract_job_links_detailed(soup: BeautifulSoup, base_url: str) -> List[Dict]
 async def extract_jobs_from_page(url: str, max_jobs: int = 50) -> Dict:
     """Extract jobs from a single page with enhanced job link detection"""
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, headers={
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            }) as response:
-                response.raise_for_status()
-                
-                html_content = await response.text()
-                soup = BeautifulSoup(html_content, 'html.parser')
-                
-                # Extract job links for detailed analysis
-                job_links = extract_job_links_detailed(soup, url)
-                
-                # Filter job links based on score
-                filtered_job_links = []
-                for link in job_links:
-                    if link['job_score'] >= 5:  # High score threshold
-                        filtered_job_links.append(link)
-                
-                # Convert job_links to jobs format
-                jobs = []
-                for link in filtered_job_links[:max_jobs]:
-                    job = {
-                        'title': link.get('text', ''),
-                        'url': link.get('url', ''),
-                        'company': '',  # Will be filled later
-                        'location': '',
-                        'job_type': 'Full-time',
-                        'salary': '',
-                        'posted_date': '',
-                        'description': '',
-                        'job_score': link.get('job_score', 0)
-                    }
-                    jobs.append(job)
-                
-                result = {
-                    'success': True,
-                    'total_jobs_found': len(jobs),
-                    'jobs': jobs,
-                    'job_links': filtered_job_links[:max_jobs],
-                    'source_url': url,
-                    'job_links_detected': len(job_links),
-                    'job_links_filtered': len(filtered_job_links),
-                    'top_job_links': filtered_job_links[:10]
+        async with crawl_session() as session, session.get(url, headers={
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+        }) as response:
+            response.raise_for_status()
+            
+            html_content = await read_capped_text(response)
+            soup = BeautifulSoup(html_content, HTML_PARSER)
+            
+            # Extract job links for detailed analysis
+            job_links = extract_job_links_detailed(soup, url)
+            
+            # Filter job links based on score
+            filtered_job_links = []
+            for link in job_links:
+                if link['job_score'] >= 5:  # High score threshold
+                    filtered_job_links.append(link)
+            
+            # Convert job_links to jobs format
+            jobs = []
+            for link in filtered_job_links[:max_jobs]:
+                job = {
+                    'title': link.get('text', ''),
+                    'url': link.get('url', ''),
+                    'company': '',  # Will be filled later
+                    'location': '',
+                    'job_type': 'Full-time',
+                    'salary': '',
+                    'posted_date': '',
+                    'description': '',
+                    'job_score': link.get('job_score', 0)
                 }
-                
-                return result
-                
+                jobs.append(job)
+            
+            result = {
+                'success': True,
+                'total_jobs_found': len(jobs),
+                'jobs': jobs,
+                'job_links': filtered_job_links[:max_jobs],
+                'source_url': url,
+                'job_links_detected': len(job_links),
+                'job_links_filtered': len(filtered_job_links),
+                'top_job_links': filtered_job_links[:10]
+            }
+            
+            return result
+            
     except Exception as e:
         return {
             'success': False,
@@ -52,6 +52,98 @@ def atomic_write_json(data, final_path: str):
             pass
         raise e
 
+# Link classification tables; each is compiled below into one alternation so a
+# link is scanned once instead of once per keyword
+# Keywords tối ưu cho career pages (expanded)
+CAREER_LINK_KEYWORDS = (
+    # Vietnamese keywords (tối ưu)
+    'tuyen-dung', 'tuyển-dụng', 'tuyendung',
+    'viec-lam', 'việc-làm', 'vieclam', 
+    'co-hoi', 'cơ-hội', 'cohoi',
+    'nhan-vien', 'nhân-viên', 'nhanvien',
+    'ung-vien', 'ứng-viên', 'ungvien',
+    'cong-viec', 'công-việc', 'congviec',
+    'lam-viec', 'làm-việc', 'lamviec',
+    'thu-viec', 'thử-việc', 'thuviec',
+    'chinh-thuc', 'chính-thức', 'chinhthuc',
+    'nghe-nghiep', 'nghề-nghiệp', 'nghenghiep',
+    'tim-viec', 'tìm-việc', 'timviec',
+    'dang-tuyen', 'đang-tuyển', 'dangtuyen',
+    
+    # English keywords (tối ưu) - expanded
+    'career', 'careers', 'job', 'jobs',
+    'recruitment', 'employment', 'hiring',
+    'work', 'position', 'opportunity', 'vacancy',
+    'apply', 'application', 'join-us',
+    'team', 'talent', 'open-role', 'open-roles',
+    'we-are-hiring', 'work-with-us', 'join-our-team',
+    'grow-with-us', 'build-with-us', 'create-with-us',
+    'full-time', 'part-time', 'remote', 'hybrid',
+    'onsite', 'on-site', 'freelance', 'contract',
+    'internship', 'intern', 'graduate', 'entry-level',
+    'senior', 'junior', 'lead', 'principal',
+    
+    # Additional career patterns
+    'hr', 'human-resource', 'human-resources',
+    'staff', 'employee', 'employees',
+    'developer', 'engineer', 'analyst', 'manager',
+    'specialist', 'consultant', 'coordinator',
+    'assistant', 'director', 'executive',
+    'programmer', 'designer', 'architect',
+    'tester', 'qa', 'quality-assurance',
+    'devops', 'admin', 'administrator',
+    'sales', 'marketing', 'business',
+    'finance', 'accounting', 'legal',
+    'support', 'customer-service', 'operations'
+)
+
+# Keywords cho navigation pages
+NAV_LINK_KEYWORDS = (
+    'about', 'about-us', 'company', 'team', 'contact',
+    'services', 'products', 'solutions', 'portfolio',
+    'giới-thiệu', 'công-ty', 'đội-ngũ', 'liên-hệ',
+    'dịch-vụ', 'sản-phẩm', 'giải-pháp'
+)
+
+# Keywords cho content pages
+CONTENT_LINK_KEYWORDS = (
+    'news', 'blog', 'article', 'press', 'media',
+    'tin-tức', 'bài-viết', 'thông-cáo', 'truyền-thông'
+)
+
+# Common non-job URLs: external services, company pages, static files
+NON_JOB_LINK_PATTERNS = (
+    # External services
+    'google.com/maps', 'facebook.com', 'twitter.com', 'linkedin.com',
+    'youtube.com', 'instagram.com', 'tiktok.com',
+    # Company pages
+    '/services/', '/service/', '/products/', '/product/',
+    '/solutions/', '/solution/', '/portfolio/', '/about/',
+    '/contact/', '/team/', '/company/', '/news/', '/blog/',
+    '/press/', '/media/', '/investor/',
+    # Vietnamese equivalents
+    '/dich-vu/', '/san-pham/', '/giai-phap/', '/gioi-thieu/',
+    '/lien-he/', '/doi-ngu/', '/cong-ty/', '/tin-tuc/',
+    '/bai-viet/', '/thong-cao/', '/truyen-thong/',
+    # Other common patterns
+    '/privacy/', '/terms/', '/cookie/', '/sitemap/',
+    '/search/', '/login/', '/register/', '/signup/',
+    '/admin/', '/dashboard/', '/account/', '/profile/',
+    # File extensions
+    '.jpg', '.jpeg', '.png', '.gif', '.svg', '.ico',
+    '.css', '.js', '.woff', '.woff2', '.ttf', '.eot',
+    '.xml', '.json', '.pdf', '.doc', '.docx'
+)
+
+def compile_literal_union(literals):
+    """Compile literals into a single alternation"""
+    return re.compile("|".join(map(re.escape, literals)))
+
+CAREER_LINK_RX = compile_literal_union(CAREER_LINK_KEYWORDS)
+NAV_LINK_RX = compile_literal_union(NAV_LINK_KEYWORDS)
+CONTENT_LINK_RX = compile_literal_union(CONTENT_LINK_KEYWORDS)
+NON_JOB_LINK_RX = compile_literal_union(NON_JOB_LINK_PATTERNS)
+
 class OptimizedCareerSpider(scrapy.Spider):
     """
     Optimized Scrapy Spider với keywords tối ưu và memory optimization
@@ -78,16 +170,8 @@ class OptimizedCareerSpider(scrapy.Spider):
         'login', 'register', 'signup', 'dashboard'
     ]
     
-    # URL patterns to exclude (menu tabs only)
-    EXCLUDE_MENU_PATTERNS = [
-        r'.*/(about|company|team|leadership).*',
-        r'.*/(contact|support|help).*',
-        r'.*/(marketing|advertising|seo).*',
-        r'.*/(api|docs|documentation).*',
-        r'.*/(pricing|plans|features).*',
-        r'.*/(privacy|terms|policy).*',
-        r'.*/(login|register|signup).*'
-    ]
+    # '/keyword' probes as one alternation: this scan alone decides should_exclude_url
+    EXCLUDE_MENU_RX = compile_literal_union(f'/{keyword}' for keyword in EXCLUDE_MENU_KEYWORDS)
     
     # Memory optimization: reduce concurrent requests
     custom_settings = {
@@ -131,7 +215,7 @@ class OptimizedCareerSpider(scrapy.Spider):
         self.crawled_pages = 0
         self.found_career_pages = 0
         self.domain = None
-        self.start_time = datetime.now()
+        self.start_time = time.perf_counter()
         
         # Contact extraction data
         self.all_emails = set()
@@ -263,19 +347,8 @@ class OptimizedCareerSpider(scrapy.Spider):
     
     def should_exclude_url(self, url):
         """Check if URL should be excluded (menu tabs only)"""
-        url_lower = url.lower()
-        
         # Check for exact menu keyword matches
-        for keyword in self.EXCLUDE_MENU_KEYWORDS:
-            if f'/{keyword}' in url_lower or url_lower.endswith(f'/{keyword}'):
-                return True
-        
-        # Check patterns
-        for pattern in self.EXCLUDE_MENU_PATTERNS:
-            if re.match(pattern, url_lower):
-                return True
-        
-        return False
+        return self.EXCLUDE_MENU_RX.search(url.lower()) is not None
     
     def is_valid_link(self, link: str) -> bool:
         """
@@ -293,34 +366,9 @@ class OptimizedCareerSpider(scrapy.Spider):
             return False
         
         # STRICT FILTERING: Exclude common non-job URLs
-        link_lower = link.lower()
-        non_job_patterns = [
-            # External services
-            'google.com/maps', 'facebook.com', 'twitter.com', 'linkedin.com',
-            'youtube.com', 'instagram.com', 'tiktok.com',
-            # Company pages
-            '/services/', '/service/', '/products/', '/product/',
-            '/solutions/', '/solution/', '/portfolio/', '/about/',
-            '/contact/', '/team/', '/company/', '/news/', '/blog/',
-            '/press/', '/media/', '/investor/',
-            # Vietnamese equivalents
-            '/dich-vu/', '/san-pham/', '/giai-phap/', '/gioi-thieu/',
-            '/lien-he/', '/doi-ngu/', '/cong-ty/', '/tin-tuc/',
-            '/bai-viet/', '/thong-cao/', '/truyen-thong/',
-            # Other common patterns
-            '/privacy/', '/terms/', '/cookie/', '/sitemap/',
-            '/search/', '/login/', '/register/', '/signup/',
-            '/admin/', '/dashboard/', '/account/', '/profile/',
-            # File extensions
-            '.jpg', '.jpeg', '.png', '.gif', '.svg', '.ico',
-            '.css', '.js', '.woff', '.woff2', '.ttf', '.eot',
-            '.xml', '.json', '.pdf', '.doc', '.docx'
-        ]
-        
         # If link contains any non-job pattern, reject it
-        for pattern in non_job_patterns:
-            if pattern in link_lower:
-                return False
+        if NON_JOB_LINK_RX.search(link.lower()):
+            return False
             
         return True
     
@@ -328,63 +376,6 @@ class OptimizedCareerSpider(scrapy.Spider):
         """
         Phân loại links theo priority với keywords tối ưu
         """
-        # Keywords tối ưu cho career pages (expanded)
-        career_keywords = [
-            # Vietnamese keywords (tối ưu)
-            'tuyen-dung', 'tuyển-dụng', 'tuyendung',
-            'viec-lam', 'việc-làm', 'vieclam', 
-            'co-hoi', 'cơ-hội', 'cohoi',
-            'nhan-vien', 'nhân-viên', 'nhanvien',
-            'ung-vien', 'ứng-viên', 'ungvien',
-            'cong-viec', 'công-việc', 'congviec',
-            'lam-viec', 'làm-việc', 'lamviec',
-            'thu-viec', 'thử-việc', 'thuviec',
-            'chinh-thuc', 'chính-thức', 'chinhthuc',
-            'nghe-nghiep', 'nghề-nghiệp', 'nghenghiep',
-            'tim-viec', 'tìm-việc', 'timviec',
-            'dang-tuyen', 'đang-tuyển', 'dangtuyen',
-            
-            # English keywords (tối ưu) - expanded
-            'career', 'careers', 'job', 'jobs',
-            'recruitment', 'employment', 'hiring',
-            'work', 'position', 'opportunity', 'vacancy',
-            'apply', 'application', 'join-us',
-            'team', 'talent', 'open-role', 'open-roles',
-            'we-are-hiring', 'work-with-us', 'join-our-team',
-            'grow-with-us', 'build-with-us', 'create-with-us',
-            'full-time', 'part-time', 'remote', 'hybrid',
-            'onsite', 'on-site', 'freelance', 'contract',
-            'internship', 'intern', 'graduate', 'entry-level',
-            'senior', 'junior', 'lead', 'principal',
-            
-            # Additional career patterns
-            'hr', 'human-resource', 'human-resources',
-            'staff', 'employee', 'employees',
-            'developer', 'engineer', 'analyst', 'manager',
-            'specialist', 'consultant', 'coordinator',
-            'assistant', 'director', 'executive',
-            'programmer', 'designer', 'architect',
-            'tester', 'qa', 'quality-assurance',
-            'devops', 'admin', 'administrator',
-            'sales', 'marketing', 'business',
-            'finance', 'accounting', 'legal',
-            'support', 'customer-service', 'operations'
-        ]
-        
-        # Keywords cho navigation pages
-        nav_keywords = [
-            'about', 'about-us', 'company', 'team', 'contact',
-            'services', 'products', 'solutions', 'portfolio',
-            'giới-thiệu', 'công-ty', 'đội-ngũ', 'liên-hệ',
-            'dịch-vụ', 'sản-phẩm', 'giải-pháp'
-        ]
-        
-        # Keywords cho content pages
-        content_keywords = [
-            'news', 'blog', 'article', 'press', 'media',
-            'tin-tức', 'bài-viết', 'thông-cáo', 'truyền-thông'
-        ]
-        
         priority_links = {
             100: [],  # Career pages (cao nhất)
             80: [],   # Navigation pages
@@ -396,16 +387,16 @@ class OptimizedCareerSpider(scrapy.Spider):
             link_lower = link.lower()
             
             # Career pages - priority cao nhất
-            if any(keyword in link_lower for keyword in career_keywords):
+            if CAREER_LINK_RX.search(link_lower):
                 priority_links[100].append(link)
                 logger.info(f"🎯 Career link found: {link}")
             
             # Navigation pages
-            elif any(keyword in link_lower for keyword in nav_keywords):
+            elif NAV_LINK_RX.search(link_lower):
                 priority_links[80].append(link)
             
             # Content pages
-            elif any(keyword in link_lower for keyword in content_keywords):
+            elif CONTENT_LINK_RX.search(link_lower):
                 priority_links[50].append(link)
             
             # Other pages
@@ -580,7 +571,6 @@ class OptimizedCareerSpider(scrapy.Spider):
     
     def _is_homepage(self, url: str) -> bool:
         """Check if URL is homepage"""
-        from urllib.parse import urlparse
         parsed = urlparse(url)
         path = parsed.path.lower()
         
@@ -597,7 +587,6 @@ class OptimizedCareerSpider(scrapy.Spider):
         title = response.css('title::text').get('').lower()
         
         # Parse URL để kiểm tra subdomain
-        from urllib.parse import urlparse
         parsed_url = urlparse(url)
         domain = parsed_url.netloc.lower()
         path = parsed_url.path.lower()
@@ -675,20 +664,19 @@ class OptimizedCareerSpider(scrapy.Spider):
         
         # Prepare contact info (already deduplicated by using sets)
         contact_info = {
-            'emails': sorted(list(self.all_emails)),  # Convert set to sorted list
-            'phones': sorted(list(self.all_phones)),  # Convert set to sorted list
-            'contact_urls': sorted(list(self.all_contact_urls))  # Convert set to sorted list
+            'emails': sorted(self.all_emails),  # sorted() takes the set directly
+            'phones': sorted(self.all_phones),
+            'contact_urls': sorted(self.all_contact_urls)
         }
         
         # Tạo result với cả career pages và contact info
-        crawl_time_delta = datetime.now() - self.start_time
         result = {
             'success': True,
             'requested_url': self.start_urls[0] if self.start_urls else '',
             'career_pages': career_pages_data,
             'total_pages_crawled': self.crawled_pages,
             'career_pages_found': len(career_pages_data),
-            'crawl_time': crawl_time_delta.total_seconds(),  # Convert timedelta to seconds
+            'crawl_time': time.perf_counter() - self.start_time,
             'crawl_method': 'scrapy_optimized',
             'contact_info': contact_info  # Include contact info
         }
@@ -744,7 +732,7 @@ class OptimizedCareerSpider(scrapy.Spider):
         """
         Extract job URLs from career page with OPTIMIZED filtering for better job detection
         """
-        job_urls = []
+        job_urls = {}  # insertion-ordered set: O(1) dedupe across the three methods
         url = response.url
         
         # Method 1: Find all links on the career page
@@ -758,8 +746,8 @@ class OptimizedCareerSpider(scrapy.Spider):
             full_url = response.urljoin(link)
             
             # Apply optimized job URL filtering
-            if self._is_job_url(full_url):
-                job_urls.append(full_url)
+            if full_url not in job_urls and self._is_job_url(full_url):
+                job_urls[full_url] = None
                 logger.info(f"   🔗 Found job URL: {full_url}")
         
         # Method 2: Look for job cards/sections with more specific selectors
@@ -782,8 +770,8 @@ class OptimizedCareerSpider(scrapy.Spider):
                     for link in card_links:
                         if link:
                             full_url = response.urljoin(link)
-                            if self._is_job_url(full_url) and full_url not in job_urls:
-                                job_urls.append(full_url)
+                            if full_url not in job_urls and self._is_job_url(full_url):
+                                job_urls[full_url] = None
                                 logger.info(f"   🔗 Found job URL from card: {full_url}")
             except Exception as e:
                 logger.debug(f"   ⚠️ Error with selector {selector}: {e}")
@@ -815,12 +803,12 @@ class OptimizedCareerSpider(scrapy.Spider):
                 # Check if link text contains job-related keywords
                 if any(pattern in link_text_lower for pattern in job_text_patterns):
                     full_url = response.urljoin(href)
-                    if self._is_job_url(full_url) and full_url not in job_urls:
-                        job_urls.append(full_url)
+                    if full_url not in job_urls and self._is_job_url(full_url):
+                        job_urls[full_url] = None
                         logger.info(f"   🔗 Found job URL by text: {full_url} (text: {link_text})")
         
-        # Remove duplicates and return
-        unique_job_urls = list(set(job_urls))
+        # Already unique; keep discovery order
+        unique_job_urls = list(job_urls)
         logger.info(f"   📊 Total job URLs found: {len(unique_job_urls)}")
         
         return unique_job_urls
@@ -851,7 +839,6 @@ class OptimizedCareerSpider(scrapy.Spider):
             return False
         
         # PRIORITY 1: Check for career subdomains (HIGHEST PRIORITY)
-        from urllib.parse import urlparse
         parsed_url = urlparse(url)
         domain = parsed_url.netloc.lower()
         
@@ -867,7 +854,7 @@ class OptimizedCareerSpider(scrapy.Spider):
                 # Additional validation for career subdomains
                 path = parsed_url.path.strip('/')
                 # Accept if it has some path content (not just root)
-                if path and len(path.split('/')) >= 1:
+                if path:
                     return True
         
         # PRIORITY 2: Check for job-specific URL patterns
@@ -907,11 +894,9 @@ class OptimizedCareerSpider(scrapy.Spider):
         
         # PRIORITY 4: Check for numeric IDs (common in job systems)
         path = parsed_url.path.strip('/')
-        if path:
-            path_parts = path.split('/')
-            # Check if last part is numeric (common for job IDs)
-            if path_parts and path_parts[-1].isdigit():
-                return True
+        # Check if last part is numeric (common for job IDs)
+        if path and path.rpartition('/')[2].isdigit():
+            return True
         
         # REJECT: Obvious non-job patterns
         obvious_non_job_patterns = [
@@ -942,11 +927,11 @@ class OptimizedCareerSpider(scrapy.Spider):
         # REJECT: Generic career pages (not specific jobs)
         if (url_lower.endswith('/career') or url_lower.endswith('/careers') or 
             url_lower.endswith('/jobs') or url_lower.endswith('/') or
-            url_lower.rstrip('/').split('/')[-1] in ['career', 'careers', 'jobs']):
+            url_lower.rstrip('/').rpartition('/')[2] in ('career', 'careers', 'jobs')):
             return False
         
-        # REJECT: Too short URLs (likely not specific jobs)
-        if not path or len(path.split('/')) < 2:
+        # REJECT: Too short URLs (likely not specific jobs): fewer than 2 segments
+        if not path or '/' not in path:
             return False
         
         # Default: reject if no clear job indicators
@@ -960,9 +945,8 @@ class OptimizedCareerSpider(scrapy.Spider):
         url = response.url
         
         # Extract emails using regex
-        import re
         email_patterns = [
-            r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b',
+            r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b',
             r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}'
         ]
         
@@ -1017,8 +1001,6 @@ async def run_optimized_career_spider(url: str, max_pages: int = 150) -> Dict:
     Chạy optimized Scrapy spider bằng subprocess để tránh reactor conflicts
     """
     try:
-        import os
-        import time
         import subprocess
         import asyncio
         
@@ -1088,7 +1070,7 @@ print("Scrapy completed successfully")
             f.write(script_content)
         
         # Chạy script bằng subprocess
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         process = await asyncio.create_subprocess_exec(
             'python', script_file,
@@ -1098,7 +1080,7 @@ print("Scrapy completed successfully")
         
         stdout, stderr = await process.communicate()
         
-        crawl_time = time.time() - start_time
+        crawl_time = time.perf_counter() - start_time
         
         # Cleanup script
         try:
@@ -10,8 +10,21 @@ import asyncio
 import logging
 from typing import Dict
 
+# Optional orjson: C decoder for the spider's JSON feed (can be MB-scale on link-heavy sites)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# One Scrapy subprocess at a time: each is a separate Python + Twisted process
+# (~100-150 MB RSS), so parallel crawls would exhaust a 512 MB instance.
+# Extra callers wait here instead of forking another crawler
+SCRAPY_MAX_PROCESSES = 1
+_scrapy_semaphore = asyncio.Semaphore(SCRAPY_MAX_PROCESSES)
+
 def _run_spider_blocking(start_url: str, max_pages: int = 100) -> dict:
     """Run Scrapy spider in blocking mode to avoid race conditions"""
     try:
@@ -48,7 +61,8 @@ def _run_spider_blocking(start_url: str, max_pages: int = 100) -> dict:
             logger.warning("⚠️ Scrapy output empty, using empty array")
         
         try:
-            items = json.loads(raw)
+            # orjson.JSONDecodeError subclasses json.JSONDecodeError: the handler below covers both
+            items = orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
             logger.info(f"✅ Successfully parsed Scrapy JSON output: {len(items) if isinstance(items, list) else 'dict'}")
             
             # Convert items to expected format
@@ -93,7 +107,8 @@ async def run_spider(start_url: str, max_pages: int = 100) -> dict:
     try:
         loop = asyncio.get_running_loop()
         fn = functools.partial(_run_spider_blocking, start_url=start_url, max_pages=max_pages)
-        result = await loop.run_in_executor(None, fn)
+        async with _scrapy_semaphore:
+            result = await loop.run_in_executor(None, fn)
         
         logger.info(f"✅ Scrapy spider completed successfully for {start_url}")
         return result
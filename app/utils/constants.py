@@ -4,6 +4,26 @@ Constants and configuration for the crawler application
 Enhanced with strict filtering constants
 """
 
+import sys
+
+from bs4 import SoupStrainer
+
+# BeautifulSoup tree builder for full-page parsing: html.parser, whose tree repairs
+# the text/selector extraction was written against
+HTML_PARSER = 'html.parser'
+
+# Tree builder for <a href> harvests (parse_only=ANCHORS_WITH_HREF): lxml (C) when
+# installed, much faster on link-heavy pages; only anchors are kept, so the
+# builders' different handling of malformed markup does not change the result
+try:
+    import lxml  # noqa: F401
+    LINK_HTML_PARSER = 'lxml'
+except ImportError:
+    LINK_HTML_PARSER = 'html.parser'
+
+# Link harvests that only read <a href> parse just those subtrees, not the full DOM
+ANCHORS_WITH_HREF = SoupStrainer('a', href=True)
+
 # Vietnamese software company career keywords
 CAREER_KEYWORDS_VI = [
     # Vietnamese keywords (with and without accents, with and without spaces, no duplicates)
@@ -84,13 +104,13 @@ JOB_KEYWORDS_DETAILED = [
 ]
 
 # Common job board platforms
-JOB_BOARD_DOMAINS = {
+JOB_BOARD_DOMAINS = frozenset(map(sys.intern, {
     'topcv.vn', 'careerbuilder.vn', 'jobstreet.vn', 'vietnamworks.com',
     'mywork.com.vn', '123job.vn', 'timviec365.vn', 'careerlink.vn',
     'indeed.com', 'linkedin.com/jobs', 'glassdoor.com', 'monster.com',
     'ziprecruiter.com', 'simplyhired.com', 'dice.com', 'angel.co',
     'stackoverflow.com/jobs', 'github.com/jobs', 'remote.co', 'weworkremotely.com'
-}
+}))
 
 # Software company career selectors
 CAREER_SELECTORS = [
@@ -178,7 +198,7 @@ STRONG_NON_CAREER_INDICATORS = [
     # User/Account pages
     'login', 'register', 'signup', 'signin', 'account', 'profile',
     'dashboard', 'panel', 'admin', 'control', 'manage', 'settings',
-    'user', 'member', 'community', 'forum', 'support', 'help',
+    'user', 'member', 'community', 'support', 'help',
     
     # E-commerce
     'cart', 'checkout', 'payment', 'order', 'purchase', 'buy', 'shop',
@@ -5,8 +5,11 @@ Refactored from contact_extractor.py
 """
 
 import re
-from urllib.parse import urlparse, urljoin, unquote, ParseResult
-from typing import List, Dict, Set, Optional
+import sys
+import asyncio
+from functools import lru_cache
+from urllib.parse import urlsplit, unquote
+from typing import List, Dict, Optional, Iterable, Iterator, Tuple
 
 try:
     from yarl import URL
@@ -20,34 +23,54 @@ from .text import to_text, normalize_url as normalize_url_util
 
 # Remove duplicate to_text function - use the one from text.py
 
+# Keyword/domain sets are read-only lookup tables: frozen and interned once at import
 # Social media domains
-SOCIAL_DOMAINS: Set[str] = {
+SOCIAL_DOMAINS: frozenset = frozenset(map(sys.intern, {
     "linkedin.com", "twitter.com", "facebook.com", "instagram.com",
     "github.com", "gitlab.com", "behance.net", "dribbble.com",
     "medium.com", "stackoverflow.com", "quora.com", "reddit.com",
     "producthunt.com", "angel.co", "crunchbase.com", "dev.to",
     "polywork.com", "toptal.com", "upwork.com", "freelancer.com", "x.com", "tiktok.com", "wa.me"
-}
+}))
 
 # English career keywords
-CAREER_KEYWORDS: Set[str] = {
+CAREER_KEYWORDS: frozenset = frozenset(map(sys.intern, {
     "career", "job", "hiring", "join us", "work with us", "employment",
     "vacancy", "opportunity", "position", "recruiting", "talent",
     "apply now", "open roles", "we're hiring"
-}
+}))
 
 # High priority career keywords for strict detection
-HIGH_PRIORITY_CAREER_KEYWORDS = {
+HIGH_PRIORITY_CAREER_KEYWORDS: frozenset = frozenset(map(sys.intern, {
     'tuyen-dung', 'career', 'job', 'recruitment', 'hiring',
     'viec-lam', 'position', 'opportunity', 'vacancy'
-}
+}))
 
 # Non-career keywords for filtering
-NON_CAREER_KEYWORDS = {
+NON_CAREER_KEYWORDS: frozenset = frozenset(map(sys.intern, {
     'blog', 'news', 'article', 'post', 'story', 'product', 'service',
     'about', 'contact', 'company', 'team', 'leadership', 'investor',
     'press', 'media', 'careers', 'jobs'  # These are career-related but not main career pages
-}
+}))
+
+CAREER_TITLE_INDICATORS = (
+    'career', 'job', 'hiring', 'recruitment', 'tuyển dụng', 'việc làm',
+    'opportunity', 'position', 'vacancy', 'join us', 'work with us'
+)
+
+CAREER_CONTENT_INDICATORS = (
+    'apply now', 'send resume', 'submit application', 'đăng ký',
+    'ứng tuyển', 'gửi CV', 'nộp đơn', 'job description', 'requirements'
+)
+
+# Strong indicators as bits; _STRONG_HIT_SCORES[hits] is their combined score
+URL_PATTERN_HIT = 1 << 0   # +3
+URL_KEYWORD_HIT = 1 << 1   # +2
+TITLE_HIT = 1 << 2         # +2
+_STRONG_HIT_SCORES = tuple(
+    3 * (hits & URL_PATTERN_HIT != 0) + 2 * (hits & URL_KEYWORD_HIT != 0) + 2 * (hits & TITLE_HIT != 0)
+    for hits in range(8)
+)
 
 def is_career_page_strict(url: str, title: str, content: str) -> bool:
     """
@@ -55,144 +78,142 @@ def is_career_page_strict(url: str, title: str, content: str) -> bool:
     """
     url_lower = url.lower()
     title_lower = title.lower()
-    content_lower = content.lower()
     
-    # Check URL patterns
-    url_score = 0
-    for pattern in CAREER_EXACT_PATTERNS:
-        if pattern in url_lower:
-            url_score += 3
-            break
+    # URL patterns, career keywords in URL, career indicators in title
+    hits = 0
+    if any(pattern in url_lower for pattern in CAREER_EXACT_PATTERNS):
+        hits |= URL_PATTERN_HIT
+    if any(keyword in url_lower for keyword in HIGH_PRIORITY_CAREER_KEYWORDS):
+        hits |= URL_KEYWORD_HIT
+    if any(indicator in title_lower for indicator in CAREER_TITLE_INDICATORS):
+        hits |= TITLE_HIT
     
-    # Check for career keywords in URL
-    for keyword in HIGH_PRIORITY_CAREER_KEYWORDS:
-        if keyword in url_lower:
-            url_score += 2
-            break
-    
-    # Check title for career indicators
-    title_score = 0
-    career_title_indicators = [
-        'career', 'job', 'hiring', 'recruitment', 'tuyển dụng', 'việc làm',
-        'opportunity', 'position', 'vacancy', 'join us', 'work with us'
-    ]
-    
-    for indicator in career_title_indicators:
-        if indicator in title_lower:
-            title_score += 2
-            break
+    # Must have at least one strong indicator: decide before touching the page content
+    if not hits:
+        return False
     
     # Check content for career indicators
-    content_score = 0
-    career_content_indicators = [
-        'apply now', 'send resume', 'submit application', 'đăng ký',
-        'ứng tuyển', 'gửi CV', 'nộp đơn', 'job description', 'requirements'
-    ]
-    
-    for indicator in career_content_indicators:
-        if indicator in content_lower:
-            content_score += 1
+    content_lower = content.lower()
+    content_score = sum(indicator in content_lower for indicator in CAREER_CONTENT_INDICATORS)
     
     # Penalty for non-career indicators
-    penalty = 0
-    for keyword in NON_CAREER_KEYWORDS:
-        if keyword in url_lower:
-            penalty -= 2
+    penalty = -2 * sum(keyword in url_lower for keyword in NON_CAREER_KEYWORDS)
     
-    total_score = url_score + title_score + content_score + penalty
-    
-    # Must have positive score and at least one strong indicator
-    return total_score > 0 and (url_score >= 2 or title_score >= 2)
+    # Must have positive score
+    return _STRONG_HIT_SCORES[hits] + content_score + penalty > 0
+
+# Compiled once. Stays on stdlib re: RE2's \b is ASCII-only and would split
+# addresses glued to Vietnamese letters differently. The local part can never
+# contain '@', so it is matched possessively (++): no backtracking into it when
+# the '@' or the domain fails
+EMAIL_RX = re.compile(r'\b[A-Za-z0-9._%+-]++@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b')
+_IMAGE_EXT_RX = re.compile(r'\.(?:png|jpe?g|gif|svg|ico)', re.IGNORECASE | re.ASCII)
 
 def extract_valid_email(email_str: str) -> Optional[str]:
     """Extract and validate email address"""
-    email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
+    # No '@', no email: skip both regex scans
+    if '@' not in email_str:
+        return None
     
     # Skip image files and invalid emails
-    if any(ext in email_str.lower() for ext in ['.png', '.jpg', '.jpeg', '.gif', '.svg', '.ico']):
+    if _IMAGE_EXT_RX.search(email_str):
         return None
     
-    match = re.search(email_pattern, email_str)
+    match = EMAIL_RX.search(email_str)
     if match:
         email = match.group(0).lower()
-        # Additional validation
-        if len(email) > 5 and '@' in email and '.' in email.split('@')[1]:
+        # Additional validation ('@' and a dotted domain are guaranteed by EMAIL_RX)
+        if len(email) > 5:
             return email
     return None
 
+# Vietnamese phone patterns - more strict (alternatives tried in priority order)
+VN_PHONE_RX = re.compile(
+    r'\+84\s?\d{1,2}\s?\d{3}\s?\d{3}\s?\d{3}'  # +84 1900 638399
+    r'|0\d{1,2}\s?\d{3}\s?\d{3}\s?\d{3}'       # 01900 638399
+    r'|\d{10,11}'                                # 1900638399
+)
+
+# Valid Vietnamese prefixes once non-digits ('+') have been stripped
+_VALID_PREFIXES = ('0', '84')
+
 def extract_valid_phone(phone_str: str) -> Optional[str]:
     """Extract and validate phone number"""
     # Remove common prefixes and clean up
     phone = re.sub(r'[^\d+\-\s\(\)]', '', phone_str)
     
-    # Vietnamese phone patterns - more strict
-    vn_patterns = [
-        r'\+84\s?\d{1,2}\s?\d{3}\s?\d{3}\s?\d{3}',  # +84 1900 638399
-        r'0\d{1,2}\s?\d{3}\s?\d{3}\s?\d{3}',         # 01900 638399
-        r'\d{10,11}',                                 # 1900638399
-    ]
-    
-    for pattern in vn_patterns:
-        match = re.search(pattern, phone)
-        if match:
-            phone_number = match.group(0)
-            
-            # Additional validation: must be reasonable length and format
-            clean_number = re.sub(r'[^\d]', '', phone_number)
-            
-            # Must be 10-11 digits for Vietnamese numbers
-            if len(clean_number) >= 10 and len(clean_number) <= 11:
-                # Must start with valid Vietnamese prefixes
-                valid_prefixes = ['0', '84', '+84']
-                if any(clean_number.startswith(prefix) for prefix in valid_prefixes):
-                    return phone_number
+    for match in VN_PHONE_RX.finditer(phone):
+        phone_number = match.group(0)
+        
+        # Additional validation: must be reasonable length and format
+        clean_number = re.sub(r'[^\d]', '', phone_number)
+        
+        # Must be 10-11 digits and start with a valid Vietnamese prefix
+        if 10 <= len(clean_number) <= 11 and clean_number.startswith(_VALID_PREFIXES):
+            return phone_number
     
     return None
 
 
 
+# hrefs returned as-is: non-HTTP schemes and absolute URLs
+_PASSTHROUGH_PREFIXES = ('mailto:', 'tel:', 'javascript:', 'http://', 'https://')
+
 def extract_embedded_url(href_content: str, base_domain_netloc: Optional[str] = None) -> str:
     """Extract URL from href content with proper handling"""
-    try:
-        # Remove common prefixes/suffixes
-        href_content = href_content.strip()
-        
-        # Handle mailto: links
-        if href_content.startswith('mailto:'):
-            return href_content
-        
-        # Handle tel: links
-        if href_content.startswith('tel:'):
-            return href_content
-        
-        # Handle javascript: links
-        if href_content.startswith('javascript:'):
-            return href_content
-        
-        # Handle relative URLs
-        if href_content.startswith('/'):
-            if base_domain_netloc:
-                return f"https://{base_domain_netloc}{href_content}"
-            return href_content
-        
-        # Handle protocol-relative URLs
-        if href_content.startswith('//'):
-            return f"https:{href_content}"
-        
-        # Handle absolute URLs
-        if href_content.startswith(('http://', 'https://')):
-            return href_content
-        
-        # Handle relative URLs without leading slash
-        if base_domain_netloc and not href_content.startswith(('http://', 'https://', 'mailto:', 'tel:', 'javascript:')):
-            return f"https://{base_domain_netloc}/{href_content}"
-        
-        return href_content
-        
-    except Exception:
+    # Remove common prefixes/suffixes
+    href_content = href_content.strip()
+    
+    # Handle mailto:, tel:, javascript: and absolute URLs; nothing to resolve against without a base
+    if href_content.startswith(_PASSTHROUGH_PREFIXES) or not base_domain_netloc:
         return href_content
+    
+    # Handle relative URLs (protocol-relative '//' hrefs also land here)
+    if href_content.startswith('/'):
+        return f"https://{base_domain_netloc}{href_content}"
+    
+    # Handle relative URLs without leading slash
+    return f"https://{base_domain_netloc}/{href_content}"
+
+@lru_cache(maxsize=4096)
+def _normalize_url_parsed(url_str: str, base_domain: str) -> str:
+    """Normalize a stripped, non-empty URL against an already-parsed base netloc"""
+    # Absolute URLs (the common case) have nothing to resolve, only to unquote
+    if url_str.startswith(('http://', 'https://')):
+        return unquote(url_str)
+    
+    # Extract embedded URL
+    extracted_url = extract_embedded_url(url_str, base_domain)
+    
+    # Handle relative URLs
+    if not extracted_url.startswith(('http://', 'https://', 'mailto:', 'tel:', 'javascript:')):
+        if extracted_url.startswith('/'):
+            extracted_url = f"https://{base_domain}{extracted_url}"
+        else:
+            extracted_url = f"https://{base_domain}/{extracted_url}"
+    
+    # Clean up the URL (unquote straight away: quoting spaces first only to decode them again was a no-op)
+    extracted_url = unquote(extracted_url)
+    
+    return extracted_url
+
+@lru_cache(maxsize=4096)
+def url_netloc(url: str) -> str:
+    """Lowercased netloc of url; crawl output repeats URLs, so each is split once"""
+    return urlsplit(url).netloc.lower()
 
-def normalize_url(url_str: str, base_url: str) -> str:
+@lru_cache(maxsize=4096)
+def is_social_domain(netloc: str) -> bool:
+    """True if netloc is one of SOCIAL_DOMAINS or a subdomain of one"""
+    # bỏ user@ và :port, rồi thử lần lượt từng hậu tố theo nhãn: m.facebook.com → facebook.com → com
+    host = netloc.rpartition('@')[2].partition(':')[0].rstrip('.')
+    while host:
+        if host in SOCIAL_DOMAINS:
+            return True
+        host = host.partition('.')[2]
+    return False
+
+def normalize_url(url_str: str, base_url: str, base_domain: Optional[str] = None) -> str:
     """Normalize URL with proper handling of various formats"""
     try:
         # Convert URL objects to string first
@@ -206,95 +227,111 @@ def normalize_url(url_str: str, base_url: str) -> str:
         if not url_str or url_str == '#':
             return base_url
         
-        # Parse base URL
-        base_parsed = urlparse(base_url)
-        base_domain = base_parsed.netloc
-        
-        # Extract embedded URL
-        extracted_url = extract_embedded_url(url_str, base_domain)
-        
-        # Handle relative URLs
-        if not extracted_url.startswith(('http://', 'https://', 'mailto:', 'tel:', 'javascript:')):
-            if extracted_url.startswith('/'):
-                extracted_url = f"https://{base_domain}{extracted_url}"
-            else:
-                extracted_url = f"https://{base_domain}/{extracted_url}"
-        
-        # Clean up the URL
-        extracted_url = extracted_url.replace(' ', '%20')
-        extracted_url = unquote(extracted_url)
+        # Parse base URL (callers looping over one page pass it pre-parsed)
+        if base_domain is None:
+            base_domain = urlsplit(base_url).netloc
         
-        return extracted_url
+        return _normalize_url_parsed(url_str, base_domain)
         
     except Exception:
         return base_url
 
-def process_extracted_crawl_results(
+def iter_extracted_contacts(
     raw_extracted_list: List[Dict[str, str]],
     base_url: str
-) -> Dict[str, List[str]]:
+) -> Iterator[Tuple[str, str]]:
     """
-    Process raw extracted data and classify into categories
+    Classify raw extracted data lazily, yielding each new ('email' | 'phone' |
+    'social_link', value) pair once, in crawl order
     """
+    return _iter_contact_pairs(
+        ((item.get('label', ''), item.get('value', '')) for item in raw_extracted_list),
+        base_url
+    )
+
+def _iter_contact_pairs(
+    pairs: Iterable[Tuple[str, str]],
+    base_url: str
+) -> Iterator[Tuple[str, str]]:
+    """iter_extracted_contacts over plain (label, value) tuples"""
     emails = set()
-    social_links = set()
     phones = set()
     
-    # Convert base_url to string if it's a URL object
-    base_url_str = str(base_url) if hasattr(base_url, 'netloc') else base_url
-    base_domain = urlparse(str(base_url_str)).netloc.lower()
+    # Convert and parse base_url once per batch (URL objects included)
+    base_url_str = to_text(base_url)
+    base_netloc = urlsplit(base_url_str).netloc
+    
+    # Bulk crawls repeat the same footer/nav values across pages; classify each once.
+    # Emails are validated case-insensitively, so case variants share one key;
+    # URLs are deduped again after normalization (many raw hrefs → one URL)
+    seen_items = set()
+    seen_urls = set()
     
-    for item in raw_extracted_list:
-        label = item.get('label', '').lower()
-        value = item.get('value', '').strip()
+    for label, value in pairs:
+        label = label.lower()
+        value = value.strip()
         
         if not value:
             continue
+        key = (label, value.lower() if label == 'email' else value)
+        if key in seen_items:
+            continue
+        seen_items.add(key)
         
         # Process emails
         if label == 'email':
             email = extract_valid_email(value)
-            if email:
+            if email and email not in emails:
+                email = sys.intern(email)
                 emails.add(email)
+                yield 'email', email
         
         # Process phone numbers
         elif label == 'phone':
             phone = extract_valid_phone(value)
-            if phone:
+            if phone and phone not in phones:
                 phones.add(phone)
+                yield 'phone', phone
         
         # Process URLs - only contact-related URLs
         elif label == 'url':
-            # Convert value to text first to handle URL objects
-            url_value = to_text(value)
-            normalized_url = normalize_url(url_value, base_url)
+            # value is already a stripped, non-empty str: go straight to the cached
+            # normalizer instead of re-converting base_url per item in normalize_url
+            normalized_url = base_url_str if value == '#' else _normalize_url_parsed(value, base_netloc)
+            if normalized_url in seen_urls:
+                continue
+            seen_urls.add(normalized_url)
             
             # Reject non-HTTP URLs (mailto, tel, javascript, etc.)
             if not normalized_url.startswith(('http://', 'https://')):
                 continue
             
             # Check if it's a social media link
-            url_domain = urlparse(normalized_url).netloc.lower()
-            if any(social_domain in url_domain for social_domain in SOCIAL_DOMAINS):
-                social_links.add(normalized_url)
+            # (seen_urls already guarantees each social link is yielded once)
+            if is_social_domain(url_netloc(normalized_url)):
+                yield 'social_link', sys.intern(normalized_url)
             
-            # Only add contact-related URLs (contact, about, etc.)
-            url_lower = normalized_url.lower()
-            contact_keywords = ['contact', 'about', 'team', 'company', 'lien-he', 'gioi-thieu']
-            
-            is_contact_related = False
-            for keyword in contact_keywords:
-                if keyword in url_lower:
-                    is_contact_related = True
-                    break
-            
-            # Don't add career pages to contact info
-            # Don't add general URLs that are not contact-related
+            # Don't add career pages or general (non-social) URLs to contact info
+
+def process_extracted_crawl_results(
+    raw_extracted_list: List[Dict[str, str]],
+    base_url: str
+) -> Dict[str, List[str]]:
+    """
+    Process raw extracted data and classify into categories
+    """
+    found = {'email': [], 'phone': [], 'social_link': []}
+    for category, value in iter_extracted_contacts(raw_extracted_list, base_url):
+        found[category].append(value)
+    
+    # values are already unique: sort the lists in place, no set/list copies
+    for values in found.values():
+        values.sort()
     
     return {
-        'emails': sorted(list(emails)),
-        'phones': sorted(list(phones)),
-        'social_links': sorted(list(social_links)),
+        'emails': found['email'],
+        'phones': found['phone'],
+        'social_links': found['social_link'],
         'website': base_url
     }
 
@@ -309,8 +346,9 @@ async def extract_contact_info_from_url(url: str) -> Dict[str, List[str]]:
         # Crawl the website to get raw data
         raw_data = await crawl_website(url)
         
-        # Process the extracted data
-        contact_info = process_extracted_crawl_results(raw_data, url)
+        # Process the extracted data off the event loop so other crawls keep running
+        loop = asyncio.get_running_loop()
+        contact_info = await loop.run_in_executor(None, process_extracted_crawl_results, raw_data, url)
         
         return contact_info
         
@@ -320,4 +358,4 @@ async def extract_contact_info_from_url(url: str) -> Dict[str, List[str]]:
             'emails': [],
             'social_links': [],
             'career_pages': []
-        } 
\ No newline at end of file
+        }
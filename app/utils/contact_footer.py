@@ -3,29 +3,23 @@ Footer contact extraction utilities
 """
 
 import re
+from html import unescape
 from bs4 import BeautifulSoup
 
-# khoảng trắng unicode hay gặp trong footer
-WS = r"\s\u00A0\u2000-\u200B"
-SEP_CLASS = rf"[{WS}\.\-\(\)]"
-SEP = rf"{SEP_CLASS}*"
+# khoảng trắng unicode, normalize_text và clean_phone dùng chung với text.py
+from .text import VN_PHONE_RX, normalize_text, clean_phone
 
-# VN: 0xxxx… hoặc +84… cho phép chèn dấu / khoảng trắng unicode giữa các block số
-VN_PHONE_RX = re.compile(rf"(?<!\d)(?:\+?84|0)(?:{SEP}\d){{8,10}}(?!\d)")
 EMAIL_RX = re.compile(r"[A-Z0-9._%+-]+@[A-Z0-9.-]+\.[A-Z]{2,}", re.I)
 
-def normalize_text(s: str) -> str:
-    """Normalize text, gom mọi loại khoảng trắng về 1 space"""
-    return re.sub(rf"[{WS}]+", " ", s or "").strip()
+# fast path: quét thẳng HTML của footer, không dựng DOM
+TEL_HREF_RX = re.compile(r"""href\s*=\s*["']tel:([^"']*)""", re.I)
+# comment/script/style: html.parser không coi nội dung bên trong là element/text
+NON_CONTENT_RX = re.compile(r"<!--.*?-->|<(script|style)\b.*?</\1\s*>", re.I | re.S)
+TAG_RX = re.compile(r"<[^>]+>")
+FOOTER_TAG_RX = re.compile(r"<(/?)footer\b[^>]*>", re.I)
+# node khác mà selector của pick_footer_node cũng bắt (role=contentinfo, #footer, .footer, ...)
+FOOTER_LIKE_ATTR_RX = re.compile(r"""\b(?:role\s*=\s*["']?contentinfo|(?:id|class)\s*=\s*["']?[^"'>]*footer)""", re.I)
 
-def clean_phone(raw: str) -> str | None:
-    """Clean phone number, giữ + và số"""
-    s = re.sub(r"[^\d+]", "", raw or "")
-    if s.startswith("+84"):
-        s = "0" + s[3:]
-    s = re.sub(r"\D", "", s)
-    # VN: di động 10 số; cố định 10–11 số (tùy mã vùng)
-    return s if 10 <= len(s) <= 11 else None
 
 def pick_footer_node(soup: BeautifulSoup):
     """Tìm footer node linh hoạt"""
@@ -50,10 +44,12 @@ def extract_footer_contacts_from_html(html: str) -> dict:
     footer = pick_footer_node(soup)
 
     # tel: trước
+    seen_phones: set[str] = set()
     tel_nums: list[str] = []
     for a in footer.select('a[href^="tel:"]'):
         n = clean_phone((a.get("href") or "")[4:])
-        if n and n not in tel_nums:
+        if n and n not in seen_phones:
+            seen_phones.add(n)
             tel_nums.append(n)
 
     # text node
@@ -61,17 +57,20 @@ def extract_footer_contacts_from_html(html: str) -> dict:
     text_nums: list[str] = []
     for m in VN_PHONE_RX.finditer(text):
         n = clean_phone(m.group(0))
-        if n and n not in text_nums:
+        if n and n not in seen_phones:
+            seen_phones.add(n)
             text_nums.append(n)
 
     # emails trong footer
+    seen_emails: set[str] = set()
     emails = []
     for m in EMAIL_RX.finditer(text):
         e = m.group(0).lower()
-        if e not in emails:
+        if e not in seen_emails:
+            seen_emails.add(e)
             emails.append(e)
 
-    phones = list(dict.fromkeys(tel_nums + text_nums))  # dedupe + giữ thứ tự
+    phones = tel_nums + text_nums  # đã dedupe qua seen_phones, giữ thứ tự tel trước
     return {
         "phones": phones,
         "emails": emails,
@@ -81,3 +80,67 @@ def extract_footer_contacts_from_html(html: str) -> dict:
             "text_first200": text[:200],
         },
     }
+
+def _footer_html_slice(html: str) -> str | None:
+    """
+    HTML của <footer> đầu tiên (tới </footer> khớp), hoặc None khi pick_footer_node
+    có thể chọn node khác: node footer-like đứng trước, footer rỗng/không đóng
+    """
+    match = FOOTER_TAG_RX.search(html)
+    if match is None or match.group(1) or match.group(0).endswith("/>"):
+        return None
+    if FOOTER_LIKE_ATTR_RX.search(html, 0, match.start()):
+        return None
+    depth = 0
+    for tag in FOOTER_TAG_RX.finditer(html, match.start()):
+        depth += -1 if tag.group(1) else 1
+        if depth == 0:
+            return html[match.start():tag.end()]
+    return None
+
+def extract_footer_contacts_fast(html: str) -> dict:
+    """
+    Extract contact info từ footer bằng regex trên chuỗi HTML; cùng shape kết quả với
+    extract_footer_contacts_from_html. Chỉ dựng DOM khi _footer_html_slice không chắc
+    chọn đúng node như pick_footer_node (khi đó tốn thêm một lượt regex trước DOM)
+    """
+    html = html or ""
+    tail = _footer_html_slice(NON_CONTENT_RX.sub(" ", html))
+    if tail is None:
+        return extract_footer_contacts_from_html(html)
+
+    # tel: trước
+    seen_phones: set[str] = set()
+    tel_nums: list[str] = []
+    for m in TEL_HREF_RX.finditer(tail):
+        n = clean_phone(unescape(m.group(1)))
+        if n and n not in seen_phones:
+            seen_phones.add(n)
+            tel_nums.append(n)
+
+    # text node: bỏ tag (script/style đã bỏ), giữ khoảng trắng giữa các node như get_text(" ")
+    text = normalize_text(unescape(TAG_RX.sub(" ", tail)))
+    text_nums: list[str] = []
+    for m in VN_PHONE_RX.finditer(text):
+        n = clean_phone(m.group(0))
+        if n and n not in seen_phones:
+            seen_phones.add(n)
+            text_nums.append(n)
+
+    seen_emails: set[str] = set()
+    emails = []
+    for m in EMAIL_RX.finditer(text):
+        e = m.group(0).lower()
+        if e not in seen_emails:
+            seen_emails.add(e)
+            emails.append(e)
+
+    return {
+        "phones": tel_nums + text_nums,
+        "emails": emails,
+        "debug": {
+            "footer_tag": "footer",
+            "tel_raw": tel_nums,
+            "text_first200": text[:200],
+        },
+    }
@@ -3,8 +3,33 @@
 Constants for job field analysis and validation
 """
 
+import operator
+import re
+import sys
+from array import array
+from dataclasses import dataclass
+from types import SimpleNamespace
+from typing import Dict, Optional, Set, Tuple
+
+# Optional Aho-Corasick automaton for one-pass keyword tagging
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+def intern_keyword_groups(groups: Dict[str, list]) -> Dict[str, list]:
+    """Intern every keyword (and mapping key/value) in a {label: [...] or {...}} table"""
+    interned = {}
+    for label, keywords in groups.items():
+        if isinstance(keywords, dict):
+            interned[label] = {sys.intern(k): sys.intern(v) for k, v in keywords.items()}
+        else:
+            interned[label] = [sys.intern(k) for k in keywords]
+    return interned
+
 # Job Types by Category
-JOB_TYPES = {
+JOB_TYPES = intern_keyword_groups({
     # Time-based
     "FULL_TIME": ["full-time", "full time", "permanent", "regular"],
     "PART_TIME": ["part-time", "part time", "casual"],
@@ -27,10 +52,10 @@ JOB_TYPES = {
     "PRINCIPAL": ["principal", "architect", "specialist", "consultant"],
     "MANAGER": ["manager", "management", "supervisor", "director"],
     "EXECUTIVE": ["executive", "vp", "c-level", "chief", "head"]
-}
+})
 
 # Job Categories/Departments
-JOB_CATEGORIES = {
+JOB_CATEGORIES = intern_keyword_groups({
     "ENGINEERING": [
         "software engineer", "developer", "programmer", "coder",
         "frontend developer", "backend developer", "full-stack developer",
@@ -69,7 +94,23 @@ JOB_CATEGORIES = {
         "operations manager", "operations analyst", "process improvement",
         "supply chain", "logistics", "operations specialist"
     ]
-}
+})
+
+def flatten_keyword_groups(groups: Dict[str, list]) -> Tuple[Tuple[str, ...], array, Tuple[str, ...]]:
+    """
+    Flatten {label: [keywords]} into parallel arrays (keywords, label index, labels)
+    Keyword order follows the dict order, so first-match scans keep their priority
+    """
+    labels = tuple(groups)
+    keywords = []
+    label_idx = array("H")
+    for idx, label in enumerate(labels):
+        for keyword in groups[label]:
+            keywords.append(keyword)
+            label_idx.append(idx)
+    return tuple(keywords), label_idx, labels
+
+JOB_CATEGORY_KEYWORDS, JOB_CATEGORY_LABEL_IDX, JOB_CATEGORY_LABELS = flatten_keyword_groups(JOB_CATEGORIES)
 
 # Job Level Patterns
 JOB_LEVEL_PATTERNS = {
@@ -96,7 +137,7 @@ JOB_LEVEL_PATTERNS = {
 }
 
 # Technology Keywords
-TECHNOLOGY_KEYWORDS = {
+TECHNOLOGY_KEYWORDS = intern_keyword_groups({
     "PROGRAMMING_LANGUAGES": [
         "javascript", "js", "typescript", "ts", "python", "java", "c#", "c++",
         "php", "ruby", "go", "rust", "swift", "kotlin", "scala", "r", "matlab"
@@ -125,7 +166,7 @@ TECHNOLOGY_KEYWORDS = {
         "react native", "flutter", "xamarin", "ionic", "cordova",
         "native android", "native ios", "swift", "kotlin"
     ]
-}
+})
 
 # Job Description Patterns
 JOB_DESCRIPTION_PATTERNS = {
@@ -162,7 +203,7 @@ JOB_DESCRIPTION_PATTERNS = {
 }
 
 # Location Patterns
-LOCATION_PATTERNS = {
+LOCATION_PATTERNS = intern_keyword_groups({
     "VIETNAM_CITIES": [
         "ho chi minh city", "hcm", "hcmc", "saigon", "hanoi", "ha noi",
         "da nang", "danang", "can tho", "cantho", "hai phong", "haiphong",
@@ -180,7 +221,7 @@ LOCATION_PATTERNS = {
         "hybrid", "flexible", "mixed", "combination", "part remote",
         "part onsite", "some remote", "some onsite"
     ]
-}
+})
 
 # Salary Patterns
 SALARY_PATTERNS = {
@@ -232,7 +273,7 @@ JOB_VALIDATION_RULES = {
     },
     "JOB_TYPE": {
         "required": True,
-        "valid_values": [item for sublist in JOB_TYPES.values() for item in sublist]
+        "valid_values": frozenset(item for sublist in JOB_TYPES.values() for item in sublist)
     }
 }
 
@@ -248,10 +289,18 @@ QUALITY_SCORING_WEIGHTS = {
     "requirements": 0.05
 }
 
+# Weights of the per-job quality metrics combined into the overall score
+QUALITY_METRICS = ("completeness", "relevance", "freshness")
+QUALITY_METRIC_WEIGHTS = (0.4, 0.4, 0.2)
+
+def weighted_score(values, weights) -> float:
+    """Dot product of aligned value/weight sequences"""
+    return sum(map(operator.mul, values, weights))
+
 # Completeness Scoring
 COMPLETENESS_SCORING = {
-    "REQUIRED_FIELDS": ["title", "description", "location", "company", "job_type"],
-    "OPTIONAL_FIELDS": ["salary", "posted_date", "requirements", "benefits", "tags"],
+    "REQUIRED_FIELDS": frozenset(["title", "description", "location", "company", "job_type"]),
+    "OPTIONAL_FIELDS": frozenset(["salary", "posted_date", "requirements", "benefits", "tags"]),
     "WEIGHTS": {
         "required": 0.8,  # 80% weight for required fields
         "optional": 0.2   # 20% weight for optional fields
@@ -259,7 +308,7 @@ COMPLETENESS_SCORING = {
 }
 
 # Relevance Scoring Keywords
-RELEVANCE_KEYWORDS = {
+RELEVANCE_KEYWORDS = intern_keyword_groups({
     "HIGH_PRIORITY": [
         "software engineer", "developer", "programmer", "frontend", "backend",
         "full-stack", "devops", "data engineer", "machine learning"
@@ -271,7 +320,7 @@ RELEVANCE_KEYWORDS = {
     "LOW_PRIORITY": [
         "intern", "trainee", "junior", "entry level", "fresh graduate"
     ]
-}
+})
 
 # Freshness Scoring
 FRESHNESS_SCORING = {
@@ -283,7 +332,7 @@ FRESHNESS_SCORING = {
 }
 
 # Normalization Rules
-NORMALIZATION_RULES = {
+NORMALIZATION_RULES = intern_keyword_groups({
     "JOB_TYPE": {
         "full time": "full-time",
         "part time": "part-time",
@@ -306,21 +355,223 @@ NORMALIZATION_RULES = {
         "entry-level": "junior",
         "entry level": "junior"
     }
+})
+
+@dataclass(frozen=True, slots=True)
+class FieldRule:
+    """Immutable, attribute-access view of one JOB_VALIDATION_RULES entry"""
+    key: str  # job_data key the rule applies to
+    required: bool
+    min_length: Optional[int] = None
+    max_length: Optional[int] = None
+    patterns: tuple = ()
+    valid_values: frozenset = frozenset()
+
+# Attribute view of JOB_VALIDATION_RULES (JOB_VALIDATION.TITLE.min_length); the dict stays for back-compat
+JOB_VALIDATION = SimpleNamespace(**{
+    field: FieldRule(
+        key=field.lower(),
+        required=rules["required"],
+        min_length=rules.get("min_length"),
+        max_length=rules.get("max_length"),
+        patterns=tuple(re.compile(pattern) for pattern in rules.get("patterns", ())),
+        valid_values=rules.get("valid_values", frozenset()),
+    )
+    for field, rules in JOB_VALIDATION_RULES.items()
+})
+
+# One alternation per category: a single search answers "does any pattern match?"
+JOB_LEVEL_UNION = {
+    level: re.compile("|".join(f"(?:{pattern})" for pattern in patterns), re.IGNORECASE)
+    for level, patterns in JOB_LEVEL_PATTERNS.items()
+}
+
+JOB_DESCRIPTION_UNION = {
+    group: re.compile("|".join(f"(?:{pattern})" for pattern in patterns), re.IGNORECASE)
+    for group, patterns in JOB_DESCRIPTION_PATTERNS.items()
+    if group != "ACTION_VERBS"  # plain substrings, not regexes
+}
+
+# Keyword dictionaries scanned by plain substring containment
+KEYWORD_GROUPS = {
+    "JOB_TYPES": JOB_TYPES,
+    "JOB_CATEGORIES": JOB_CATEGORIES,
+    "TECHNOLOGY_KEYWORDS": TECHNOLOGY_KEYWORDS,
+    "LOCATION_PATTERNS": LOCATION_PATTERNS,
+}
+
+def build_automata() -> Dict[str, "ahocorasick.Automaton"]:
+    """Build one Aho-Corasick automaton per keyword group (payload: the keyword)"""
+    automata = {}
+    for group_name, categories in KEYWORD_GROUPS.items():
+        automaton = ahocorasick.Automaton()
+        for keywords in categories.values():
+            for keyword in keywords:
+                automaton.add_word(keyword, keyword)
+        automaton.make_automaton()
+        automata[group_name] = automaton
+    return automata
+
+def classify_text(text: str) -> Dict[str, Set[str]]:
+    """
+    Return every keyword of each group contained in text (case-insensitive)
+    Engines by preference: pyahocorasick (one pass per group), plain substring scans
+    """
+    text_lower = (text or "").lower()
+    keyword_automata = _lazy("_KEYWORD_AUTOMATA")
+    if keyword_automata is not None:
+        return {
+            group_name: {keyword for _, keyword in automaton.iter(text_lower)}
+            for group_name, automaton in keyword_automata.items()
+        }
+    return {
+        group_name: {
+            keyword
+            for keywords in categories.values()
+            for keyword in keywords
+            if keyword in text_lower
+        }
+        for group_name, categories in KEYWORD_GROUPS.items()
+    }
+
+# Salary unit payloads: high bits = kind, low bits = index of the currency/period label
+SALARY_KIND_CURRENCY = 1
+SALARY_KIND_PERIOD = 2
+SALARY_CURRENCY_LABELS = tuple(SALARY_PATTERNS["CURRENCIES"])
+SALARY_PERIOD_LABELS = tuple(SALARY_PATTERNS["PERIODS"])
+
+def build_salary_automaton() -> "ahocorasick.Automaton":
+    """One automaton over every currency symbol and period indicator"""
+    automaton = ahocorasick.Automaton()
+    for kind, labels, groups in (
+        (SALARY_KIND_CURRENCY, SALARY_CURRENCY_LABELS, SALARY_PATTERNS["CURRENCIES"]),
+        (SALARY_KIND_PERIOD, SALARY_PERIOD_LABELS, SALARY_PATTERNS["PERIODS"]),
+    ):
+        for idx, label in enumerate(labels):
+            for keyword in groups[label]:
+                # keep the lowest label index if a keyword appears under several labels
+                if keyword not in automaton:
+                    automaton.add_word(keyword, (kind << 16) | idx)
+    automaton.make_automaton()
+    return automaton
+
+def detect_salary_units(text: str) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Return (currency, period) found in text; when several match, the first
+    label in SALARY_PATTERNS order wins
+    """
+    text_lower = (text or "").lower()
+    salary_automaton = _lazy("_SALARY_AUTOMATON")
+    if salary_automaton is not None:
+        best = {SALARY_KIND_CURRENCY: None, SALARY_KIND_PERIOD: None}
+        for _, payload in salary_automaton.iter(text_lower):
+            kind, idx = payload >> 16, payload & 0xFFFF
+            if best[kind] is None or idx < best[kind]:
+                best[kind] = idx
+        currency_idx, period_idx = best[SALARY_KIND_CURRENCY], best[SALARY_KIND_PERIOD]
+        return (
+            SALARY_CURRENCY_LABELS[currency_idx] if currency_idx is not None else None,
+            SALARY_PERIOD_LABELS[period_idx] if period_idx is not None else None,
+        )
+    currency = next(
+        (label for label, symbols in SALARY_PATTERNS["CURRENCIES"].items()
+         if any(symbol in text_lower for symbol in symbols)),
+        None,
+    )
+    period = next(
+        (label for label, indicators in SALARY_PATTERNS["PERIODS"].items()
+         if any(indicator in text_lower for indicator in indicators)),
+        None,
+    )
+    return currency, period
+
+# All range patterns in one alternation; group n+1 captures RANGE_PATTERNS[n]
+SALARY_RANGE_SCANNER = re.compile(
+    "|".join(f"({pattern})" for pattern in SALARY_PATTERNS["RANGE_PATTERNS"])
+)
+SALARY_AMOUNT_RE = re.compile(r"[\d,]+")
+
+def parse_salary_range(text: str) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+    """
+    Return (range, min_amount, max_amount) from one scan of text; like trying
+    RANGE_PATTERNS in order, the earliest pattern that matches wins
+    """
+    best_match, best_idx = None, len(SALARY_PATTERNS["RANGE_PATTERNS"])
+    for match in SALARY_RANGE_SCANNER.finditer(text or ""):
+        idx = next((i for i in range(best_idx) if match.group(i + 1) is not None), best_idx)
+        if idx < best_idx:
+            best_match, best_idx = match.group(), idx
+            if idx == 0:
+                break
+    if best_match is None:
+        return None, None, None
+    numbers = SALARY_AMOUNT_RE.findall(best_match)
+    if len(numbers) >= 2:
+        return best_match, numbers[0].replace(",", ""), numbers[1].replace(",", "")
+    return best_match, None, None
+
+# One longest-match-first alternation per rule group: a single left-to-right pass
+# replaces every alias, and a replacement is never re-matched by a later rule
+NORMALIZATION_REPLACERS = {
+    group: re.compile("|".join(re.escape(alias) for alias in sorted(rules, key=len, reverse=True)))
+    for group, rules in NORMALIZATION_RULES.items()
+}
+
+def apply_normalization(text: str, group: str) -> str:
+    """Replace every NORMALIZATION_RULES[group] alias in text with its canonical value"""
+    rules = NORMALIZATION_RULES[group]
+    return NORMALIZATION_REPLACERS[group].sub(lambda m: rules[m.group(0)], text)
+
+# Matchers that are costly to build are materialized on first use, not at import
+_LAZY_BUILDERS = {
+    "_KEYWORD_AUTOMATA": lambda: build_automata() if AHOCORASICK_AVAILABLE else None,
+    "_SALARY_AUTOMATON": lambda: build_salary_automaton() if AHOCORASICK_AVAILABLE else None,
 }
 
+def __getattr__(name: str):
+    builder = _LAZY_BUILDERS.get(name)
+    if builder is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = globals()[name] = builder()  # later lookups hit the module dict directly
+    return value
+
+def _lazy(name: str):
+    """Module-internal access to a lazily built matcher"""
+    try:
+        return globals()[name]
+    except KeyError:
+        return __getattr__(name)
+
 # Export all constants
 __all__ = [
     "JOB_TYPES",
     "JOB_CATEGORIES", 
+    "JOB_CATEGORY_KEYWORDS",
+    "JOB_CATEGORY_LABEL_IDX",
+    "JOB_CATEGORY_LABELS",
     "JOB_LEVEL_PATTERNS",
     "TECHNOLOGY_KEYWORDS",
     "JOB_DESCRIPTION_PATTERNS",
     "LOCATION_PATTERNS",
     "SALARY_PATTERNS",
     "JOB_VALIDATION_RULES",
+    "FieldRule",
+    "JOB_VALIDATION",
     "QUALITY_SCORING_WEIGHTS",
+    "QUALITY_METRICS",
+    "QUALITY_METRIC_WEIGHTS",
+    "weighted_score",
     "COMPLETENESS_SCORING",
     "RELEVANCE_KEYWORDS",
     "FRESHNESS_SCORING",
-    "NORMALIZATION_RULES"
+    "NORMALIZATION_RULES",
+    "JOB_LEVEL_UNION",
+    "JOB_DESCRIPTION_UNION",
+    "KEYWORD_GROUPS",
+    "classify_text",
+    "detect_salary_units",
+    "NORMALIZATION_REPLACERS",
+    "apply_normalization",
+    "SALARY_RANGE_SCANNER",
+    "parse_salary_range"
 ] 
\ No newline at end of file
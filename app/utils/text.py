@@ -3,7 +3,8 @@
 Text normalization utilities to prevent URL decode errors
 """
 
-from typing import Any
+from typing import Any, Callable, Iterable
+from functools import lru_cache, partial
 import re
 try:
     from yarl import URL
@@ -11,10 +12,25 @@ except ImportError:
     class URL:  # fallback type
         pass
 
-from urllib.parse import ParseResult
+from urllib.parse import ParseResult, urljoin, urlsplit
+
+def _decode_utf8(v) -> str:
+    return v.decode("utf-8", errors="ignore")
+
+# exact-type fast path; subclasses fall through to the isinstance chain below
+_TO_TEXT_DISPATCH = {
+    str: str.__str__,
+    bytes: _decode_utf8,
+    bytearray: _decode_utf8,
+    URL: str,
+    ParseResult: ParseResult.geturl,
+}
 
 def to_text(v: Any) -> str:
     """Convert any value to text, handling URL objects properly"""
+    fn = _TO_TEXT_DISPATCH.get(type(v))
+    if fn is not None:
+        return fn(v)
     if isinstance(v, (bytes, bytearray)):
         return v.decode("utf-8", errors="ignore")
     if isinstance(v, URL):
@@ -23,13 +39,45 @@ def to_text(v: Any) -> str:
         return v.geturl()
     return str(v)
 
-def normalize_url(u: Any) -> str:
-    """Normalize URL by removing fragments and converting to string"""
-    u = to_text(u)  # ✅ ép về str
+@lru_cache(maxsize=4096)
+def _normalize_url_str(u: str) -> str:
     if "#" in u:
         u = u.split("#", 1)[0]  # bỏ fragment như #vitex_contact
     return u.strip()
 
+def normalize_url(u: Any) -> str:
+    """Normalize URL by removing fragments and converting to string"""
+    return _normalize_url_str(to_text(u))  # ✅ ép về str trước khi cache
+
+# Substrings urljoin would rewrite (dot/empty path segments, ;params, stripped
+# whitespace, empty ?/# delimiters) or reject ([ ] netloc): those hrefs take the slow path
+_JOIN_REWRITE_MARKERS = ('/.', '//', ';', '?#', '[', ']', ' ', '\t', '\n', '\r')
+
+def url_joiner(base_url: str) -> Callable[[str], str]:
+    """
+    urljoin(base_url, href) bound to one page for href loops. Root-relative and
+    absolute http(s) hrefs that urljoin would return unchanged skip its resolver
+    """
+    parts = urlsplit(base_url)
+    if parts.scheme not in ('http', 'https') or not parts.netloc:
+        return partial(urljoin, base_url)
+    origin = f"{parts.scheme}://{parts.netloc}"
+
+    def join(href: str) -> str:
+        if href.startswith('/'):
+            rest, prefix = href, origin
+        elif href.startswith('https://'):
+            rest, prefix = href[8:], ''
+        elif href.startswith('http://'):
+            rest, prefix = href[7:], ''
+        else:
+            return urljoin(base_url, href)
+        if (not rest or rest.endswith(('?', '#')) or (not prefix and rest[0] in '/?#')
+                or any(marker in rest for marker in _JOIN_REWRITE_MARKERS)):
+            return urljoin(base_url, href)
+        return prefix + href
+    return join
+
 def safe_decode(data: Any, encoding: str = "utf-8") -> str:
     """Safely decode data, handling both bytes and text"""
     if isinstance(data, (bytes, bytearray)):
@@ -41,15 +89,36 @@ WS_CLASS = r"\s\u00A0\u2000-\u200B"            # space + NBSP + zero-width range
 SEP_CLASS = rf"[{WS_CLASS}\.\-\(\)]"          # cho phép . - ( ) và các khoảng trắng unicode
 SEP = rf"{SEP_CLASS}*"                        # 0+ ký tự phân tách
 
+_WS_RE = re.compile(rf"[{WS_CLASS}]+")
+
+# VN: 0xxxx… hoặc +84… cho phép chèn dấu / khoảng trắng unicode giữa các block số
+VN_PHONE_RX = re.compile(rf"(?<!\d)(?:\+?84|0)(?:{SEP}\d){{8,10}}(?!\d)")
+
+# complement classes của "+ và số" / "số", compile một lần thay vì mỗi lần clean
+_NON_DIGIT_PLUS_RE = re.compile(r"[^\d+]")
+_NON_DIGIT_RE = re.compile(r"\D")
+
 def normalize_text(s: str) -> str:
     # gom mọi loại khoảng trắng về 1 space
-    return re.sub(rf"[{WS_CLASS}]+", " ", s).strip()
+    s = s or ""
+    if s.isascii():
+        # ASCII (đa số trang): str.split() gom đúng các khoảng trắng mà _WS_RE bắt, chạy ở C
+        return " ".join(s.split())
+    return _WS_RE.sub(" ", s).strip()
 
 def clean_phone(candidate: str) -> str | None:
     # giữ + và số
-    s = re.sub(r"[^\d+]", "", candidate)
+    s = _NON_DIGIT_PLUS_RE.sub("", candidate or "")
     if s.startswith("+84"):
         s = "0" + s[3:]
-    s = re.sub(r"\D", "", s)
+    s = _NON_DIGIT_RE.sub("", s)
     # VN: di động 10 số; cố định 10–11 số (tùy mã vùng)
     return s if 10 <= len(s) <= 11 else None
+
+def clean_phones(candidates: Iterable[str]) -> list[str]:
+    # clean cả lô, bỏ số không hợp lệ, dedupe và giữ thứ tự xuất hiện
+    return list(dict.fromkeys(n for n in map(clean_phone, candidates) if n))
+
+def find_phones(text: str) -> list[str]:
+    # normalize + quét VN_PHONE_RX + clean/dedupe trong một lần gọi
+    return clean_phones(m.group(0) for m in VN_PHONE_RX.finditer(normalize_text(text)))